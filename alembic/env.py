@@ -25,6 +25,7 @@ import app.authors.models
 import app.comments.models
 import app.media.models
 import app.content_types.models
+import app.taxonomy.models
 
 # Метадані всіх моделей
 target_metadata = Base.metadata
@@ -0,0 +1,30 @@
+"""keyset pagination indexes
+
+Revision ID: 3f9a1c2d7e01
+Revises: 
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9a1c2d7e01'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_articles_created_at_id', 'articles', ['created_at', 'id'])
+    op.create_index('ix_comments_article_id_id', 'comments', ['article_id', 'id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_comments_article_id_id', table_name='comments')
+    op.drop_index('ix_articles_created_at_id', table_name='articles')
@@ -0,0 +1,37 @@
+"""article full-text search index
+
+Revision ID: 8b2e4d6f1a02
+Revises: 3f9a1c2d7e01
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b2e4d6f1a02'
+down_revision: Union[str, None] = '3f9a1c2d7e01'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Індекс за виразом: PostgreSQL підтримує його сам при кожному INSERT/UPDATE, тригер не потрібен.
+    # Вираз має збігатися з app.articles.search.search_document().
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute(
+        "CREATE INDEX ix_articles_search ON articles USING GIN "
+        "(to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(content, '')))"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('ix_articles_search', table_name='articles')
@@ -0,0 +1,39 @@
+"""drop view_count sort indexes
+
+Revision ID: a3c7e9f1b20d
+Revises: f1b5c7d9e20c
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c7e9f1b20d'
+down_revision: Union[str, None] = 'f1b5c7d9e20c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# view_count змінюється пакетним UPDATE з app.articles.views; кожен індекс із цим стовпцем
+# додає запис в індекс на кожен оновлений рядок і виключає HOT-оновлення в PostgreSQL
+VIEW_COUNT_INDEXES = {
+    'ix_articles_view_count_id': ['view_count', 'id'],
+    'ix_articles_category_view_count_id': ['category_id', 'view_count', 'id'],
+    'ix_articles_author_view_count_id': ['author_id', 'view_count', 'id'],
+    'ix_articles_content_type_view_count_id': ['content_type_id', 'view_count', 'id'],
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name in VIEW_COUNT_INDEXES:
+        op.drop_index(name, table_name='articles')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, columns in VIEW_COUNT_INDEXES.items():
+        op.create_index(name, 'articles', columns)
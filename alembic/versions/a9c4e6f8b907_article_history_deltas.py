@@ -0,0 +1,133 @@
+"""article history deltas
+
+Revision ID: a9c4e6f8b907
+Revises: f3b8c0d2e806
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+import json
+import re
+import zlib
+from difflib import SequenceMatcher
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9c4e6f8b907'
+down_revision: Union[str, None] = 'f3b8c0d2e806'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+# Формат різниць заморожено тут на момент ревізії: міграція не імпортує app.articles.history
+# (і разом із ним налаштування застосунку), тож пізніші зміни в застосунку її не зачеплять.
+SNAPSHOT_INTERVAL = 20
+_TOKEN_RE = re.compile(r"\S+\s*|\s+")
+
+
+def _split_tokens(text: Optional[str]) -> List[str]:
+    return _TOKEN_RE.findall(text) if text else []
+
+
+def _make_delta(old: Optional[str], new: Optional[str]) -> bytes:
+    old_tokens, new_tokens = _split_tokens(old), _split_tokens(new)
+    ops: List[Union[List[int], str]] = []
+    for tag, i1, i2, j1, j2 in SequenceMatcher(None, old_tokens, new_tokens).get_opcodes():
+        if tag == "equal":
+            ops.append([i1, i2])
+        elif tag in ("replace", "insert"):
+            ops.append("".join(new_tokens[j1:j2]))
+    return zlib.compress(json.dumps(ops, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+def _apply_delta(old: Optional[str], delta: bytes) -> str:
+    tokens = _split_tokens(old)
+    return "".join(
+        "".join(tokens[op[0]:op[1]]) if isinstance(op, list) else op
+        for op in json.loads(zlib.decompress(delta))
+    )
+
+
+def _history_content(version_num: int, previous: Optional[str], current: Optional[str]) -> Dict[str, Any]:
+    if previous is not None and current is not None and (version_num - 1) % SNAPSHOT_INTERVAL:
+        delta = _make_delta(previous, current)
+        if len(delta) * 2 < len(current.encode("utf-8")):
+            return {"is_snapshot": False, "content": None, "delta": delta}
+    return {"is_snapshot": True, "content": current, "delta": None}
+
+history = sa.table(
+    'article_history',
+    sa.column('id', sa.Integer),
+    sa.column('article_id', sa.Integer),
+    sa.column('version_num', sa.Integer),
+    sa.column('content', sa.Text),
+    sa.column('is_snapshot', sa.Boolean),
+    sa.column('delta', sa.LargeBinary),
+)
+
+
+def _rewrite(convert) -> None:
+    """
+    Пройти історію кожної статті за порядком версій і записати поля, які повертає convert.
+    Рядки читаються сторінками по BATCH_SIZE (keyset за article_id, version_num), тож у пам'яті
+    ніколи немає всієї таблиці; стан попередньої версії переходить між сторінками.
+    """
+    bind = op.get_bind()
+    query = (
+        sa.select(history.c.id, history.c.article_id, history.c.version_num,
+                  history.c.content, history.c.is_snapshot, history.c.delta)
+        .order_by(history.c.article_id, history.c.version_num)
+        .limit(BATCH_SIZE)
+    )
+    stmt = (
+        history.update()
+        .where(history.c.id == sa.bindparam('b_id'))
+        .values(content=sa.bindparam('b_content'), is_snapshot=sa.bindparam('b_is_snapshot'),
+                delta=sa.bindparam('b_delta'))
+    )
+    article_id, version_num, previous = None, None, None
+    while True:
+        page = query
+        if article_id is not None:
+            page = query.where(sa.or_(
+                history.c.article_id > article_id,
+                sa.and_(history.c.article_id == article_id, history.c.version_num > version_num),
+            ))
+        rows = bind.execute(page).all()
+        if not rows:
+            return
+        batch = []
+        for row in rows:
+            if row.article_id != article_id:
+                previous = None
+            article_id, version_num = row.article_id, row.version_num
+            values, previous = convert(row, previous)
+            batch.append({'b_id': row.id, **{f'b_{key}': value for key, value in values.items()}})
+        bind.execute(stmt, batch)
+
+
+def _compress(row, previous):
+    return _history_content(row.version_num, previous, row.content), row.content
+
+
+def _expand(row, previous):
+    content = row.content if row.is_snapshot else _apply_delta(previous, row.delta)
+    return {'content': content, 'is_snapshot': True, 'delta': None}, content
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('article_history', sa.Column('is_snapshot', sa.Boolean(), server_default=sa.true(), nullable=False))
+    op.add_column('article_history', sa.Column('delta', sa.LargeBinary(), nullable=True))
+    _rewrite(_compress)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _rewrite(_expand)
+    op.drop_column('article_history', 'delta')
+    op.drop_column('article_history', 'is_snapshot')
@@ -0,0 +1,42 @@
+"""media uploads
+
+Revision ID: b5d1e7f9ca08
+Revises: a9c4e6f8b907
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d1e7f9ca08'
+down_revision: Union[str, None] = 'a9c4e6f8b907'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('media') as batch_op:
+        batch_op.add_column(sa.Column('created_by', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('storage_key', sa.String(length=255), nullable=True))
+        batch_op.add_column(sa.Column('content_type', sa.String(length=100), nullable=True))
+        batch_op.add_column(sa.Column('size', sa.BigInteger(), nullable=True))
+        batch_op.add_column(sa.Column('renditions', sa.JSON(), nullable=True))
+        batch_op.create_foreign_key(
+            'fk_media_created_by_authors', 'authors', ['created_by'], ['id'], ondelete='SET NULL'
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('media') as batch_op:
+        batch_op.drop_constraint('fk_media_created_by_authors', type_='foreignkey')
+        batch_op.drop_column('renditions')
+        batch_op.drop_column('size')
+        batch_op.drop_column('content_type')
+        batch_op.drop_column('storage_key')
+        batch_op.drop_column('created_by')
@@ -0,0 +1,51 @@
+"""article filter and sort indexes
+
+Revision ID: c4d8e2f3b503
+Revises: 8b2e4d6f1a02
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d8e2f3b503'
+down_revision: Union[str, None] = '8b2e4d6f1a02'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SORT_COLUMNS = {
+    'created_at': 'created_at',
+    'published_at': 'published_at',
+    'view_count': 'view_count',
+}
+FILTER_COLUMNS = {
+    'category': 'category_id',
+    'author': 'author_id',
+    'content_type': 'content_type_id',
+}
+
+
+def _indexes():
+    yield 'ix_articles_published_at_id', ['published_at', 'id']
+    yield 'ix_articles_view_count_id', ['view_count', 'id']
+    for filter_name, filter_column in FILTER_COLUMNS.items():
+        for sort_name, sort_column in SORT_COLUMNS.items():
+            yield f'ix_articles_{filter_name}_{sort_name}_id', [filter_column, sort_column, 'id']
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, columns in _indexes():
+        op.create_index(name, 'articles', columns)
+    op.create_index('ix_article_tags_tag_id_article_id', 'article_tags', ['tag_id', 'article_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_article_tags_tag_id_article_id', table_name='article_tags')
+    for name, _ in reversed(list(_indexes())):
+        op.drop_index(name, table_name='articles')
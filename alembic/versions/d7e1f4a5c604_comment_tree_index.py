@@ -0,0 +1,28 @@
+"""comment tree index
+
+Revision ID: d7e1f4a5c604
+Revises: c4d8e2f3b503
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7e1f4a5c604'
+down_revision: Union[str, None] = 'c4d8e2f3b503'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_comments_parent_id_id', 'comments', ['parent_id', 'id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_comments_parent_id_id', table_name='comments')
@@ -0,0 +1,97 @@
+"""media blobs
+
+Revision ID: d8f3a9b1ec0a
+Revises: c6e2f8a0db09
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8f3a9b1ec0a'
+down_revision: Union[str, None] = 'c6e2f8a0db09'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+media = sa.table(
+    'media',
+    sa.column('id', sa.Integer),
+    sa.column('url', sa.String),
+    sa.column('storage_key', sa.String),
+    sa.column('size', sa.BigInteger),
+    sa.column('content_hash', sa.String),
+    sa.column('renditions', sa.JSON),
+)
+media_blobs = sa.table(
+    'media_blobs',
+    sa.column('content_hash', sa.String),
+    sa.column('storage_key', sa.String),
+    sa.column('size', sa.BigInteger),
+    sa.column('ref_count', sa.Integer),
+    sa.column('renditions', sa.JSON),
+)
+
+
+def _backfill_blobs() -> None:
+    """
+    Створити блоб для кожного наявного хешу і перевести дублікати на файл першого запису.
+    Файли дублікатів лишаються без посилань і прибираються командою app.media.jobs gc --sweep.
+    """
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.select(media.c.id, media.c.url, media.c.storage_key, media.c.size, media.c.content_hash, media.c.renditions)
+        .where(media.c.content_hash.is_not(None), media.c.storage_key.is_not(None))
+        .order_by(media.c.content_hash, media.c.id)
+    ).all()
+    blobs = {}
+    for row in rows:
+        blob = blobs.get(row.content_hash)
+        if blob is None:
+            blobs[row.content_hash] = {
+                'content_hash': row.content_hash, 'storage_key': row.storage_key, 'size': row.size or 0,
+                'ref_count': 1, 'renditions': row.renditions,
+            }
+            continue
+        blob['ref_count'] += 1
+        url = row.url[:-len(row.storage_key)] + blob['storage_key'] if row.url.endswith(row.storage_key) else row.url
+        bind.execute(
+            media.update().where(media.c.id == row.id)
+            .values(storage_key=blob['storage_key'], url=url, renditions=blob['renditions'])
+        )
+    if blobs:
+        bind.execute(media_blobs.insert(), list(blobs.values()))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'media_blobs',
+        sa.Column('content_hash', sa.String(length=64), nullable=False),
+        sa.Column('storage_key', sa.String(length=255), nullable=False),
+        sa.Column('size', sa.BigInteger(), nullable=False),
+        sa.Column('ref_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('renditions', sa.JSON(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column('released_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('content_hash'),
+    )
+    op.create_index('ix_media_blobs_released_at', 'media_blobs', ['released_at'])
+    _backfill_blobs()
+    op.create_index('ix_media_content_hash', 'media', ['content_hash'])
+    with op.batch_alter_table('media') as batch_op:
+        batch_op.create_foreign_key(
+            'fk_media_content_hash_media_blobs', 'media_blobs', ['content_hash'], ['content_hash']
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('media') as batch_op:
+        batch_op.drop_constraint('fk_media_content_hash_media_blobs', type_='foreignkey')
+    op.drop_index('ix_media_content_hash', table_name='media')
+    op.drop_index('ix_media_blobs_released_at', table_name='media_blobs')
+    op.drop_table('media_blobs')
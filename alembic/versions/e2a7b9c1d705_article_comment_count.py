@@ -0,0 +1,32 @@
+"""article comment count
+
+Revision ID: e2a7b9c1d705
+Revises: d7e1f4a5c604
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a7b9c1d705'
+down_revision: Union[str, None] = 'd7e1f4a5c604'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('articles', sa.Column('comment_count', sa.Integer(), server_default='0', nullable=False))
+    op.execute(
+        "UPDATE articles SET comment_count = "
+        "(SELECT COUNT(*) FROM comments WHERE comments.article_id = articles.id)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('articles', 'comment_count')
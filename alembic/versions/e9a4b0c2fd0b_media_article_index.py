@@ -0,0 +1,28 @@
+"""media article index
+
+Revision ID: e9a4b0c2fd0b
+Revises: d8f3a9b1ec0a
+Create Date: 2026-10-18 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e9a4b0c2fd0b'
+down_revision: Union[str, None] = 'd8f3a9b1ec0a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_media_article_id_id', 'media', ['article_id', 'id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_media_article_id_id', table_name='media')
@@ -0,0 +1,38 @@
+"""taxonomy versions
+
+Revision ID: f1b5c7d9e20c
+Revises: e9a4b0c2fd0b
+Create Date: 2026-10-18 23:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1b5c7d9e20c'
+down_revision: Union[str, None] = 'e9a4b0c2fd0b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    taxonomy_versions = op.create_table(
+        'taxonomy_versions',
+        sa.Column('kind', sa.String(length=32), nullable=False),
+        sa.Column('version', sa.Integer(), server_default='0', nullable=False),
+        sa.PrimaryKeyConstraint('kind'),
+    )
+    op.bulk_insert(taxonomy_versions, [
+        {'kind': 'categories', 'version': 0},
+        {'kind': 'content_types', 'version': 0},
+        {'kind': 'tags', 'version': 0},
+    ])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('taxonomy_versions')
@@ -0,0 +1,43 @@
+"""article current version
+
+Revision ID: f3b8c0d2e806
+Revises: e2a7b9c1d705
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b8c0d2e806'
+down_revision: Union[str, None] = 'e2a7b9c1d705'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('articles', sa.Column('current_version', sa.Integer(), server_default='0', nullable=False))
+    # Старий COUNT(*) + 1 міг видати однакові номери паралельним редагуванням:
+    # перенумеровуємо історію кожної статті за порядком запису, щоб створити унікальне обмеження
+    op.execute(
+        "UPDATE article_history SET version_num = ("
+        "SELECT COUNT(*) FROM article_history AS earlier "
+        "WHERE earlier.article_id = article_history.article_id AND earlier.id <= article_history.id)"
+    )
+    with op.batch_alter_table('article_history') as batch_op:
+        batch_op.create_unique_constraint('uq_article_history_article_id_version_num', ['article_id', 'version_num'])
+    op.execute(
+        "UPDATE articles SET current_version = COALESCE("
+        "(SELECT MAX(version_num) FROM article_history WHERE article_history.article_id = articles.id), 0)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('article_history') as batch_op:
+        batch_op.drop_constraint('uq_article_history_article_id_version_num', type_='unique')
+    op.drop_column('articles', 'current_version')
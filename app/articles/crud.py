@@ -1,21 +1,136 @@
-from sqlalchemy.orm import Session
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session, selectinload, joinedload, load_only
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from fastapi import HTTPException
-from typing import List, Optional
+from typing import Dict, List, NamedTuple, Optional, Tuple, Type
 from datetime import datetime, timezone
+from functools import lru_cache
+from pydantic import BaseModel
 from app.articles import models, schemas
-from app.tags.models import Tag
+from app.tags.models import Tag, article_tags
 from app.authors.models import Author
-from app.categories.models import Category
+from app.core.pagination import apply_keyset, next_cursor
+from app.core.http_cache import response_cache
+from app.articles.search import search_index
+from app.articles.history import history_content
+from app.taxonomy.cache import taxonomy_cache
 
-def get_articles(db: Session, skip: int = 0, limit: int = 100) -> List[models.Article]:
+class SortKey(NamedTuple):
+    """Ключ сортування та keyset-пагінації: стовпці, атрибути для курсора та перетворювачі значень."""
+    columns: tuple
+    attrs: Tuple[str, ...]
+    converters: tuple
+
+# Ключі сортування списку статей (за спаданням); id розв'язує однакові значення.
+# created_at і published_at підкріплені складеними індексами (див. models.Article.__table_args__);
+# view_count свідомо без індексу, тож це сортування впорядковує відфільтровані рядки в запиті.
+ARTICLE_SORT_KEYS = {
+    schemas.ArticleSort.CREATED_AT: SortKey(
+        (models.Article.created_at, models.Article.id), ("created_at", "id"), (datetime.fromisoformat, int)),
+    schemas.ArticleSort.PUBLISHED_AT: SortKey(
+        (models.Article.published_at, models.Article.id), ("published_at", "id"), (datetime.fromisoformat, int)),
+    schemas.ArticleSort.VIEW_COUNT: SortKey(
+        (models.Article.view_count, models.Article.id), ("view_count", "id"), (int, int)),
+}
+
+# Стратегії завантаження зв'язків статті для полів схеми відповіді.
+# Колекції — selectinload (один IN-запит на всю сторінку), many-to-one — joinedload (у тому ж SELECT).
+ARTICLE_RELATION_LOADERS = {
+    "tag_ids": lambda: selectinload(models.Article.tags).load_only(Tag.tag_id),
+    "tags": lambda: selectinload(models.Article.tags),
+    "author": lambda: joinedload(models.Article.author),
+    "category": lambda: joinedload(models.Article.category),
+    "content_type": lambda: joinedload(models.Article.content_type),
+    "comments": lambda: selectinload(models.Article.comments),
+    "history": lambda: selectinload(models.Article.history),
+    "media": lambda: selectinload(models.Article.media_items),
+}
+
+@lru_cache(maxsize=None)
+def article_load_options(response_model: Type[BaseModel] = schemas.ArticleOut) -> tuple:
+    """
+    Підібрати опції завантаження зв'язків для схеми відповіді,
+    щоб серіалізація сторінки статей не виконувала окремий запит на кожну статтю.
+    
+    Args:
+        response_model: Pydantic-схема, у яку серіалізуються статті.
+    
+    Returns:
+        tuple: Опції для .options() запиту.
+    """
+    return tuple(
+        loader() for field, loader in ARTICLE_RELATION_LOADERS.items()
+        if field in response_model.model_fields
+    )
+
+def _apply_article_filter(stmt, filters: schemas.ArticleFilter):
+    Article = models.Article
+    if filters.category_id is not None:
+        stmt = stmt.where(Article.category_id == filters.category_id)
+    if filters.author_id is not None:
+        stmt = stmt.where(Article.author_id == filters.author_id)
+    if filters.content_type_id is not None:
+        stmt = stmt.where(Article.content_type_id == filters.content_type_id)
+    if filters.tag_id is not None:
+        # Join по індексу (tag_id, article_id) замість EXISTS-підзапиту на кожен рядок
+        stmt = stmt.join(article_tags, article_tags.c.article_id == Article.id).where(
+            article_tags.c.tag_id == filters.tag_id)
+    if filters.published_from is not None:
+        stmt = stmt.where(Article.published_at >= filters.published_from)
+    if filters.published_to is not None:
+        stmt = stmt.where(Article.published_at < filters.published_to)
+    if filters.order_by == schemas.ArticleSort.PUBLISHED_AT:
+        # Неопубліковані статті не мають місця в стрічці за датою публікації
+        stmt = stmt.where(Article.published_at.is_not(None))
+    return stmt
+
+def _articles_stmt(
+    skip: int,
+    limit: int,
+    cursor: Optional[str],
+    response_model: Type[BaseModel],
+    filters: Optional[schemas.ArticleFilter] = None,
+    columns: Optional[tuple] = None,
+):
+    if skip < 0 or limit < 1:
+        raise HTTPException(status_code=400, detail="skip має бути невід'ємним, а limit - позитивним")
+    filters = filters or schemas.ArticleFilter()
+    sort_key = ARTICLE_SORT_KEYS[filters.order_by]
+    if columns:
+        base = select(*columns)
+    else:
+        base = select(models.Article).options(*article_load_options(response_model))
+    stmt = apply_keyset(
+        _apply_article_filter(base, filters),
+        sort_key.columns,
+        cursor,
+        sort_key.converters,
+        descending=True,
+    )
+    # Із курсором зсув не потрібен: сторінка N коштує так само, як перша
+    if not cursor:
+        stmt = stmt.offset(skip)
+    return stmt.limit(limit)
+
+def get_articles(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    response_model: Type[BaseModel] = schemas.ArticleOut,
+    filters: Optional[schemas.ArticleFilter] = None,
+) -> List[models.Article]:
     """
     Отримати список статей із пагінацією.
     
     Args:
         db: Сесія бази даних.
-        skip: Кількість пропущених записів.
+        skip: Кількість пропущених записів (ігнорується, якщо передано cursor).
         limit: Максимальна кількість записів для повернення.
+        cursor: Курсор наступної сторінки (keyset-пагінація).
+        response_model: Схема відповіді, що визначає, які зв'язки завантажити наперед.
+        filters: Фільтри та сортування; за замовчуванням — усі статті, найновіші першими.
     
     Returns:
         List[models.Article]: Список статей.
@@ -23,20 +138,117 @@ def get_articles(db: Session, skip: int = 0, limit: int = 100) -> List[models.Ar
     Raises:
         HTTPException: Якщо сталася помилка бази даних або параметри некоректні.
     """
+    stmt = _articles_stmt(skip, limit, cursor, response_model, filters)
     try:
-        if skip < 0 or limit < 1:
-            raise HTTPException(status_code=400, detail="skip має бути невід'ємним, а limit - позитивним")
-        return db.query(models.Article).offset(skip).limit(limit).all()
+        return list(db.execute(stmt).scalars().all())
     except SQLAlchemyError:
         raise HTTPException(status_code=500, detail="Помилка бази даних при отриманні статей")
 
-def get_article(db: Session, article_id: int) -> Optional[models.Article]:
+@lru_cache(maxsize=None)
+def article_row_columns(response_model: Type[BaseModel] = schemas.ArticleOut, extra: Tuple[str, ...] = ()) -> tuple:
+    """
+    Колонки таблиці articles, що є полями схеми відповіді, плюс id і службові колонки extra
+    (ключ курсора, category_id для рейтингу), які не входять у відповідь.
+    """
+    table = models.Article.__table__
+    names = dict.fromkeys(["id", *extra, *(name for name in response_model.model_fields if name in table.c)])
+    return tuple(table.c[name] for name in names)
+
+async def _fetch_article_rows(db: AsyncSession, stmt, response_model: Type[BaseModel]) -> List[dict]:
+    result = await db.execute(stmt)
+    rows = [dict(row) for row in result.mappings()]
+    if rows and "tag_ids" in response_model.model_fields:
+        by_id = {}
+        for row in rows:
+            row["tag_ids"] = []
+            by_id[row["id"]] = row
+        links = await db.execute(
+            select(article_tags.c.article_id, article_tags.c.tag_id)
+            .where(article_tags.c.article_id.in_(by_id))
+        )
+        for article_id, tag_id in links:
+            by_id[article_id]["tag_ids"].append(tag_id)
+    return rows
+
+def _project_rows(rows: List[dict], response_model: Type[BaseModel]) -> List[dict]:
+    fields = response_model.model_fields
+    if not rows or all(key in fields for key in rows[0]):
+        return rows
+    return [{key: value for key, value in row.items() if key in fields} for row in rows]
+
+async def get_article_rows_async(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    response_model: Type[BaseModel] = schemas.ArticleOut,
+    filters: Optional[schemas.ArticleFilter] = None,
+) -> Tuple[List[dict], Optional[str]]:
+    """
+    Швидкий шлях списку статей: словники з кортежів колонок без ORM-об'єктів.
+    SELECT містить лише колонки полів response_model (і ключ курсора), тож проєкція
+    відбувається в БД, а не після завантаження. Ключі рядків збігаються з полями response_model,
+    тож результат можна серіалізувати без повторної валідації.
+    tag_ids збираються другим запитом по article_tags для всієї сторінки.
+    
+    Args:
+        db: Асинхронна сесія бази даних.
+        skip: Кількість пропущених записів (ігнорується, якщо передано cursor).
+        limit: Максимальна кількість записів для повернення.
+        cursor: Курсор наступної сторінки (keyset-пагінація).
+        response_model: Схема відповіді, що визначає набір колонок.
+        filters: Фільтри та сортування.
+    
+    Returns:
+        Tuple[List[dict], Optional[str]]: Рядки статей і курсор наступної сторінки.
+    
+    Raises:
+        HTTPException: Якщо сталася помилка бази даних або параметри некоректні.
+    """
+    sort_attrs = ARTICLE_SORT_KEYS[(filters or schemas.ArticleFilter()).order_by].attrs
+    columns = article_row_columns(response_model, sort_attrs)
+    stmt = _articles_stmt(skip, limit, cursor, response_model, filters, columns=columns)
+    try:
+        rows = await _fetch_article_rows(db, stmt, response_model)
+    except SQLAlchemyError:
+        raise HTTPException(status_code=500, detail="Помилка бази даних при отриманні статей")
+    return _project_rows(rows, response_model), next_cursor(rows, sort_attrs, limit)
+
+async def get_article_row_async(
+    db: AsyncSession, article_id: int, response_model: Type[BaseModel] = schemas.ArticleOut
+) -> Optional[Tuple[dict, int]]:
+    """
+    Отримати статтю за ID як словник лише з колонками полів response_model.
+    
+    Args:
+        db: Асинхронна сесія бази даних.
+        article_id: ID статті.
+        response_model: Схема відповіді, що визначає набір колонок.
+    
+    Returns:
+        Optional[Tuple[dict, int]]: Рядок статті та її category_id (для рейтингу) або None.
+    
+    Raises:
+        HTTPException: Якщо сталася помилка бази даних.
+    """
+    columns = article_row_columns(response_model, ("category_id",))
+    stmt = select(*columns).where(models.Article.id == article_id)
+    try:
+        rows = await _fetch_article_rows(db, stmt, response_model)
+    except SQLAlchemyError:
+        raise HTTPException(status_code=500, detail="Помилка бази даних при отриманні статті")
+    if not rows:
+        return None
+    return _project_rows(rows, response_model)[0], rows[0]["category_id"]
+
+def get_article(db: Session, article_id: int, response_model: Type[BaseModel] = schemas.ArticleOut) -> Optional[models.Article]:
     """
     Отримати статтю за ID.
     
     Args:
         db: Сесія бази даних.
         article_id: ID статті.
+        response_model: Схема відповіді, що визначає, які зв'язки завантажити наперед.
     
     Returns:
         Optional[models.Article]: Стаття або None, якщо не знайдено.
@@ -45,10 +257,153 @@ def get_article(db: Session, article_id: int) -> Optional[models.Article]:
         HTTPException: Якщо сталася помилка бази даних.
     """
     try:
-        return db.query(models.Article).filter(models.Article.id == article_id).first()
+        return (db.query(models.Article)
+                .options(*article_load_options(response_model))
+                .filter(models.Article.id == article_id)
+                .first())
     except SQLAlchemyError:
         raise HTTPException(status_code=500, detail="Помилка бази даних при отриманні статті")
 
+async def get_articles_async(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    response_model: Type[BaseModel] = schemas.ArticleOut,
+    filters: Optional[schemas.ArticleFilter] = None,
+) -> List[models.Article]:
+    """
+    Асинхронно отримати список статей із пагінацією.
+    
+    Args:
+        db: Асинхронна сесія бази даних.
+        skip: Кількість пропущених записів (ігнорується, якщо передано cursor).
+        limit: Максимальна кількість записів для повернення.
+        cursor: Курсор наступної сторінки (keyset-пагінація).
+        response_model: Схема відповіді, що визначає, які зв'язки завантажити наперед.
+        filters: Фільтри та сортування; за замовчуванням — усі статті, найновіші першими.
+    
+    Returns:
+        List[models.Article]: Список статей.
+    
+    Raises:
+        HTTPException: Якщо сталася помилка бази даних або параметри некоректні.
+    """
+    stmt = _articles_stmt(skip, limit, cursor, response_model, filters)
+    try:
+        result = await db.execute(stmt)
+        return list(result.scalars().all())
+    except SQLAlchemyError:
+        raise HTTPException(status_code=500, detail="Помилка бази даних при отриманні статей")
+
+async def get_article_async(db: AsyncSession, article_id: int, response_model: Type[BaseModel] = schemas.ArticleOut) -> Optional[models.Article]:
+    """
+    Асинхронно отримати статтю за ID.
+    
+    Args:
+        db: Асинхронна сесія бази даних.
+        article_id: ID статті.
+        response_model: Схема відповіді, що визначає, які зв'язки завантажити наперед.
+    
+    Returns:
+        Optional[models.Article]: Стаття або None, якщо не знайдено.
+    
+    Raises:
+        HTTPException: Якщо сталася помилка бази даних.
+    """
+    try:
+        return await db.get(models.Article, article_id, options=article_load_options(response_model))
+    except SQLAlchemyError:
+        raise HTTPException(status_code=500, detail="Помилка бази даних при отриманні статті")
+
+async def get_article_headlines_async(db: AsyncSession, article_ids: List[int]) -> Dict[int, models.Article]:
+    """
+    Асинхронно отримати заголовки статей за списком ID одним запитом за первинним ключем.
+    
+    Args:
+        db: Асинхронна сесія бази даних.
+        article_ids: ID статей.
+    
+    Returns:
+        Dict[int, models.Article]: Статті з полями id, title, category_id за їх ID.
+    
+    Raises:
+        HTTPException: Якщо сталася помилка бази даних.
+    """
+    if not article_ids:
+        return {}
+    stmt = (select(models.Article)
+            .options(load_only(models.Article.id, models.Article.title, models.Article.category_id))
+            .where(models.Article.id.in_(article_ids)))
+    try:
+        result = await db.execute(stmt)
+        return {article.id: article for article in result.scalars()}
+    except SQLAlchemyError:
+        raise HTTPException(status_code=500, detail="Помилка бази даних при отриманні статей")
+
+# Колонки вивантаження статей (NDJSON/CSV)
+ARTICLE_EXPORT_COLUMNS = (
+    "id", "title", "description", "content", "view_count", "comment_count", "created_at", "updated_at",
+    "published_at", "author_id", "category_id", "content_type_id",
+)
+
+def articles_export_stmt(created_from: Optional[datetime] = None, created_to: Optional[datetime] = None,
+                         category_id: Optional[int] = None):
+    """
+    Запит вивантаження статей: лише колонки таблиці, без ORM-об'єктів і зв'язків.
+    Порядок (created_at, id) обслуговується індексами ix_articles_created_at_id
+    та ix_articles_category_created_at_id.
+    
+    Args:
+        created_from: Початок діапазону дати створення (включно).
+        created_to: Кінець діапазону дати створення (не включно).
+        category_id: ID категорії.
+    
+    Returns:
+        Select: Запит для app.core.export.stream_export.
+    """
+    table = models.Article.__table__
+    stmt = select(*(table.c[name] for name in ARTICLE_EXPORT_COLUMNS))
+    if created_from is not None:
+        stmt = stmt.where(table.c.created_at >= created_from)
+    if created_to is not None:
+        stmt = stmt.where(table.c.created_at < created_to)
+    if category_id is not None:
+        stmt = stmt.where(table.c.category_id == category_id)
+    return stmt.order_by(table.c.created_at, table.c.id)
+
+def _set_article_tags(db: Session, article_id: int, tag_ids: List[int]) -> None:
+    # Зв'язки пишуться напряму в article_tags: присвоєння article.tags спершу завантажило б об'єкти Tag
+    db.execute(delete(article_tags).where(article_tags.c.article_id == article_id))
+    if tag_ids:
+        db.execute(insert(article_tags), [
+            {"article_id": article_id, "tag_id": tag_id} for tag_id in dict.fromkeys(tag_ids)
+        ])
+
+def _stale_taxonomy_error(db: Session, category_id: Optional[int], tag_ids: Optional[List[int]]) -> Optional[HTTPException]:
+    """
+    Пояснити IntegrityError запису статті застарілим кешем довідників.
+    Категорію чи тег могли видалити в іншому воркері до того, як кеш побачив новий штамп версії:
+    довідники перечитуються з БД і ID перевіряються заново за первинним ключем.
+    
+    Args:
+        db: Сесія бази даних (після rollback).
+        category_id: ID категорії, якщо його записували.
+        tag_ids: ID тегів, якщо їх записували.
+    
+    Returns:
+        Optional[HTTPException]: Помилка 400 для відсутнього запису або None, якщо довідники ні до чого.
+    """
+    try:
+        taxonomy_cache.load(db, ("categories", "tags"))
+        if category_id is not None and not taxonomy_cache.exists(db, "categories", (category_id,)):
+            return HTTPException(status_code=400, detail="Категорія не знайдена")
+        if tag_ids and not taxonomy_cache.exists(db, "tags", tag_ids):
+            return HTTPException(status_code=400, detail="Один або кілька тегів не знайдено")
+    except SQLAlchemyError:
+        pass
+    return None
+
 def create_article(db: Session, article_in: schemas.ArticleCreate) -> models.Article:
     """
     Створити нову статтю.
@@ -69,10 +424,11 @@ def create_article(db: Session, article_in: schemas.ArticleCreate) -> models.Art
         if not author:
             raise HTTPException(status_code=400, detail="Автор не знайдений")
         
-        # Перевіряємо існування категорії
-        category = db.query(Category).filter(Category.id == article_in.category_id).first()
-        if not category:
+        # Категорія й теги перевіряються за кешем довідників, без запитів до БД
+        if not taxonomy_cache.exists(db, "categories", (article_in.category_id,)):
             raise HTTPException(status_code=400, detail="Категорія не знайдена")
+        if article_in.tag_ids and not taxonomy_cache.exists(db, "tags", article_in.tag_ids):
+            raise HTTPException(status_code=400, detail="Один або кілька тегів не знайдено")
         
         # Створюємо статтю
         new_article = models.Article(
@@ -81,20 +437,24 @@ def create_article(db: Session, article_in: schemas.ArticleCreate) -> models.Art
             content=article_in.content,
             view_count=article_in.view_count,
             author_id=article_in.author_id,
-            category_id=article_in.category_id
+            category_id=article_in.category_id,
+            content_type_id=article_in.content_type_id
         )
         
-        # Обробляємо теги
-        if article_in.tag_ids:
-            tags = db.query(Tag).filter(Tag.id.in_(article_in.tag_ids)).all()
-            if len(tags) != len(article_in.tag_ids):
-                raise HTTPException(status_code=400, detail="Один або кілька тегів не знайдено")
-            new_article.tags = tags
-        
         db.add(new_article)
+        if article_in.tag_ids:
+            db.flush()
+            _set_article_tags(db, new_article.id, article_in.tag_ids)
         db.commit()
+        response_cache.invalidate("articles")
         db.refresh(new_article)
+        if search_index.ready:
+            search_index.add(new_article.id, new_article.title, new_article.content)
         return new_article
+    except IntegrityError:
+        db.rollback()
+        raise _stale_taxonomy_error(db, article_in.category_id, article_in.tag_ids) or HTTPException(
+            status_code=500, detail="Помилка бази даних при створенні статті")
     except SQLAlchemyError:
         db.rollback()
         raise HTTPException(status_code=500, detail="Помилка бази даних при створенні статті")
@@ -115,6 +475,10 @@ def update_article(db: Session, article: models.Article, article_in: schemas.Art
         HTTPException: Якщо категорія чи теги не знайдені, або сталася помилка бази даних.
     """
     try:
+        # Блокуємо рядок статті до commit і перечитуємо його: різниця в історії будується від вмісту,
+        # який записав попередній редактор, а не від копії, завантаженої до його коміту
+        db.refresh(article, with_for_update=True)
+        previous_content = article.content
         # Оновлюємо основні поля
         update_data = article_in.model_dump(exclude_unset=True, exclude={"tag_ids", "category_id"})
         for key, value in update_data.items():
@@ -122,35 +486,42 @@ def update_article(db: Session, article: models.Article, article_in: schemas.Art
         
         # Оновлюємо категорію, якщо передано
         if article_in.category_id is not None:
-            category = db.query(Category).filter(Category.id == article_in.category_id).first()
-            if not category:
+            if not taxonomy_cache.exists(db, "categories", (article_in.category_id,)):
                 raise HTTPException(status_code=400, detail="Категорія не знайдена")
             article.category_id = article_in.category_id
         
         # Оновлюємо теги, якщо передано
         if article_in.tag_ids is not None:
-            tags = db.query(Tag).filter(Tag.id.in_(article_in.tag_ids)).all()
-            if len(tags) != len(article_in.tag_ids):
+            if not taxonomy_cache.exists(db, "tags", article_in.tag_ids):
                 raise HTTPException(status_code=400, detail="Один або кілька тегів не знайдено")
-            article.tags = tags
+            _set_article_tags(db, article.id, article_in.tag_ids)
         
         # Зберігаємо історію редагувань
         if update_data or article_in.tag_ids is not None or article_in.category_id is not None:
+            # Номер версії збільшується тим самим UPDATE, що й решта полів; рядок статті
+            # заблоковано на початку, тож паралельні редактори не отримають однаковий номер
+            article.current_version = models.Article.current_version + 1
+            db.flush()
             history_entry = models.ArticleHistory(
                 article_id=article.id,
-                version_num=(db.query(models.ArticleHistory)
-                            .filter(models.ArticleHistory.article_id == article.id)
-                            .count() + 1),
+                version_num=article.current_version,
                 title=article.title,
-                content=article.content,
+                **history_content(article.current_version, previous_content, article.content),
                 edited_at=datetime.now(timezone.utc),
                 action="updated"
             )
             db.add(history_entry)
         
         db.commit()
+        response_cache.invalidate("articles")
         db.refresh(article)
+        if search_index.ready:
+            search_index.add(article.id, article.title, article.content)
         return article
+    except IntegrityError:
+        db.rollback()
+        raise _stale_taxonomy_error(db, article_in.category_id, article_in.tag_ids) or HTTPException(
+            status_code=500, detail="Помилка бази даних при оновленні статті")
     except SQLAlchemyError:
         db.rollback()
         raise HTTPException(status_code=500, detail="Помилка бази даних при оновленні статті")
@@ -167,8 +538,11 @@ def delete_article(db: Session, article: models.Article) -> None:
         HTTPException: Якщо сталася помилка бази даних.
     """
     try:
+        article_id = article.id
         db.delete(article)
         db.commit()
+        response_cache.invalidate("articles")
+        search_index.remove(article_id)
     except SQLAlchemyError:
         db.rollback()
         raise HTTPException(status_code=500, detail="Помилка бази даних при видаленні статті")
\ No newline at end of file
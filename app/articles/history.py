@@ -0,0 +1,111 @@
+import json
+import re
+import zlib
+from difflib import SequenceMatcher
+from typing import Any, Dict, List, Optional, Union
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.articles.models import ArticleHistory
+from app.core.config import settings
+
+# Слово разом із пробілами після нього; конкатенація токенів відтворює текст без втрат
+_TOKEN_RE = re.compile(r"\S+\s*|\s+")
+
+
+def split_tokens(text: Optional[str]) -> List[str]:
+    """Розбити текст на слова з пробілами після них."""
+    return _TOKEN_RE.findall(text) if text else []
+
+
+def make_delta(old: Optional[str], new: Optional[str]) -> bytes:
+    """
+    Стиснена різниця між двома версіями вмісту.
+    Операції: [i1, i2] — скопіювати токени старої версії з i1 по i2, рядок — вставити текст.
+    """
+    old_tokens, new_tokens = split_tokens(old), split_tokens(new)
+    ops: List[Union[List[int], str]] = []
+    for tag, i1, i2, j1, j2 in SequenceMatcher(None, old_tokens, new_tokens).get_opcodes():
+        if tag == "equal":
+            ops.append([i1, i2])
+        elif tag in ("replace", "insert"):
+            ops.append("".join(new_tokens[j1:j2]))
+    return zlib.compress(json.dumps(ops, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+def apply_delta(old: Optional[str], delta: bytes) -> str:
+    """Відновити нову версію вмісту зі старої та різниці make_delta."""
+    tokens = split_tokens(old)
+    return "".join(
+        "".join(tokens[op[0]:op[1]]) if isinstance(op, list) else op
+        for op in json.loads(zlib.decompress(delta))
+    )
+
+
+def history_content(version_num: int, previous: Optional[str], current: Optional[str],
+                    interval: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Поля вмісту для нового запису історії: повний знімок або різниця з попередньою версією.
+    Знімок зберігається для кожної interval-ї версії та тоді, коли різниця не менша за половину тексту,
+    тож відновлення будь-якої версії застосовує не більше interval - 1 різниць.
+
+    Args:
+        version_num: Номер нової версії.
+        previous: Вміст попередньої версії (до редагування).
+        current: Вміст нової версії.
+        interval: Період знімків; за замовчуванням ARTICLE_HISTORY_SNAPSHOT_INTERVAL.
+
+    Returns:
+        Dict[str, Any]: Значення полів is_snapshot, content і delta.
+    """
+    interval = interval or settings.ARTICLE_HISTORY_SNAPSHOT_INTERVAL
+    if previous is not None and current is not None and (version_num - 1) % interval:
+        delta = make_delta(previous, current)
+        if len(delta) * 2 < len(current.encode("utf-8")):
+            return {"is_snapshot": False, "content": None, "delta": delta}
+    return {"is_snapshot": True, "content": current, "delta": None}
+
+
+async def get_article_version_async(db: AsyncSession, article_id: int, version_num: int) -> Optional[Dict[str, Any]]:
+    """
+    Відновити версію статті: найближчий знімок до version_num і різниці після нього — одним запитом.
+
+    Args:
+        db: Асинхронна сесія бази даних.
+        article_id: ID статті.
+        version_num: Номер версії.
+
+    Returns:
+        Optional[Dict[str, Any]]: Поля ArticleHistoryOut з повним вмістом або None, якщо версії немає.
+    """
+    snapshot = (
+        select(func.max(ArticleHistory.version_num))
+        .where(
+            ArticleHistory.article_id == article_id,
+            ArticleHistory.is_snapshot.is_(True),
+            ArticleHistory.version_num <= version_num,
+        )
+        .scalar_subquery()
+    )
+    result = await db.execute(
+        select(ArticleHistory)
+        .where(ArticleHistory.article_id == article_id, ArticleHistory.version_num.between(snapshot, version_num))
+        .order_by(ArticleHistory.version_num)
+    )
+    rows = result.scalars().all()
+    if not rows or rows[-1].version_num != version_num:
+        return None
+    content = None
+    for row in rows:
+        content = row.content if row.is_snapshot else apply_delta(content, row.delta)
+    target = rows[-1]
+    return {
+        "id": target.id,
+        "article_id": target.article_id,
+        "version_num": target.version_num,
+        "title": target.title,
+        "content": content,
+        "edited_at": target.edited_at,
+        "action": target.action,
+    }
@@ -0,0 +1,169 @@
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.articles import schemas
+from app.articles.models import Article
+from app.articles.search import search_index
+from app.authors.models import Author
+from app.categories.models import Category
+from app.content_types.models import ContentType
+from app.core.config import settings
+from app.core.http_cache import response_cache
+from app.tags.models import Tag, article_tags
+
+# Скільки помилок по рядках включати у звіт; решта лише враховується в failed
+MAX_REPORTED_ERRORS = 1000
+
+# Посилання рядка імпорту: поле -> (колонка для IN-запиту, повідомлення про відсутній запис)
+REFERENCES = {
+    "author_id": (Author.id, "Автор не знайдений"),
+    "category_id": (Category.id, "Категорія не знайдена"),
+    "content_type_id": (ContentType.id, "Тип контенту не знайдено"),
+}
+ARTICLE_COLUMNS = (
+    "title", "description", "content", "view_count", "author_id", "category_id", "content_type_id", "published_at",
+)
+
+
+class ArticleImporter:
+    """
+    Пакетний імпорт статей з NDJSON.
+    Посилання на авторів, категорії, типи контенту й теги перевіряються кількома IN-запитами на пакет
+    (знайдені та відсутні ID запам'ятовуються між пакетами), статті вставляються одним executemany
+    і комітяться разом. Невалідний рядок чи відсутнє посилання відхиляють лише цей рядок.
+    """
+
+    def __init__(self, db: Session, batch_size: Optional[int] = None) -> None:
+        self.db = db
+        self.batch_size = batch_size or settings.ARTICLE_IMPORT_BATCH_SIZE
+        self.report = schemas.ArticleImportReport()
+        self._batch: List[Tuple[int, str]] = []
+        self._found: Dict[str, Set[int]] = {}
+        self._absent: Dict[str, Set[int]] = {}
+
+    def add(self, line_no: int, line: str) -> bool:
+        """
+        Додати рядок NDJSON до поточного пакета.
+
+        Returns:
+            bool: True, якщо пакет заповнено і його слід записати через flush.
+        """
+        if line.strip():
+            self._batch.append((line_no, line))
+        return len(self._batch) >= self.batch_size
+
+    def feed(self, lines: Iterable[str]) -> schemas.ArticleImportReport:
+        """Імпортувати всі рядки (для CLI) і повернути звіт."""
+        for line_no, line in enumerate(lines, start=1):
+            if self.add(line_no, line):
+                self.flush()
+        return self.finish()
+
+    def finish(self) -> schemas.ArticleImportReport:
+        """Записати залишок пакета і повернути звіт."""
+        self.flush()
+        if self.report.imported:
+            response_cache.invalidate("articles")
+        return self.report
+
+    def _fail(self, line_no: int, error: str) -> None:
+        self.report.failed += 1
+        if len(self.report.errors) < MAX_REPORTED_ERRORS:
+            self.report.errors.append(schemas.ArticleImportError(line=line_no, error=error))
+
+    def _resolve(self, key: str, column, ids: Set[int]) -> Set[int]:
+        found = self._found.setdefault(key, set())
+        absent = self._absent.setdefault(key, set())
+        unknown = ids - found - absent
+        if unknown:
+            existing = set(self.db.execute(select(column).where(column.in_(unknown))).scalars())
+            found |= existing
+            absent |= unknown - existing
+        return found
+
+    def _parse(self, batch: List[Tuple[int, str]]) -> List[Tuple[int, schemas.ArticleImportRow]]:
+        parsed = []
+        for line_no, line in batch:
+            try:
+                parsed.append((line_no, schemas.ArticleImportRow.model_validate_json(line)))
+            except ValidationError as exc:
+                self._fail(line_no, "; ".join(
+                    f"{'.'.join(map(str, error['loc'])) or 'row'}: {error['msg']}" for error in exc.errors()
+                ))
+        return parsed
+
+    def _check_references(self, parsed: List[Tuple[int, schemas.ArticleImportRow]]):
+        found = {
+            key: self._resolve(key, column, {getattr(row, key) for _, row in parsed})
+            for key, (column, _) in REFERENCES.items()
+        }
+        tags = self._resolve("tag_ids", Tag.tag_id, {tag_id for _, row in parsed for tag_id in row.tag_ids or ()})
+        valid = []
+        for line_no, row in parsed:
+            missing = next((message for key, (_, message) in REFERENCES.items()
+                            if getattr(row, key) not in found[key]), None)
+            if missing is None and not tags.issuperset(row.tag_ids or ()):
+                missing = "Один або кілька тегів не знайдено"
+            if missing:
+                self._fail(line_no, missing)
+            else:
+                valid.append((line_no, row))
+        return valid
+
+    def flush(self) -> None:
+        """Перевірити та вставити поточний пакет однією транзакцією."""
+        batch, self._batch = self._batch, []
+        if not batch:
+            return
+        self.report.total += len(batch)
+        valid = self._check_references(self._parse(batch))
+        if not valid:
+            return
+        table = Article.__table__
+        try:
+            # insertmanyvalues: багаторядкові INSERT ... RETURNING, id повертаються в порядку параметрів
+            ids = self.db.execute(
+                insert(table).returning(table.c.id, sort_by_parameter_order=True),
+                [{column: getattr(row, column) for column in ARTICLE_COLUMNS} for _, row in valid],
+            ).scalars().all()
+            links = [
+                {"article_id": article_id, "tag_id": tag_id}
+                for article_id, (_, row) in zip(ids, valid)
+                for tag_id in dict.fromkeys(row.tag_ids or ())
+            ]
+            if links:
+                self.db.execute(insert(article_tags), links)
+            self.db.commit()
+        except SQLAlchemyError:
+            self.db.rollback()
+            for line_no, _ in valid:
+                self._fail(line_no, "Помилка бази даних при імпорті пакета")
+            return
+        self.report.imported += len(ids)
+        if search_index.ready:
+            for article_id, (_, row) in zip(ids, valid):
+                search_index.add(article_id, row.title, row.content)
+
+
+async def iter_ndjson_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """
+    Розбити потік байтів тіла запиту на рядки NDJSON, не читаючи його повністю в пам'ять.
+    Розбивається лише щойно отриманий фрагмент; частини незавершеного рядка збираються в список
+    і склеюються один раз, тож довгий рядок не копіюється з кожним фрагментом.
+    """
+    tail: List[bytes] = []
+    async for chunk in chunks:
+        *lines, rest = chunk.split(b"\n")
+        if lines:
+            lines[0] = b"".join(tail) + lines[0]
+            tail = []
+        for line in lines:
+            yield line.decode("utf-8", errors="replace")
+        if rest:
+            tail.append(rest)
+    if tail:
+        yield b"".join(tail).decode("utf-8", errors="replace")
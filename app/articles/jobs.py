@@ -0,0 +1,41 @@
+"""
+Службові задачі статей.
+
+Пакетний імпорт статей з NDJSON-файлу (або stdin, якщо шлях "-"):
+    python -m app.articles.jobs import feed.ndjson --batch-size 5000
+"""
+import argparse
+import sys
+
+from app.articles.importer import ArticleImporter
+from app.db.database import SessionLocal
+
+
+def import_file(path: str, batch_size: int) -> int:
+    stream = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    try:
+        with SessionLocal() as db:
+            report = ArticleImporter(db, batch_size).feed(stream)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+    for error in report.errors:
+        print(f"рядок {error.line}: {error.error}", file=sys.stderr)
+    print(f"Оброблено: {report.total}, імпортовано: {report.imported}, відхилено: {report.failed}")
+    return 1 if report.failed else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    importer = subparsers.add_parser("import", help="Імпортувати статті з NDJSON")
+    importer.add_argument("path", help="Шлях до NDJSON-файлу або - для stdin")
+    importer.add_argument("--batch-size", type=int, default=None)
+    args = parser.parse_args()
+
+    if args.command == "import":
+        sys.exit(import_file(args.path, args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-from sqlalchemy import Integer, String, Text, DateTime, ForeignKey, CheckConstraint, func
+from sqlalchemy import Boolean, Integer, LargeBinary, String, Text, DateTime, ForeignKey, CheckConstraint, Index, UniqueConstraint, func, true
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import List, Optional
 import datetime
@@ -10,12 +10,31 @@ class Article(Base):
     Містить дані про заголовок, вміст, автора, категорію, тип контенту, теги, коментарі та історію редагувань.
     """
     __tablename__ = "articles"
+    __table_args__ = (
+        # Keyset-пагінація стрічки статей (created_at DESC, id DESC)
+        Index("ix_articles_created_at_id", "created_at", "id"),
+        # Сортування без фільтрів. Індексів із view_count немає навмисно: лічильник переглядів
+        # оновлюється пакетними UPDATE, і кожен такий індекс зробив би ці оновлення дорожчими
+        # (у PostgreSQL — ще й не HOT); сортування за переглядами сортує відфільтровані рядки
+        Index("ix_articles_published_at_id", "published_at", "id"),
+        # Фільтр за рівністю + сортування: "останні 20 у категорії X" — один range scan
+        Index("ix_articles_category_created_at_id", "category_id", "created_at", "id"),
+        Index("ix_articles_category_published_at_id", "category_id", "published_at", "id"),
+        Index("ix_articles_author_created_at_id", "author_id", "created_at", "id"),
+        Index("ix_articles_author_published_at_id", "author_id", "published_at", "id"),
+        Index("ix_articles_content_type_created_at_id", "content_type_id", "created_at", "id"),
+        Index("ix_articles_content_type_published_at_id", "content_type_id", "published_at", "id"),
+    )
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     title: Mapped[str] = mapped_column(String(200), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     content: Mapped[str] = mapped_column(Text, nullable=False)
-    view_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False, CheckConstraint("view_count >= 0"))
+    view_count: Mapped[int] = mapped_column(Integer, CheckConstraint("view_count >= 0"), default=0, nullable=False)
+    # Номер останньої версії в article_history; збільшується атомарно в update_article
+    current_version: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    # Денормалізована кількість коментарів; підтримується в app/comments/crud.py
+    comment_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
     created_at: Mapped[datetime.datetime] = mapped_column(DateTime, server_default=func.now())
     updated_at: Mapped[datetime.datetime] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now())
     published_at: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, nullable=True)
@@ -30,6 +49,12 @@ class Article(Base):
     tags: Mapped[List["Tag"]] = relationship("Tag", secondary="article_tags", back_populates="articles")
     comments: Mapped[List["Comment"]] = relationship("Comment", back_populates="article", cascade="all, delete")
     history: Mapped[List["ArticleHistory"]] = relationship("ArticleHistory", back_populates="article", cascade="all, delete")
+    media_items: Mapped[List["Media"]] = relationship("Media", back_populates="article", cascade="all, delete", order_by="Media.id")
+
+    @property
+    def tag_ids(self) -> List[int]:
+        """ID тегів статті (для ArticleOut); зв'язок tags завантажується наперед у crud."""
+        return [tag.tag_id for tag in self.tags]
 
 class ArticleHistory(Base):
     """
@@ -37,12 +62,18 @@ class ArticleHistory(Base):
     Зберігає версії заголовка, вмісту та дії над статтею.
     """
     __tablename__ = "article_history"
+    __table_args__ = (
+        UniqueConstraint("article_id", "version_num", name="uq_article_history_article_id_version_num"),
+    )
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     article_id: Mapped[int] = mapped_column(Integer, ForeignKey("articles.id", ondelete="CASCADE"), nullable=False, index=True)
     version_num: Mapped[int] = mapped_column(Integer, nullable=False)
     title: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
+    # Повний вміст зберігається лише у знімках; інші версії — стиснена різниця з попередньою (app.articles.history)
     content: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    is_snapshot: Mapped[bool] = mapped_column(Boolean, default=True, server_default=true(), nullable=False)
+    delta: Mapped[Optional[bytes]] = mapped_column(LargeBinary, nullable=True)
     edited_at: Mapped[datetime.datetime] = mapped_column(DateTime, server_default=func.now())
     action: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     
@@ -1,71 +1,295 @@
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from typing import Annotated, List, Optional, Type
+from datetime import datetime
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
+from pydantic import BaseModel
 from app.articles import schemas, crud
-from app.db.database import get_db
+from app.articles.views import record_view
+from app.articles.trending import trending
+from app.articles.search import search_articles_async
+from app.articles.history import get_article_version_async
+from app.articles.importer import ArticleImporter, iter_ndjson_lines
+from app.core.pagination import NEXT_CURSOR_HEADER, set_next_cursor
+from app.core.export import ExportFormat, export_response
+from app.core.http_cache import set_hit_context
+from app.db.database import get_db, get_async_db
+from app.core.config import settings
 from app.auth.dependencies import get_current_active_user
+from app.auth.cache import Principal
 from app.authors.models import Author
+from app.media import crud as media_crud
+from app.media.schemas import MediaOut
 
 router = APIRouter()
 
+def get_article_response_model(
+    view: schemas.ArticleView = Query(schemas.ArticleView.FULL, description="summary — без вмісту, full — повна стаття"),
+    fields: Optional[str] = Query(None, description="Поля через кому, напр. id,title,created_at (має пріоритет над view)"),
+) -> Type[BaseModel]:
+    """Залежність: схема відповіді за параметрами view і fields."""
+    try:
+        return schemas.article_response_model(view, fields)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+def get_article_filters(filters: Annotated[schemas.ArticleFilter, Query()]) -> schemas.ArticleFilter:
+    """
+    Залежність: фільтри списку статей з query-параметрів.
+    FastAPI розгортає модель у окремі параметри, лише якщо вона єдиний query-параметр обробника,
+    тому модель приймається окремою залежністю, а не поряд із skip/limit/cursor.
+    """
+    return filters
+
 @router.get("/", response_model=list[schemas.ArticleOut])
-def read_articles(
+async def read_articles(
+    response: Response,
+    filters: schemas.ArticleFilter = Depends(get_article_filters),
     skip: int = Query(0, ge=0, description="Кількість пропущених записів"),
     limit: int = Query(100, ge=1, le=100, description="Максимальна кількість записів"),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="Курсор наступної сторінки із заголовка X-Next-Cursor"),
+    response_model: Type[BaseModel] = Depends(get_article_response_model),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Отримати список статей.
+    Отримати список статей з фільтрами (категорія, автор, тип контенту, тег, дати публікації)
+    і сортуванням за спаданням created_at, published_at або view_count.
+    Курсор наступної сторінки повертається в заголовку X-Next-Cursor.
     
     Args:
-        skip: Кількість пропущених записів.
+        response: Відповідь для заголовка з курсором.
+        filters: Фільтри та сортування.
+        skip: Кількість пропущених записів (ігнорується, якщо передано cursor).
         limit: Максимальна кількість записів для повернення.
-        db: Сесія бази даних.
+        cursor: Курсор наступної сторінки.
+        response_model: Схема відповіді за параметрами view/fields; визначає колонки SELECT.
+        db: Асинхронна сесія бази даних.
     
     Returns:
-        list[schemas.ArticleOut]: Список статей.
+        list[schemas.ArticleOut]: Список статей (лише запитані поля).
     
     Raises:
         HTTPException: Якщо сталася помилка бази даних.
     """
     try:
-        return crud.get_articles(db, skip=skip, limit=limit)
+        cursor_attrs = crud.ARTICLE_SORT_KEYS[filters.order_by].attrs
+        # Проєкція (view/fields) завжди йде швидким шляхом: ORM-об'єкти не пройшли б валідацію ArticleOut
+        if settings.FAST_JSON_RESPONSES or response_model is not schemas.ArticleOut:
+            # Дані з БД довірені: рядки з колонок серіалізуються orjson без повторної валідації схеми
+            rows, next_page = await crud.get_article_rows_async(
+                db, skip=skip, limit=limit, cursor=cursor, response_model=response_model, filters=filters)
+            fast_response = ORJSONResponse(rows)
+            if next_page:
+                fast_response.headers[NEXT_CURSOR_HEADER] = next_page
+            return fast_response
+        articles = await crud.get_articles_async(db, skip=skip, limit=limit, cursor=cursor, filters=filters)
+        set_next_cursor(response, articles, cursor_attrs, limit)
+        return articles
     except SQLAlchemyError:
         raise HTTPException(status_code=500, detail="Помилка бази даних при отриманні статей")
 
+@router.get("/search", response_model=list[schemas.ArticleSearchHit])
+async def search_articles(
+    q: str = Query(..., min_length=1, max_length=200, description="Пошуковий запит"),
+    skip: int = Query(0, ge=0, le=1000, description="Кількість пропущених результатів"),
+    limit: int = Query(20, ge=1, le=100, description="Максимальна кількість результатів"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Повнотекстовий пошук статей.
+    Кожне слово запиту шукається як префікс; результати впорядковані за релевантністю.
+    
+    Args:
+        q: Пошуковий запит.
+        skip: Кількість пропущених результатів.
+        limit: Максимальна кількість результатів.
+        db: Асинхронна сесія бази даних.
+    
+    Returns:
+        list[schemas.ArticleSearchHit]: Знайдені статті з виділеними фрагментами.
+    
+    Raises:
+        HTTPException: Якщо сталася помилка бази даних.
+    """
+    try:
+        return await search_articles_async(db, q, limit=limit, offset=skip)
+    except SQLAlchemyError:
+        raise HTTPException(status_code=500, detail="Помилка бази даних при пошуку статей")
+
+@router.get("/trending", response_model=list[schemas.TrendingArticleOut])
+async def read_trending_articles(
+    category_id: Optional[int] = Query(None, ge=1, description="ID категорії; без нього — загальний рейтинг"),
+    limit: int = Query(10, ge=1, le=50, description="Максимальна кількість статей"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Отримати найпопулярніші статті з урахуванням згасання переглядів у часі.
+    Рейтинг береться з періодично оновлюваного знімка, тож час відповіді залежить лише від limit.
+    
+    Args:
+        category_id: ID категорії.
+        limit: Максимальна кількість статей.
+        db: Асинхронна сесія бази даних.
+    
+    Returns:
+        list[schemas.TrendingArticleOut]: Статті з рейтингом за спаданням.
+    
+    Raises:
+        HTTPException: Якщо сталася помилка бази даних.
+    """
+    try:
+        ranking = trending.top(category_id, limit)
+        articles = await crud.get_article_headlines_async(db, [article_id for article_id, _ in ranking])
+        return [
+            schemas.TrendingArticleOut(
+                id=article_id, title=articles[article_id].title,
+                category_id=articles[article_id].category_id, score=score,
+            )
+            for article_id, score in ranking if article_id in articles
+        ]
+    except SQLAlchemyError:
+        raise HTTPException(status_code=500, detail="Помилка бази даних при отриманні популярних статей")
+
+@router.get("/export", response_class=StreamingResponse)
+def export_articles(
+    fmt: ExportFormat = Query(ExportFormat.NDJSON, alias="format", description="Формат вивантаження"),
+    created_from: Optional[datetime] = Query(None, description="Створені не раніше (включно)"),
+    created_to: Optional[datetime] = Query(None, description="Створені раніше (не включно)"),
+    category_id: Optional[int] = Query(None, ge=1, description="ID категорії"),
+    current_user: Principal = Depends(get_current_active_user)
+):
+    """
+    Потокове вивантаження статей у NDJSON або CSV.
+    Рядки читаються серверним курсором порціями, тож пам'ять не залежить від розміру таблиці.
+    
+    Args:
+        fmt: Формат вивантаження (ndjson або csv).
+        created_from: Початок діапазону дати створення.
+        created_to: Кінець діапазону дати створення.
+        category_id: ID категорії.
+        current_user: Аутентифікований користувач (admin або editor).
+    
+    Returns:
+        StreamingResponse: Файл вивантаження.
+    
+    Raises:
+        HTTPException: Якщо недостатньо прав.
+    """
+    if current_user.role not in ("admin", "editor"):
+        raise HTTPException(status_code=403, detail="Недостатньо прав для вивантаження статей")
+    stmt = crud.articles_export_stmt(created_from, created_to, category_id)
+    return export_response(stmt, crud.ARTICLE_EXPORT_COLUMNS, fmt, "articles")
+
 @router.get("/{article_id}", response_model=schemas.ArticleOut)
-def read_article(
+async def read_article(
+    request: Request,
     article_id: int = Path(..., ge=1, description="ID статті"),
-    db: Session = Depends(get_db)
+    response_model: Type[BaseModel] = Depends(get_article_response_model),
+    embed: Optional[schemas.ArticleEmbed] = Query(None, description="media — вбудувати медіа статті (лише для view=full)"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Отримати статтю за ID.
     
     Args:
+        request: Запит (категорія статті зберігається з відповіддю в кеші для рейтингу популярних).
         article_id: ID статті.
-        db: Сесія бази даних.
+        response_model: Схема відповіді за параметрами view/fields.
+        embed: media — додати до статті її медіа (завантажуються наперед разом зі статтею).
+        db: Асинхронна сесія бази даних.
     
     Returns:
-        schemas.ArticleOut: Стаття.
+        schemas.ArticleOut: Стаття (лише запитані поля); з embed=media — schemas.ArticleWithMediaOut.
     
     Raises:
-        HTTPException: Якщо статтю не знайдено або сталася помилка бази даних.
+        HTTPException: Якщо статтю не знайдено, embed поєднано з проєкцією або сталася помилка бази даних.
     """
+    if embed is not None and response_model is not schemas.ArticleOut:
+        raise HTTPException(status_code=400, detail="embed підтримується лише для повної статті (view=full без fields)")
+    if response_model is not schemas.ArticleOut:
+        found = await crud.get_article_row_async(db, article_id, response_model)
+        if not found:
+            raise HTTPException(status_code=404, detail="Статтю не знайдено")
+        row, category_id = found
+        record_view(article_id, category_id)
+        set_hit_context(request, category_id=category_id)
+        return ORJSONResponse(row)
     try:
-        article = crud.get_article(db, article_id)
+        if embed == schemas.ArticleEmbed.MEDIA:
+            response_model = schemas.ArticleWithMediaOut
+        article = await crud.get_article_async(db, article_id, response_model)
         if not article:
             raise HTTPException(status_code=404, detail="Статтю не знайдено")
-        article.view_count += 1
-        db.commit()
+        # Перегляд буферизується і записується в БД пакетом (див. app.articles.views)
+        record_view(article.id, article.category_id)
+        set_hit_context(request, category_id=article.category_id)
+        if response_model is schemas.ArticleWithMediaOut:
+            # response_model маршруту (ArticleOut) відкинув би поле media, тож серіалізуємо самі
+            return ORJSONResponse(response_model.model_validate(article).model_dump(mode="json"))
         return article
     except SQLAlchemyError:
         raise HTTPException(status_code=500, detail="Помилка бази даних при отриманні статті")
 
+@router.get("/{article_id}/media", response_model=List[MediaOut])
+async def read_article_media(
+    article_id: int = Path(..., ge=1, description="ID статті"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Отримати всі медіа статті одним запитом (замість окремого запиту на кожне зображення).
+    
+    Args:
+        article_id: ID статті.
+        db: Асинхронна сесія бази даних.
+    
+    Returns:
+        List[MediaOut]: Медіа статті в порядку додавання.
+    
+    Raises:
+        HTTPException: Якщо статтю не знайдено або сталася помилка бази даних.
+    """
+    media_items = await media_crud.get_article_media_async(db, article_id)
+    if media_items is None:
+        raise HTTPException(status_code=404, detail="Статтю не знайдено")
+    return media_items
+
+@router.get("/{article_id}/history/{version_num}", response_model=schemas.ArticleHistoryOut)
+async def read_article_version(
+    article_id: int = Path(..., ge=1, description="ID статті"),
+    version_num: int = Path(..., ge=1, description="Номер версії"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Отримати версію статті з історії редагувань.
+    Вміст відновлюється з найближчого знімка та різниць після нього.
+    
+    Args:
+        article_id: ID статті.
+        version_num: Номер версії.
+        db: Асинхронна сесія бази даних.
+    
+    Returns:
+        schemas.ArticleHistoryOut: Версія статті з повним вмістом.
+    
+    Raises:
+        HTTPException: Якщо версію не знайдено або сталася помилка бази даних.
+    """
+    try:
+        version = await get_article_version_async(db, article_id, version_num)
+    except SQLAlchemyError:
+        raise HTTPException(status_code=500, detail="Помилка бази даних при отриманні версії статті")
+    if version is None:
+        raise HTTPException(status_code=404, detail="Версію статті не знайдено")
+    return version
+
 @router.post("/", response_model=schemas.ArticleOut)
 def create_article(
     article_in: schemas.ArticleCreate,
     db: Session = Depends(get_db),
-    current_user: Author = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """
     Створити нову статтю.
@@ -94,12 +318,45 @@ def create_article(
     except SQLAlchemyError:
         raise HTTPException(status_code=500, detail="Помилка бази даних при створенні статті")
 
+@router.post("/import", response_model=schemas.ArticleImportReport)
+async def import_articles(
+    request: Request,
+    batch_size: Optional[int] = Query(None, ge=1, le=50000, description="Кількість рядків в одному пакеті вставки"),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_user)
+):
+    """
+    Пакетний імпорт статей з NDJSON (application/x-ndjson), по одній статті в рядку.
+    Тіло читається потоком; кожен пакет перевіряється кількома IN-запитами і вставляється однією транзакцією.
+    
+    Args:
+        request: Запит із тілом NDJSON.
+        batch_size: Кількість рядків в одному пакеті.
+        db: Сесія бази даних.
+        current_user: Аутентифікований користувач (admin або editor).
+    
+    Returns:
+        schemas.ArticleImportReport: Кількість імпортованих і відхилених рядків та помилки по рядках.
+    
+    Raises:
+        HTTPException: Якщо недостатньо прав.
+    """
+    if current_user.role not in ("admin", "editor"):
+        raise HTTPException(status_code=403, detail="Недостатньо прав для імпорту статей")
+    importer = ArticleImporter(db, batch_size)
+    line_no = 0
+    async for line in iter_ndjson_lines(request.stream()):
+        line_no += 1
+        if importer.add(line_no, line):
+            await run_in_threadpool(importer.flush)
+    return await run_in_threadpool(importer.finish)
+
 @router.put("/{article_id}", response_model=schemas.ArticleOut)
 def update_article(
     article_in: schemas.ArticleUpdate,
     article_id: int = Path(..., ge=1, description="ID статті"),
     db: Session = Depends(get_db),
-    current_user: Author = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """
     Оновити статтю.
@@ -130,7 +387,7 @@ def update_article(
 def delete_article(
     article_id: int = Path(..., ge=1, description="ID статті"),
     db: Session = Depends(get_db),
-    current_user: Author = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """
     Видалити статтю.
@@ -153,6 +410,7 @@ def delete_article(
         if current_user.role not in ("admin", "editor") and article.author_id != current_user.id:
             raise HTTPException(status_code=403, detail="Недостатньо прав для видалення статті")
         crud.delete_article(db, article)
+        trending.forget(article_id)
         return None
     except SQLAlchemyError:
         raise HTTPException(status_code=500, detail="Помилка бази даних при видаленні статті")
\ No newline at end of file
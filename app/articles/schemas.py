@@ -1,13 +1,27 @@
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from pydantic import BaseModel, Field, ConfigDict, create_model, field_validator
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Tuple, Type
+from functools import lru_cache
 from enum import Enum
+from app.media.schemas import MediaOut
 
 class ArticleAction(str, Enum):
     CREATED = "created"
     UPDATED = "updated"
     DELETED = "deleted"
 
+class ArticleView(str, Enum):
+    SUMMARY = "summary"
+    FULL = "full"
+
+class ArticleEmbed(str, Enum):
+    MEDIA = "media"
+
+class ArticleSort(str, Enum):
+    CREATED_AT = "created_at"
+    PUBLISHED_AT = "published_at"
+    VIEW_COUNT = "view_count"
+
 class ArticleBase(BaseModel):
     """
     Базова модель статті.
@@ -21,14 +35,16 @@ class ArticleBase(BaseModel):
 class ArticleCreate(ArticleBase):
     """
     Модель для створення статті.
-    Містить додаткові поля: ID автора, категорії, теги.
+    Містить додаткові поля: ID автора, категорії, типу контенту, теги.
     """
     author_id: int = Field(..., ge=1)
     category_id: int = Field(..., ge=1)
+    content_type_id: int = Field(..., ge=1)
     tag_ids: Optional[List[int]] = None
 
     @field_validator("tag_ids")
-    def validate_tag_ids(self, v: Optional[List[int]]) -> Optional[List[int]]:
+    @classmethod
+    def validate_tag_ids(cls, v: Optional[List[int]]) -> Optional[List[int]]:
         if v is not None and any(tag_id < 1 for tag_id in v):
             raise ValueError("Усі tag_ids повинні бути позитивними числами")
         return v
@@ -47,25 +63,115 @@ class ArticleUpdate(BaseModel):
     tag_ids: Optional[List[int]] = None
 
     @field_validator("tag_ids")
-    def validate_tag_ids(self, v: Optional[List[int]]) -> Optional[List[int]]:
+    @classmethod
+    def validate_tag_ids(cls, v: Optional[List[int]]) -> Optional[List[int]]:
         if v is not None and any(tag_id < 1 for tag_id in v):
             raise ValueError("Усі tag_ids повинні бути позитивними числами")
         return v
 
+class ArticleFilter(BaseModel):
+    """
+    Модель фільтрів і сортування списку статей.
+    Усі поля необов’язкові; діапазон дат публікації напіввідкритий [published_from, published_to).
+    """
+    category_id: Optional[int] = Field(None, ge=1)
+    author_id: Optional[int] = Field(None, ge=1)
+    content_type_id: Optional[int] = Field(None, ge=1)
+    tag_id: Optional[int] = Field(None, ge=1)
+    published_from: Optional[datetime] = None
+    published_to: Optional[datetime] = None
+    order_by: ArticleSort = ArticleSort.CREATED_AT
+
 class ArticleOut(ArticleBase):
     """
     Модель для виведення статті.
-    Містить додаткові поля з бази даних: ID, дати, автор, категорія, теги.
+    Містить додаткові поля з бази даних: ID, дати, автор, категорія, теги, кількість коментарів.
     """
     id: int
     author_id: int = Field(..., ge=1)
     category_id: int = Field(..., ge=1)
     tag_ids: Optional[List[int]] = None
+    comment_count: int = 0
     created_at: datetime
     updated_at: datetime
     published_at: Optional[datetime] = None
     model_config = ConfigDict(from_attributes=True)
 
+class ArticleWithMediaOut(ArticleOut):
+    """
+    Модель статті з вбудованими медіа (embed=media).
+    Медіа завантажуються разом зі статтею одним додатковим IN-запитом.
+    """
+    media: List[MediaOut] = Field(default_factory=list, validation_alias="media_items")
+
+class ArticleSummaryOut(BaseModel):
+    """
+    Модель картки статті для списків (view=summary).
+    Містить усі поля ArticleOut, крім повного вмісту.
+    """
+    id: int
+    title: str
+    description: Optional[str] = None
+    view_count: int = 0
+    author_id: int
+    category_id: int
+    tag_ids: Optional[List[int]] = None
+    comment_count: int = 0
+    created_at: datetime
+    published_at: Optional[datetime] = None
+    model_config = ConfigDict(from_attributes=True)
+
+@lru_cache(maxsize=256)
+def _article_projection(fields: Tuple[str, ...]) -> Type[BaseModel]:
+    return create_model(
+        "ArticleProjectionOut",
+        __config__=ConfigDict(from_attributes=True),
+        **{name: (ArticleOut.model_fields[name].annotation, ArticleOut.model_fields[name]) for name in fields},
+    )
+
+def article_response_model(view: ArticleView = ArticleView.FULL, fields: Optional[str] = None) -> Type[BaseModel]:
+    """
+    Схема відповіді для вибраного представлення або переліку полів.
+    
+    Args:
+        view: summary — картка без вмісту, full — повна стаття.
+        fields: Поля ArticleOut через кому; має пріоритет над view. id додається завжди.
+    
+    Returns:
+        Type[BaseModel]: Схема, поля якої визначають колонки SELECT.
+    
+    Raises:
+        ValueError: Якщо передано невідомі поля.
+    """
+    if fields:
+        requested = {name.strip() for name in fields.split(",") if name.strip()}
+        unknown = requested - set(ArticleOut.model_fields)
+        if unknown:
+            raise ValueError(f"Невідомі поля: {', '.join(sorted(unknown))}")
+        requested.add("id")
+        return _article_projection(tuple(name for name in ArticleOut.model_fields if name in requested))
+    return ArticleSummaryOut if view == ArticleView.SUMMARY else ArticleOut
+
+class ArticleSearchHit(BaseModel):
+    """
+    Модель результату повнотекстового пошуку.
+    Містить ID і заголовок статті, ранг релевантності та фрагмент із виділеними збігами.
+    """
+    id: int
+    title: str
+    rank: float
+    snippet: str
+
+class TrendingArticleOut(BaseModel):
+    """
+    Модель статті в рейтингу популярних.
+    Містить ID, заголовок, категорію та рейтинг із часовим згасанням.
+    """
+    id: int
+    title: str
+    category_id: int
+    score: float
+
 class ArticleHistoryOut(BaseModel):
     """
     Модель для історії редагувань статті.
@@ -78,4 +184,29 @@ class ArticleHistoryOut(BaseModel):
     content: Optional[str]
     edited_at: datetime
     action: Optional[ArticleAction] = None
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ArticleImportRow(ArticleCreate):
+    """
+    Рядок NDJSON для пакетного імпорту статей.
+    Окрім полів ArticleCreate містить дату публікації.
+    """
+    published_at: Optional[datetime] = None
+
+class ArticleImportError(BaseModel):
+    """
+    Помилка імпорту окремого рядка NDJSON.
+    """
+    line: int
+    error: str
+
+class ArticleImportReport(BaseModel):
+    """
+    Звіт пакетного імпорту статей.
+    Містить кількість оброблених, імпортованих і відхилених рядків та помилки по рядках.
+    """
+    total: int = 0
+    imported: int = 0
+    failed: int = 0
+    errors: List[ArticleImportError] = Field(default_factory=list)
@@ -0,0 +1,198 @@
+import bisect
+import math
+import re
+import threading
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func, literal_column, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.articles.models import Article
+
+# Конфігурація текстового пошуку PostgreSQL. 'simple' не застосовує стемінг, тож однаково
+# працює для української та англійської; має збігатися з виразом GIN-індексу в міграції.
+TS_CONFIG = "simple"
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_STOP = "</mark>"
+SNIPPET_WORDS = 30
+HEADLINE_OPTIONS = f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, MaxWords={SNIPPET_WORDS}, MinWords=10"
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(value: Optional[str]) -> List[str]:
+    """Розбити текст на слова в нижньому регістрі."""
+    return _WORD_RE.findall(value.lower()) if value else []
+
+
+def search_document():
+    """Вираз tsvector статті; ідентичний виразу індексу ix_articles_search."""
+    return func.to_tsvector(
+        literal_column(f"'{TS_CONFIG}'"),
+        # Літерали замість параметрів, щоб вираз запиту збігався з виразом індексу
+        func.coalesce(Article.title, literal_column("''")).concat(literal_column("' '"))
+        .concat(func.coalesce(Article.content, literal_column("''"))),
+    )
+
+
+def to_prefix_tsquery(terms: List[str]) -> str:
+    """Побудувати tsquery, де кожне слово шукається як префікс: 'сві:* & нов:*'."""
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+class InvertedIndex:
+    """
+    Інвертований індекс статей у пам'яті процесу — запасний варіант для SQLite (тести, розробка).
+    Зберігає відсортований словник термів для префіксного пошуку через bisect.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.ready = False
+        self._postings: Dict[str, Dict[int, int]] = defaultdict(dict)
+        self._terms: List[str] = []
+        self._docs: Dict[int, Tuple[str, str]] = {}
+        self._doc_terms: Dict[int, Counter] = {}
+
+    def add(self, article_id: int, title: str, content: str) -> None:
+        """Додати або переіндексувати статтю."""
+        with self._lock:
+            self._remove(article_id)
+            counts = Counter(tokenize(title) + tokenize(content))
+            for term, tf in counts.items():
+                postings = self._postings[term]
+                if not postings:
+                    bisect.insort(self._terms, term)
+                postings[article_id] = tf
+            self._docs[article_id] = (title, content)
+            self._doc_terms[article_id] = counts
+
+    def remove(self, article_id: int) -> None:
+        """Прибрати статтю з індексу."""
+        with self._lock:
+            self._remove(article_id)
+
+    def _remove(self, article_id: int) -> None:
+        counts = self._doc_terms.pop(article_id, None)
+        if counts is None:
+            return
+        self._docs.pop(article_id, None)
+        for term in counts:
+            postings = self._postings[term]
+            postings.pop(article_id, None)
+            if not postings:
+                del self._postings[term]
+                index = bisect.bisect_left(self._terms, term)
+                if index < len(self._terms) and self._terms[index] == term:
+                    self._terms.pop(index)
+
+    def _expand(self, prefix: str) -> Iterable[str]:
+        start = bisect.bisect_left(self._terms, prefix)
+        for term in self._terms[start:]:
+            if not term.startswith(prefix):
+                break
+            yield term
+
+    def search(self, terms: List[str], limit: int, offset: int = 0) -> List[Tuple[int, float, str, str]]:
+        """
+        Знайти статті, що містять усі префікси з запиту, упорядковані за tf-idf.
+
+        Returns:
+            List[Tuple[int, float, str, str]]: (id, ранг, заголовок, вміст).
+        """
+        with self._lock:
+            total = len(self._docs) or 1
+            scores: Optional[Dict[int, float]] = None
+            for prefix in terms:
+                term_scores: Dict[int, float] = defaultdict(float)
+                for term in self._expand(prefix):
+                    postings = self._postings[term]
+                    idf = math.log(1 + total / len(postings))
+                    for article_id, tf in postings.items():
+                        term_scores[article_id] += tf * idf
+                if scores is None:
+                    scores = term_scores
+                else:
+                    scores = {aid: score + term_scores[aid] for aid, score in scores.items() if aid in term_scores}
+                if not scores:
+                    return []
+            ranked = sorted((scores or {}).items(), key=lambda item: (-item[1], -item[0]))[offset:offset + limit]
+            return [(aid, score, *self._docs[aid]) for aid, score in ranked]
+
+
+def highlight(content: str, terms: List[str], words: int = SNIPPET_WORDS) -> str:
+    """Вирізати фрагмент навколо першого збігу та виділити слова, що починаються з термів запиту."""
+    tokens = (content or "").split()
+    if not tokens:
+        return ""
+
+    def matches(token: str) -> bool:
+        word = tokenize(token)
+        return bool(word) and any(word[0].startswith(term) for term in terms)
+
+    first = next((i for i, token in enumerate(tokens) if matches(token)), 0)
+    start = max(first - words // 3, 0)
+    window = tokens[start:start + words]
+    return " ".join(f"{HIGHLIGHT_START}{token}{HIGHLIGHT_STOP}" if matches(token) else token for token in window)
+
+
+search_index = InvertedIndex()
+
+
+async def _search_postgres(db: AsyncSession, terms: List[str], limit: int, offset: int) -> List[dict]:
+    query = func.to_tsquery(literal_column(f"'{TS_CONFIG}'"), to_prefix_tsquery(terms))
+    rank = func.ts_rank_cd(search_document(), query).label("rank")
+    page = (
+        select(Article.id, Article.title, Article.content, rank)
+        .where(search_document().op("@@")(query))
+        .order_by(rank.desc(), Article.id.desc())
+        .offset(offset)
+        .limit(limit)
+        .subquery()
+    )
+    # ts_headline дорогий, тому рахуємо його лише для рядків поточної сторінки
+    snippet = func.ts_headline(
+        literal_column(f"'{TS_CONFIG}'"), page.c.content, query, text(f"'{HEADLINE_OPTIONS}'")
+    ).label("snippet")
+    stmt = (
+        select(page.c.id, page.c.title, page.c.rank, snippet)
+        .order_by(page.c.rank.desc(), page.c.id.desc())
+    )
+    result = await db.execute(stmt)
+    return [dict(row._mapping) for row in result]
+
+
+async def _ensure_index(db: AsyncSession) -> None:
+    if search_index.ready:
+        return
+    result = await db.stream(select(Article.id, Article.title, Article.content))
+    async for article_id, title, content in result:
+        search_index.add(article_id, title, content)
+    search_index.ready = True
+
+
+async def search_articles_async(db: AsyncSession, q: str, limit: int = 20, offset: int = 0) -> List[dict]:
+    """
+    Повнотекстовий пошук статей із ранжуванням, префіксним збігом і виділеними фрагментами.
+    На PostgreSQL використовує GIN-індекс за tsvector, на інших СУБД — інвертований індекс у пам'яті.
+
+    Args:
+        db: Асинхронна сесія бази даних.
+        q: Пошуковий запит.
+        limit: Максимальна кількість результатів.
+        offset: Кількість пропущених результатів.
+
+    Returns:
+        List[dict]: Результати з полями id, title, rank, snippet.
+    """
+    terms = tokenize(q)
+    if not terms:
+        return []
+    if db.bind.dialect.name == "postgresql":
+        return await _search_postgres(db, terms, limit, offset)
+    await _ensure_index(db)
+    return [
+        {"id": aid, "title": title, "rank": rank, "snippet": highlight(content, terms)}
+        for aid, rank, title, content in search_index.search(terms, limit, offset)
+    ]
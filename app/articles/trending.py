@@ -0,0 +1,107 @@
+import heapq
+import math
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+# Після скількох періодів напіврозпаду перераховувати базовий час, щоб експонента не переповнилась
+REBASE_HALF_LIVES = 50
+# Статті з рейтингом нижче цього порогу забуваються при оновленні
+MIN_SCORE = 0.01
+
+
+class TrendingTracker:
+    """
+    Рейтинг популярних статей із часовим згасанням.
+
+    Кожен перегляд додає exp(ln2 * (t - t0) / half_life) до накопиченого значення статті, тож
+    старі перегляди не треба перераховувати: поточний рейтинг — це значення, помножене на
+    exp(-ln2 * (now - t0) / half_life), і порядок статей від цього множника не залежить.
+    Топ-N загалом і для кожної категорії періодично знімається в незмінні знімки,
+    тож відповідь ендпоінта коштує O(N) незалежно від розміру таблиці.
+    """
+
+    def __init__(self, half_life: float = 6 * 3600, top_n: int = 50, refresh_interval: float = 30.0) -> None:
+        self.half_life = half_life
+        self.top_n = top_n
+        self.refresh_interval = refresh_interval
+        self._decay = math.log(2) / half_life
+        self._lock = threading.Lock()
+        self._t0 = time.time()
+        self._values: Dict[int, float] = {}
+        self._categories: Dict[int, int] = {}
+        # Знімки: None — загальний рейтинг, інакше category_id -> [(article_id, score), ...]
+        self._snapshots: Dict[Optional[int], List[Tuple[int, float]]] = {}
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def record(self, article_id: int, category_id: Optional[int] = None, n: int = 1) -> None:
+        """Врахувати перегляд статті; category_id запам'ятовується для рейтингу категорії."""
+        now = time.time()
+        with self._lock:
+            if category_id is not None:
+                self._categories[article_id] = category_id
+            self._values[article_id] = self._values.get(article_id, 0.0) + n * math.exp(self._decay * (now - self._t0))
+
+    def forget(self, article_id: int) -> None:
+        """Прибрати статтю з рейтингу (наприклад, після видалення)."""
+        with self._lock:
+            self._values.pop(article_id, None)
+            self._categories.pop(article_id, None)
+
+    def refresh(self) -> None:
+        """Перерахувати знімки топ-N і відкинути статті, рейтинг яких згас."""
+        now = time.time()
+        with self._lock:
+            scale = math.exp(-self._decay * (now - self._t0))
+            if (now - self._t0) / self.half_life > REBASE_HALF_LIVES:
+                self._values = {aid: value * scale for aid, value in self._values.items()}
+                self._t0, scale = now, 1.0
+            threshold = MIN_SCORE / scale
+            for article_id in [aid for aid, value in self._values.items() if value < threshold]:
+                del self._values[article_id]
+                self._categories.pop(article_id, None)
+            values = list(self._values.items())
+            categories = dict(self._categories)
+        by_category: Dict[Optional[int], List[Tuple[int, float]]] = {None: values}
+        for article_id, value in values:
+            category_id = categories.get(article_id)
+            if category_id is not None:
+                by_category.setdefault(category_id, []).append((article_id, value))
+        snapshots = {
+            key: [(aid, value * scale) for aid, value in heapq.nlargest(self.top_n, items, key=lambda item: item[1])]
+            for key, items in by_category.items()
+        }
+        self._snapshots = snapshots
+
+    def top(self, category_id: Optional[int] = None, limit: Optional[int] = None) -> List[Tuple[int, float]]:
+        """Останній знімок рейтингу: [(article_id, score), ...] за спаданням."""
+        snapshot = self._snapshots.get(category_id, [])
+        return snapshot[:limit] if limit else list(snapshot)
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.refresh_interval):
+            self.refresh()
+
+    def start(self) -> None:
+        """Запустити фонове оновлення знімків."""
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="trending", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+trending = TrendingTracker(
+    half_life=settings.TRENDING_HALF_LIFE_HOURS * 3600,
+    top_n=settings.TRENDING_TOP_N,
+    refresh_interval=settings.TRENDING_REFRESH_INTERVAL,
+)
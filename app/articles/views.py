@@ -0,0 +1,174 @@
+import logging
+import threading
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import Callable, Dict, Optional
+
+from sqlalchemy import bindparam, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.articles.models import Article
+from app.articles.trending import trending
+from app.core.config import settings
+from app.db.database import SessionLocal
+
+logger = logging.getLogger("uvicorn")
+
+
+class ViewCountStore(ABC):
+    """
+    Базове сховище накопичених переглядів.
+    Реалізації мають бути потокобезпечними: record викликається з потоків обробки запитів.
+    """
+
+    @abstractmethod
+    def add(self, article_id: int, n: int = 1) -> int:
+        """
+        Додати n переглядів до статті.
+
+        Returns:
+            int: Загальна кількість переглядів, що очікують запису.
+        """
+
+    @abstractmethod
+    def drain(self) -> Dict[int, int]:
+        """Забрати всі накопичені перегляди та очистити сховище."""
+
+    @abstractmethod
+    def pending(self) -> int:
+        """Кількість переглядів, що очікують запису."""
+
+
+class InMemoryViewCountStore(ViewCountStore):
+    """
+    Сховище переглядів у пам'яті процесу.
+    Перегляди однієї статті зливаються в один лічильник.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts: Counter = Counter()
+        self._pending = 0
+
+    def add(self, article_id: int, n: int = 1) -> int:
+        with self._lock:
+            self._counts[article_id] += n
+            self._pending += n
+            return self._pending
+
+    def drain(self) -> Dict[int, int]:
+        with self._lock:
+            counts, self._counts = self._counts, Counter()
+            self._pending = 0
+        return dict(counts)
+
+    def pending(self) -> int:
+        with self._lock:
+            return self._pending
+
+
+class ViewCounter:
+    """
+    Буферизований лічильник переглядів статей.
+    Накопичує перегляди у сховищі та періодично записує їх у БД одним пакетним
+    UPDATE ... SET view_count = view_count + n замість коміту на кожен GET.
+    """
+
+    def __init__(
+        self,
+        store: Optional[ViewCountStore] = None,
+        session_factory: Callable[[], Session] = SessionLocal,
+        flush_interval: float = 5.0,
+        flush_size: int = 1000,
+    ) -> None:
+        self.store = store or InMemoryViewCountStore()
+        self.session_factory = session_factory
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def record(self, article_id: int, n: int = 1) -> None:
+        """
+        Зареєструвати перегляд статті.
+        Якщо буфер досяг flush_size, фоновий потік записує його позачергово.
+        """
+        if self.store.add(article_id, n) >= self.flush_size:
+            self._wakeup.set()
+
+    def flush(self) -> int:
+        """
+        Записати накопичені перегляди в БД.
+
+        Returns:
+            int: Кількість статей, для яких оновлено лічильник.
+        """
+        with self._flush_lock:
+            counts = self.store.drain()
+            if not counts:
+                return 0
+            table = Article.__table__
+            stmt = (
+                update(table)
+                .where(table.c.id == bindparam("b_id"))
+                .values(view_count=table.c.view_count + bindparam("b_n"))
+            )
+            params = [{"b_id": article_id, "b_n": n} for article_id, n in counts.items()]
+            db = self.session_factory()
+            try:
+                db.execute(stmt, params)
+                db.commit()
+            except SQLAlchemyError:
+                db.rollback()
+                # Повертаємо перегляди в буфер, щоб не втратити їх до наступної спроби
+                for article_id, n in counts.items():
+                    self.store.add(article_id, n)
+                logger.exception("Не вдалося записати лічильники переглядів")
+                return 0
+            finally:
+                db.close()
+            return len(counts)
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def start(self) -> None:
+        """Запустити фоновий потік періодичного запису."""
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="view-counter", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Зупинити фоновий потік і записати залишок буфера."""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+
+view_counter = ViewCounter(
+    flush_interval=settings.VIEW_COUNT_FLUSH_INTERVAL,
+    flush_size=settings.VIEW_COUNT_FLUSH_SIZE,
+)
+
+
+def record_view(article_id: int, category_id: Optional[int] = None) -> None:
+    """
+    Зареєструвати перегляд статті: у буферизованому лічильнику і в рейтингу популярних.
+
+    Args:
+        article_id: ID статті.
+        category_id: ID категорії статті, якщо відомий (для рейтингу категорії).
+    """
+    view_counter.record(article_id)
+    trending.record(article_id, category_id)
@@ -0,0 +1,76 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from app.core.config import settings
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """
+    Легковаговий незмінний образ автентифікованого користувача.
+    Містить лише поля, потрібні для перевірки прав.
+    """
+    id: int
+    role: str
+    is_active: bool
+
+
+class PrincipalCache:
+    """
+    Обмежений LRU-кеш принципалів із TTL.
+    Дозволяє get_current_user не звертатися до БД на кожен автентифікований запит;
+    TTL задає максимальне вікно застарілості, якщо інвалідація не спрацювала (інший воркер).
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: float = 30.0) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._items: "OrderedDict[int, tuple[float, Principal]]" = OrderedDict()
+
+    def get(self, user_id: int) -> Optional[Principal]:
+        """Повернути принципала з кешу або None, якщо його немає чи він застарів."""
+        now = time.monotonic()
+        with self._lock:
+            item = self._items.get(user_id)
+            if item is None or item[0] < now:
+                if item is not None:
+                    del self._items[user_id]
+                self.misses += 1
+                return None
+            self._items.move_to_end(user_id)
+            self.hits += 1
+            return item[1]
+
+    def put(self, principal: Principal) -> None:
+        """Зберегти принципала, витісняючи найдавніше використаний запис."""
+        with self._lock:
+            self._items[principal.id] = (time.monotonic() + self.ttl, principal)
+            self._items.move_to_end(principal.id)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        """Видалити користувача з кешу (після зміни чи видалення)."""
+        with self._lock:
+            self._items.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Лічильники влучань і промахів кешу."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._items)}
+
+
+principal_cache = PrincipalCache(
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL,
+)
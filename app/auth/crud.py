@@ -1,6 +1,7 @@
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
 from typing import Optional
 from app.auth import schemas, utils
 from app.authors import models  # модуль з Author
@@ -24,6 +25,25 @@ def get_user_by_email(db: Session, email: str) -> Optional[models.Author]:
     except SQLAlchemyError:
         raise HTTPException(status_code=500, detail="Помилка бази даних при пошуку користувача")
 
+def get_user_by_name(db: Session, name: str) -> Optional[models.Author]:
+    """
+    Знайти користувача (Author) за ім’ям.
+    
+    Args:
+        db: Сесія бази даних.
+        name: Ім’я користувача.
+    
+    Returns:
+        Optional[models.Author]: Користувач або None, якщо не знайдено.
+    
+    Raises:
+        HTTPException: Якщо сталася помилка бази даних.
+    """
+    try:
+        return db.query(models.Author).filter(models.Author.name == name).first()
+    except SQLAlchemyError:
+        raise HTTPException(status_code=500, detail="Помилка бази даних при пошуку користувача")
+
 def get_user_by_id(db: Session, user_id: int) -> Optional[models.Author]:
     """
     Знайти користувача (Author) за ID.
@@ -43,13 +63,14 @@ def get_user_by_id(db: Session, user_id: int) -> Optional[models.Author]:
     except SQLAlchemyError:
         raise HTTPException(status_code=500, detail="Помилка бази даних при пошуку користувача")
 
-def create_user(db: Session, user_in: schemas.UserCreate) -> models.Author:
+def create_user(db: Session, user_in: schemas.UserCreate, hashed_password: Optional[str] = None) -> models.Author:
     """
     Створити нового користувача (Author) з роллю 'user' за замовчуванням.
     
     Args:
         db: Сесія бази даних.
         user_in: Дані для створення користувача (email, ім’я, пароль, біографія).
+        hashed_password: Заздалегідь обчислений хеш пароля (з пулу хешування); якщо None, хешується тут.
     
     Returns:
         models.Author: Створений користувач.
@@ -60,7 +81,8 @@ def create_user(db: Session, user_in: schemas.UserCreate) -> models.Author:
     try:
         if db.query(models.Author).filter(models.Author.name == user_in.name).first():
             raise HTTPException(status_code=400, detail="Користувач з таким ім'ям уже існує")
-        hashed_password = utils.get_password_hash(user_in.password)
+        if hashed_password is None:
+            hashed_password = utils.get_password_hash(user_in.password)
         author = models.Author(
             email=user_in.email,
             name=user_in.name,
@@ -102,4 +124,27 @@ def authenticate_user(db: Session, email: str, password: str) -> Optional[models
             return None
         return author
     except SQLAlchemyError:
-        raise HTTPException(status_code=500, detail="Помилка бази даних при аутентифікації")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Помилка бази даних при аутентифікації")
+
+async def authenticate_user_async(db: Session, email: str, password: str) -> Optional[models.Author]:
+    """
+    Аутентифікувати користувача, виконуючи перевірку bcrypt у пулі хешування.
+    Запит до БД виконується в пулі потоків, тож цикл подій не блокується.
+    
+    Args:
+        db: Сесія бази даних.
+        email: Email користувача.
+        password: Пароль користувача.
+    
+    Returns:
+        Optional[models.Author]: Користувач, якщо аутентифікація успішна, інакше None.
+    
+    Raises:
+        HTTPException: Якщо сталася помилка бази даних або пул хешування перевантажений.
+    """
+    author = await run_in_threadpool(get_user_by_email, db, email)
+    if not author or not author.is_active:
+        return None
+    if not await utils.verify_password_async(password, author.hashed_password):
+        return None
+    return author
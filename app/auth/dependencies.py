@@ -6,20 +6,21 @@ from sqlalchemy.exc import SQLAlchemyError
 from app.core.config import settings
 from app.db.database import get_db
 from app.auth import crud
-from app.authors.models import Author
+from app.auth.cache import Principal, principal_cache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> Author:
+def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> Principal:
     """
     Отримати поточного користувача за JWT-токеном.
+    Користувач береться з кешу принципалів; до БД звертаємось лише при промаху.
     
     Args:
         token: JWT-токен із заголовка Authorization.
         db: Сесія бази даних.
     
     Returns:
-        Author: Аутентифікований користувач.
+        Principal: Аутентифікований користувач (id, роль, активність).
     
     Raises:
         HTTPException: Якщо токен недійсний, користувача не знайдено або сталася помилка бази даних.
@@ -38,14 +39,19 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
     except JWTError:
         raise credentials_exception
     try:
+        principal = principal_cache.get(int(user_id))
+        if principal is not None:
+            return principal
         user = crud.get_user_by_id(db, user_id=int(user_id))
         if not user:
             raise credentials_exception
-        return user
+        principal = Principal(id=user.id, role=user.role, is_active=user.is_active)
+        principal_cache.put(principal)
+        return principal
     except (ValueError, SQLAlchemyError):
         raise credentials_exception
 
-def get_current_active_user(current_user: Author = Depends(get_current_user)) -> Author:
+def get_current_active_user(current_user: Principal = Depends(get_current_user)) -> Principal:
     """
     Отримати поточного активного користувача.
     
@@ -53,7 +59,7 @@ def get_current_active_user(current_user: Author = Depends(get_current_user)) ->
         current_user: Аутентифікований користувач.
     
     Returns:
-        Author: Активний користувач.
+        Principal: Активний користувач.
     
     Raises:
         HTTPException: Якщо користувач неактивний.
@@ -1,17 +1,19 @@
 from fastapi import APIRouter, Depends, HTTPException, Path, Body
+from fastapi.concurrency import run_in_threadpool
 from jose import JWTError, jwt
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from app.auth import schemas, crud, utils
 from app.db.database import get_db
 from app.auth.dependencies import get_current_user, get_current_active_user
+from app.auth.cache import Principal
 from app.core.config import settings
 from app.authors.models import Author
 
 router = APIRouter()
 
 @router.post("/register", response_model=schemas.UserOut)
-def register(user_in: schemas.UserCreate, db: Session = Depends(get_db)):
+async def register(user_in: schemas.UserCreate, db: Session = Depends(get_db)):
     """
     Реєстрація нового користувача.
     
@@ -23,18 +25,26 @@ def register(user_in: schemas.UserCreate, db: Session = Depends(get_db)):
         schemas.UserOut: Створений користувач.
     
     Raises:
-        HTTPException: Якщо email уже існує або сталася помилка бази даних.
+        HTTPException: Якщо email чи ім’я уже існують, пароль не підходить для bcrypt
+            або сталася помилка бази даних.
     """
     try:
-        existing_user = crud.get_user_by_email(db, email=user_in.email)
-        if existing_user:
+        # Дублікати відхиляються до хешування, щоб не займати місце в пулі bcrypt
+        if await run_in_threadpool(crud.get_user_by_email, db, email=user_in.email):
             raise HTTPException(status_code=400, detail="Користувач з таким email уже існує")
-        return crud.create_user(db, user_in)  # created_by встановлюється в crud
+        if await run_in_threadpool(crud.get_user_by_name, db, name=user_in.name):
+            raise HTTPException(status_code=400, detail="Користувач з таким ім'ям уже існує")
+        # bcrypt виконується в окремому пулі, не займаючи потік обробника запитів
+        try:
+            hashed_password = await utils.get_password_hash_async(user_in.password)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+        return await run_in_threadpool(crud.create_user, db, user_in, hashed_password)  # created_by встановлюється в crud
     except SQLAlchemyError:
         raise HTTPException(status_code=500, detail="Помилка бази даних при реєстрації")
 
 @router.post("/login", response_model=schemas.Token)
-def login(form_data: utils.OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+async def login(form_data: utils.OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
     """
     Аутентифікація користувача за email і паролем.
     
@@ -49,7 +59,7 @@ def login(form_data: utils.OAuth2PasswordRequestForm = Depends(), db: Session =
         HTTPException: Якщо логін/пароль невірні або сталася помилка бази даних.
     """
     try:
-        user: Author = crud.authenticate_user(db, form_data.username, form_data.password)
+        user: Author = await crud.authenticate_user_async(db, form_data.username, form_data.password)
         if not user:
             raise HTTPException(status_code=401, detail="Невірний логін або пароль")
         access_token = utils.create_access_token(data={"sub": str(user.id)})
@@ -59,17 +69,24 @@ def login(form_data: utils.OAuth2PasswordRequestForm = Depends(), db: Session =
         raise HTTPException(status_code=500, detail="Помилка бази даних при аутентифікації")
 
 @router.get("/me", response_model=schemas.UserOut)
-def read_current_user(current_user: schemas.UserOut = Depends(get_current_user)):
+def read_current_user(current_user: Principal = Depends(get_current_user), db: Session = Depends(get_db)):
     """
     Отримати дані поточного користувача.
     
     Args:
         current_user: Аутентифікований користувач.
+        db: Сесія бази даних.
     
     Returns:
         schemas.UserOut: Дані користувача.
+    
+    Raises:
+        HTTPException: Якщо користувача не знайдено.
     """
-    return current_user
+    user = crud.get_user_by_id(db, user_id=current_user.id)
+    if not user:
+        raise HTTPException(status_code=401, detail="Користувача не знайдено")
+    return user
 
 @router.post("/refresh", response_model=schemas.Token)
 def refresh_token(refresh_token: str = Body(..., embed=True, alias="refresh_token"), db: Session = Depends(get_db)):
@@ -23,10 +23,12 @@ class UserCreate(UserBase):
     Модель для створення користувача.
     Містить пароль із валідацією.
     """
-    password: str = Field(..., min_length=8)
+    # bcrypt приймає не більше 72 байтів; пароль допускає лише ASCII, тож це 72 символи
+    password: str = Field(..., min_length=8, max_length=72)
 
     @field_validator("password")
-    def validate_password(self, v: str) -> str:
+    @classmethod
+    def validate_password(cls, v: str) -> str:
         if not re.match(r"^(?=.*[A-Z])(?=.*\d)(?=.*[@$!%*?&])[A-Za-z\d@$!%*?&]{8,}$", v):
             raise ValueError("Пароль повинен містити принаймні одну велику літеру, цифру та спеціальний символ")
         return v
@@ -1,12 +1,50 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from jose import jwt, JWTError
 from passlib.context import CryptContext
+from fastapi import HTTPException
 from fastapi.security import OAuth2PasswordRequestForm
-from typing import TypedDict
+from typing import Any, Callable, TypedDict
 
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS)
+
+class PasswordHashPool:
+    """
+    Обмежений пул потоків для bcrypt.
+    bcrypt звільняє GIL, тож окремі потоки не блокують цикл подій і пул обробників запитів;
+    якщо черга переповнена, запит одразу отримує 503 замість очікування.
+    """
+
+    def __init__(self, workers: int, queue_limit: int) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+        self._slots = threading.BoundedSemaphore(workers + queue_limit)
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Виконати функцію хешування в пулі.
+        
+        Raises:
+            HTTPException: 503, якщо досягнуто ліміт черги.
+        """
+        if not self._slots.acquire(blocking=False):
+            raise HTTPException(
+                status_code=503,
+                detail="Сервер перевантажений запитами автентифікації, спробуйте пізніше",
+                headers={"Retry-After": "1"},
+            )
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        finally:
+            self._slots.release()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+password_hash_pool = PasswordHashPool(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_QUEUE_LIMIT)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
@@ -38,6 +76,25 @@ def get_password_hash(password: str) -> str:
         raise ValueError("Пароль занадто довгий для bcrypt (максимум 72 байти)")
     return pwd_context.hash(password)
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Асинхронна обгортка verify_password, що виконує bcrypt у пулі password_hash_pool.
+    
+    Raises:
+        HTTPException: 503, якщо пул хешування перевантажений.
+    """
+    return await password_hash_pool.run(verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    Асинхронна обгортка get_password_hash, що виконує bcrypt у пулі password_hash_pool.
+    
+    Raises:
+        ValueError: Якщо пароль занадто довгий для bcrypt.
+        HTTPException: 503, якщо пул хешування перевантажений.
+    """
+    return await password_hash_pool.run(get_password_hash, password)
+
 class TokenData(TypedDict):
     sub: str
 
@@ -106,6 +163,9 @@ def create_refresh_token(data: TokenData) -> str:
 __all__ = [
     "verify_password",
     "get_password_hash",
+    "verify_password_async",
+    "get_password_hash_async",
+    "password_hash_pool",
     "create_access_token",
     "create_refresh_token",
     "OAuth2PasswordRequestForm",
@@ -1,27 +1,36 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from fastapi import HTTPException
 from typing import List, Optional, Any
 from app.authors import models, schemas
 from app.articles.models import Article  # Імпорт для перевірки статей
+from app.core.pagination import apply_keyset
+from app.auth.cache import principal_cache
 
-def get_authors(db: Session, skip: int = 0, limit: int = 100) -> List[models.Author]:
+AUTHOR_CURSOR_ATTRS = ("id",)
+
+def get_authors(db: Session, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[models.Author]:
     """
     Повертає список всіх авторів з пагінацією.
     
     Args:
         db: Сесія бази даних.
-        skip: Кількість авторів для пропуску (для пагінації).
+        skip: Кількість авторів для пропуску (ігнорується, якщо передано cursor).
         limit: Максимальна кількість авторів (для пагінації).
+        cursor: Курсор наступної сторінки (keyset-пагінація).
     
     Returns:
         List[models.Author]: Список авторів.
     
     Raises:
-        HTTPException: Якщо сталася помилка бази даних.
+        HTTPException: Якщо сталася помилка бази даних або курсор некоректний.
     """
+    stmt = apply_keyset(select(models.Author), (models.Author.id,), cursor, (int,))
+    if not cursor:
+        stmt = stmt.offset(skip)
     try:
-        return db.query(models.Author).offset(skip).limit(limit).all()
+        return list(db.execute(stmt.limit(limit)).scalars().all())
     except SQLAlchemyError:
         raise HTTPException(status_code=500, detail="Помилка бази даних при отриманні авторів")
 
@@ -96,6 +105,7 @@ def update_author(db: Session, author: models.Author, author_in: schemas.AuthorU
         for key, value in update_data.items():
             setattr(author, key, value)
         db.commit()
+        principal_cache.invalidate(author.id)
         db.refresh(author)
         return author
     except SQLAlchemyError:
@@ -120,6 +130,7 @@ def delete_author(db: Session, author: models.Author) -> None:
             raise HTTPException(status_code=400, detail="Неможливо видалити автора, який має статті")
         db.delete(author)
         db.commit()
+        principal_cache.invalidate(author.id)
     except SQLAlchemyError:
         db.rollback()
         raise HTTPException(status_code=500, detail="Помилка бази даних при видаленні автора")
\ No newline at end of file
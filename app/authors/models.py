@@ -19,9 +19,10 @@ class Author(Base):
     bio: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     role: Mapped[str] = mapped_column(String(10), default="user", nullable=False, index=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now, onupdate=func.now)
-    created_by: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now())
+    # Для самореєстрації заповнюється власним id після вставки, тому допускає NULL
+    created_by: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("authors.id"), nullable=True)
     
     # Зв’язки (relations):
     articles: Mapped[List["Article"]] = relationship("Article", back_populates="author", cascade="all, delete-orphan")
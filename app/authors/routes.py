@@ -4,6 +4,7 @@ from fastapi import HTTPException
 from typing import List, Optional, Any
 from app.authors import models, schemas
 from app.articles.models import Article
+from app.auth.cache import principal_cache
 
 def get_authors(db: Session, skip: int = 0, limit: int = 100) -> List[models.Author]:
     """
@@ -96,6 +97,7 @@ def update_author(db: Session, author: models.Author, author_in: schemas.AuthorU
         for key, value in update_data.items():
             setattr(author, key, value)
         db.commit()
+        principal_cache.invalidate(author.id)
         db.refresh(author)
         return author
     except SQLAlchemyError:
@@ -120,6 +122,7 @@ def delete_author(db: Session, author: models.Author) -> None:
             raise HTTPException(status_code=400, detail="Неможливо видалити автора, який має статті")
         db.delete(author)
         db.commit()
+        principal_cache.invalidate(author.id)
     except SQLAlchemyError:
         db.rollback()
         raise HTTPException(status_code=500, detail="Помилка бази даних при видаленні автора")
\ No newline at end of file
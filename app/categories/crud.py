@@ -1,24 +1,30 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 from fastapi import HTTPException
 from typing import List, Optional, Any
 from app.categories import models, schemas
 from app.articles.models import Article  # Імпорт Article для перевірки
+from app.core.http_cache import response_cache
+from app.taxonomy.cache import taxonomy_cache
 
-def get_categories(db: Session, skip: int = 0, limit: int = 100) -> List[models.Category]:
+CATEGORY_CURSOR_ATTRS = ("id",)
+
+def get_categories(db: Session, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[models.Category]:
     """
-    Повертає список всіх категорій з пагінацією.
+    Повертає список всіх категорій з пагінацією (з кешу довідників).
     
     Args:
         db: Сесія бази даних.
-        skip: Кількість категорій для пропуску (для пагінації).
+        skip: Кількість категорій для пропуску (ігнорується, якщо передано cursor).
         limit: Максимальна кількість категорій (для пагінації).
+        cursor: Курсор наступної сторінки (keyset-пагінація).
     
     Returns:
         List[models.Category]: Список категорій.
     """
     try:
-        return db.query(models.Category).offset(skip).limit(limit).all()
+        return taxonomy_cache.page(db, "categories", skip, limit, cursor)
     except SQLAlchemyError:
         raise HTTPException(status_code=500, detail="Помилка бази даних при отриманні категорій")
 
@@ -38,6 +44,41 @@ def get_category(db: Session, category_id: int) -> Optional[models.Category]:
     except SQLAlchemyError:
         raise HTTPException(status_code=500, detail="Помилка бази даних при отриманні категорії")
 
+async def get_categories_async(db: AsyncSession, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[models.Category]:
+    """
+    Асинхронно повертає список всіх категорій з пагінацією (з кешу довідників).
+    
+    Args:
+        db: Асинхронна сесія бази даних.
+        skip: Кількість категорій для пропуску (ігнорується, якщо передано cursor).
+        limit: Максимальна кількість категорій (для пагінації).
+        cursor: Курсор наступної сторінки (keyset-пагінація).
+    
+    Returns:
+        List[models.Category]: Список категорій.
+    """
+    try:
+        return await db.run_sync(taxonomy_cache.page, "categories", skip, limit, cursor)
+    except SQLAlchemyError:
+        raise HTTPException(status_code=500, detail="Помилка бази даних при отриманні категорій")
+
+async def get_category_async(db: AsyncSession, category_id: int) -> Optional[models.Category]:
+    """
+    Асинхронно повертає категорію за її ID або None, якщо не знайдено.
+    Категорія з кешу довідників; промах перевіряється в БД (категорію могли щойно створити в іншому воркері).
+    
+    Args:
+        db: Асинхронна сесія бази даних.
+        category_id: ID категорії.
+    
+    Returns:
+        Optional[models.Category]: Категорія (рядок кешу) або None.
+    """
+    try:
+        return taxonomy_cache.get("categories", category_id) or await db.get(models.Category, category_id)
+    except SQLAlchemyError:
+        raise HTTPException(status_code=500, detail="Помилка бази даних при отриманні категорії")
+
 def create_category(db: Session, category_in: schemas.CategoryCreate, current_user: Any) -> models.Category:
     """
     Створює нову категорію на основі даних із CategoryCreate.
@@ -58,7 +99,10 @@ def create_category(db: Session, category_in: schemas.CategoryCreate, current_us
             raise HTTPException(status_code=400, detail="Категорія з такою назвою вже існує")
         new_category = models.Category(**category_in.dict(), created_by=current_user.id)
         db.add(new_category)
+        taxonomy_cache.bump(db, "categories")
         db.commit()
+        response_cache.invalidate("categories")
+        taxonomy_cache.reload(db, "categories")
         db.refresh(new_category)
         return new_category
     except SQLAlchemyError:
@@ -89,7 +133,10 @@ def update_category(db: Session, category: models.Category, category_in: schemas
                 raise HTTPException(status_code=400, detail="Категорія з такою назвою вже існує")
         for key, value in update_data.items():
             setattr(category, key, value)
+        taxonomy_cache.bump(db, "categories")
         db.commit()
+        response_cache.invalidate("categories")
+        taxonomy_cache.reload(db, "categories")
         db.refresh(category)
         return category
     except SQLAlchemyError:
@@ -113,7 +160,10 @@ def delete_category(db: Session, category: models.Category) -> None:
         if db.query(Article).filter(Article.category_id == category.id).count() > 0:
             raise HTTPException(status_code=400, detail="Неможливо видалити категорію, яка використовується статтями")
         db.delete(category)
+        taxonomy_cache.bump(db, "categories")
         db.commit()
+        response_cache.invalidate("categories")
+        taxonomy_cache.reload(db, "categories")
     except SQLAlchemyError:
         db.rollback()
         raise HTTPException(status_code=500, detail="Помилка бази даних при видаленні категорії")
\ No newline at end of file
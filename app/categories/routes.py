@@ -1,22 +1,28 @@
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Response
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
-from typing import List, Any
+from typing import List, Any, Optional
 from app.categories import schemas, crud
-from app.db.database import get_db
+from app.db.database import get_db, get_async_db
 from app.auth.dependencies import get_current_active_user
+from app.core.pagination import set_next_cursor
 
 router = APIRouter()
 
 @router.get("/", response_model=List[schemas.CategoryOut], summary="Отримати усі категорії")
-def read_categories(
+async def read_categories(
+    response: Response,
     skip: int = Query(0, ge=0, description="Кількість категорій для пропуску"),
     limit: int = Query(100, ge=1, le=1000, description="Максимальна кількість категорій"),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="Курсор наступної сторінки із заголовка X-Next-Cursor"),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Отримати список категорій з пагінацією."""
+    """Отримати список категорій з пагінацією (skip або cursor)."""
     try:
-        return crud.get_categories(db, skip=skip, limit=limit)
+        categories = await crud.get_categories_async(db, skip=skip, limit=limit, cursor=cursor)
+        set_next_cursor(response, categories, crud.CATEGORY_CURSOR_ATTRS, limit)
+        return categories
     except SQLAlchemyError:
         raise HTTPException(status_code=500, detail="Помилка бази даних при отриманні категорій")
 
@@ -35,12 +41,12 @@ def create_category(
         raise HTTPException(status_code=500, detail="Помилка бази даних при створенні категорії")
 
 @router.get("/{category_id}", response_model=schemas.CategoryOut, summary="Отримати категорію")
-def read_category(
+async def read_category(
     category_id: int = Path(..., description="ID категорії", ge=1),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Отримати категорію за її ID."""
-    category = crud.get_category(db, category_id)
+    category = await crud.get_category_async(db, category_id)
     if not category:
         raise HTTPException(status_code=404, detail="Категорію не знайдено")
     return category
@@ -11,7 +11,8 @@ class CategoryBase(BaseModel):
     description: Optional[str] = Field(None, max_length=1000)
 
     @field_validator("name")
-    def validate_name(self, v: str) -> str:
+    @classmethod
+    def validate_name(cls, v: str) -> str:
         if not v.strip():
             raise ValueError("Назва категорії не може бути порожньою")
         return v.strip()
@@ -32,7 +33,8 @@ class CategoryUpdate(BaseModel):
     description: Optional[str] = Field(None, max_length=1000)
 
     @field_validator("name")
-    def validate_name(self, v: Optional[str]) -> Optional[str]:
+    @classmethod
+    def validate_name(cls, v: Optional[str]) -> Optional[str]:
         if v is not None and not v.strip():
             raise ValueError("Назва категорії не може бути порожньою")
         return v.strip() if v else v
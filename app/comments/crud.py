@@ -1,24 +1,244 @@
+from sqlalchemy import Integer, func, literal_column, select, update
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 from fastapi import HTTPException
 from app.comments import models, schemas
 from app.articles.models import Article  # Імпорт Article
-from typing import List, Optional, Any
+from typing import Any, Dict, Iterable, List, Optional
+from datetime import datetime
+from app.core.http_cache import response_cache
+from app.core.pagination import apply_keyset
 
-def get_comments_by_article(db: Session, article_id: int, skip: int = 0, limit: int = 100) -> List[models.Comment]:
+# Ключ keyset-пагінації коментарів; індекс (article_id, id) робить вибірку range scan
+COMMENT_CURSOR_ATTRS = ("id",)
+COMMENT_CURSOR_CONVERTERS = (int,)
+
+# Колонки швидкого шляху списку коментарів — поля CommentOut
+COMMENT_ROW_COLUMNS = tuple(models.Comment.__table__.c[name] for name in schemas.CommentOut.model_fields)
+
+def _comments_stmt(article_id: int, skip: int, limit: int, cursor: Optional[str], columns: Optional[tuple] = None):
+    base = select(*columns) if columns else select(models.Comment)
+    stmt = apply_keyset(
+        base.filter(models.Comment.article_id == article_id),
+        (models.Comment.id,),
+        cursor,
+        COMMENT_CURSOR_CONVERTERS,
+    )
+    if not cursor:
+        stmt = stmt.offset(skip)
+    return stmt.limit(limit)
+
+def get_comments_by_article(db: Session, article_id: int, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[models.Comment]:
     """
     Повертає список коментарів для статті за її ID.
     
     Args:
         db: Сесія бази даних.
         article_id: ID статті.
-        skip: Кількість коментарів для пропуску (для пагінації).
+        skip: Кількість коментарів для пропуску (ігнорується, якщо передано cursor).
+        limit: Максимальна кількість коментарів (для пагінації).
+        cursor: Курсор наступної сторінки (keyset-пагінація).
+    
+    Returns:
+        List[models.Comment]: Список коментарів.
+    """
+    return list(db.execute(_comments_stmt(article_id, skip, limit, cursor)).scalars().all())
+
+async def get_comments_by_article_async(db: AsyncSession, article_id: int, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[models.Comment]:
+    """
+    Асинхронно повертає список коментарів для статті за її ID.
+    
+    Args:
+        db: Асинхронна сесія бази даних.
+        article_id: ID статті.
+        skip: Кількість коментарів для пропуску (ігнорується, якщо передано cursor).
         limit: Максимальна кількість коментарів (для пагінації).
+        cursor: Курсор наступної сторінки (keyset-пагінація).
     
     Returns:
         List[models.Comment]: Список коментарів.
     """
-    return db.query(models.Comment).filter(models.Comment.article_id == article_id).offset(skip).limit(limit).all()
+    result = await db.execute(_comments_stmt(article_id, skip, limit, cursor))
+    return list(result.scalars().all())
+
+async def get_comment_rows_async(db: AsyncSession, article_id: int, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Швидкий шлях списку коментарів: словники з кортежів колонок без ORM-об'єктів і повторної валідації.
+    
+    Args:
+        db: Асинхронна сесія бази даних.
+        article_id: ID статті.
+        skip: Кількість коментарів для пропуску (ігнорується, якщо передано cursor).
+        limit: Максимальна кількість коментарів (для пагінації).
+        cursor: Курсор наступної сторінки (keyset-пагінація).
+    
+    Returns:
+        List[Dict[str, Any]]: Рядки коментарів з ключами полів CommentOut.
+    """
+    result = await db.execute(_comments_stmt(article_id, skip, limit, cursor, columns=COMMENT_ROW_COLUMNS))
+    return [dict(row) for row in result.mappings()]
+
+# Колонки коментаря, що потрапляють у вузол дерева
+COMMENT_TREE_COLUMNS = ("id", "content", "parent_id", "article_id", "author_id", "created_at")
+
+def _comment_tree_stmt(article_id: int, parent_id: Optional[int], skip: int, limit: int, max_depth: int):
+    table = models.Comment.__table__
+    anchor_ids = (
+        select(table.c.id)
+        .where(
+            table.c.article_id == article_id,
+            table.c.parent_id == parent_id if parent_id else table.c.parent_id.is_(None),
+        )
+        .order_by(table.c.id)
+        .offset(skip)
+        .limit(limit)
+        .subquery()
+    )
+    tree = select(
+        anchor_ids.c.id, literal_column("0", Integer).label("depth")
+    ).cte("comment_tree", recursive=True)
+    # Обмеження глибини також захищає від циклів, які може створити зміна parent_id
+    tree = tree.union_all(
+        select(table.c.id, tree.c.depth + 1)
+        .join(tree, table.c.parent_id == tree.c.id)
+        .where(table.c.article_id == article_id, tree.c.depth < max_depth)
+    )
+    # Кількість прямих відповідей рахується для всіх вузлів, зокрема обрізаних за глибиною
+    reply_counts = (
+        select(table.c.parent_id, func.count().label("replies_total"))
+        .where(table.c.article_id == article_id, table.c.parent_id.is_not(None))
+        .group_by(table.c.parent_id)
+        .subquery()
+    )
+    return (
+        select(
+            *(table.c[name] for name in COMMENT_TREE_COLUMNS),
+            tree.c.depth,
+            func.coalesce(reply_counts.c.replies_total, 0).label("replies_total"),
+        )
+        .join(tree, table.c.id == tree.c.id)
+        .outerjoin(reply_counts, reply_counts.c.parent_id == table.c.id)
+        .order_by(tree.c.depth, table.c.id)
+    )
+
+def build_comment_tree(rows: Iterable[Any], replies_limit: int) -> List[Dict[str, Any]]:
+    """
+    Збирає вкладене дерево коментарів за один прохід, O(n).
+    Рядки мають бути впорядковані за (depth, id), тож батько завжди обробляється раніше за відповіді.
+    
+    Args:
+        rows: Рядки з колонками COMMENT_TREE_COLUMNS, depth і replies_total.
+        replies_limit: Максимальна кількість відповідей, що вкладаються в один вузол.
+    
+    Returns:
+        List[Dict[str, Any]]: Кореневі вузли з вкладеними replies.
+    """
+    nodes: Dict[int, Dict[str, Any]] = {}
+    roots: List[Dict[str, Any]] = []
+    for row in rows:
+        node = dict(row._mapping) if hasattr(row, "_mapping") else dict(row)
+        node["replies"] = []
+        if node["depth"] == 0:
+            roots.append(node)
+        else:
+            parent = nodes.get(node["parent_id"])
+            # Батька немає, якщо його піддерево вже відрізано через replies_limit
+            if parent is None or len(parent["replies"]) >= replies_limit:
+                continue
+            parent["replies"].append(node)
+        nodes[node["id"]] = node
+    return roots
+
+async def get_comment_tree_async(
+    db: AsyncSession,
+    article_id: int,
+    parent_id: Optional[int] = None,
+    skip: int = 0,
+    limit: int = 20,
+    max_depth: int = 10,
+    replies_limit: int = 50,
+) -> List[Dict[str, Any]]:
+    """
+    Асинхронно повертає гілку коментарів статті одним рекурсивним CTE-запитом.
+    
+    Args:
+        db: Асинхронна сесія бази даних.
+        article_id: ID статті.
+        parent_id: ID коментаря, відповіді на який є коренями гілки (None — коментарі верхнього рівня).
+        skip: Кількість кореневих коментарів для пропуску.
+        limit: Максимальна кількість кореневих коментарів.
+        max_depth: Максимальна глибина вкладеності (0 — лише корені).
+        replies_limit: Максимальна кількість відповідей у кожному вузлі; решту
+            можна дочитати запитом з parent_id цього вузла.
+    
+    Returns:
+        List[Dict[str, Any]]: Кореневі вузли з вкладеними replies і replies_total.
+    """
+    result = await db.execute(_comment_tree_stmt(article_id, parent_id, skip, limit, max_depth))
+    return build_comment_tree(result, replies_limit)
+
+def _comment_count_subquery():
+    return (
+        select(func.count(models.Comment.id))
+        .where(models.Comment.article_id == Article.id)
+        .scalar_subquery()
+    )
+
+def repair_comment_counts(db: Session, batch_size: int = 10000) -> int:
+    """
+    Перераховує comment_count усіх статей пакетами за діапазонами ID.
+    Виправляє розбіжності після ручних змін у БД чи збоїв; кожен пакет — окрема транзакція.
+    
+    Args:
+        db: Сесія бази даних.
+        batch_size: Кількість статей в одному UPDATE.
+    
+    Returns:
+        int: Кількість статей, лічильник яких було виправлено.
+    """
+    max_id = db.execute(select(func.max(Article.id))).scalar() or 0
+    repaired = 0
+    for start in range(0, max_id, batch_size):
+        actual = _comment_count_subquery()
+        result = db.execute(
+            update(Article)
+            .where(Article.id > start, Article.id <= start + batch_size, Article.comment_count != actual)
+            .values(comment_count=actual)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        repaired += result.rowcount
+    if repaired:
+        response_cache.invalidate("articles")
+    return repaired
+
+# Колонки вивантаження коментарів (NDJSON/CSV)
+COMMENT_EXPORT_COLUMNS = ("id", "article_id", "parent_id", "author_id", "content", "created_at", "updated_at")
+
+def comments_export_stmt(created_from: Optional[datetime] = None, created_to: Optional[datetime] = None,
+                         category_id: Optional[int] = None):
+    """
+    Запит вивантаження коментарів: лише колонки таблиці, без ORM-об'єктів.
+    Фільтр за категорією застосовується через join зі статтями.
+    
+    Args:
+        created_from: Початок діапазону дати створення (включно).
+        created_to: Кінець діапазону дати створення (не включно).
+        category_id: ID категорії статті.
+    
+    Returns:
+        Select: Запит для app.core.export.stream_export.
+    """
+    table = models.Comment.__table__
+    stmt = select(*(table.c[name] for name in COMMENT_EXPORT_COLUMNS))
+    if created_from is not None:
+        stmt = stmt.where(table.c.created_at >= created_from)
+    if created_to is not None:
+        stmt = stmt.where(table.c.created_at < created_to)
+    if category_id is not None:
+        stmt = stmt.join(Article, Article.id == table.c.article_id).where(Article.category_id == category_id)
+    return stmt.order_by(table.c.id)
 
 def create_comment(db: Session, comment_in: schemas.CommentCreate, current_user: Any) -> models.Comment:
     """
@@ -52,8 +272,15 @@ def create_comment(db: Session, comment_in: schemas.CommentCreate, current_user:
             author_id=current_user.id
         )
         db.add(new_comment)
+        # Лічильник оновлюється атомарно в тій самій транзакції, що й вставка коментаря
+        db.execute(
+            update(Article)
+            .where(Article.id == comment_in.article_id)
+            .values(comment_count=Article.comment_count + 1)
+        )
         db.commit()
         db.refresh(new_comment)
+        response_cache.invalidate("articles")
         return new_comment
     except SQLAlchemyError:
         db.rollback()
@@ -72,6 +299,19 @@ def get_comment(db: Session, comment_id: int) -> Optional[models.Comment]:
     """
     return db.query(models.Comment).filter(models.Comment.id == comment_id).first()
 
+async def get_comment_async(db: AsyncSession, comment_id: int) -> Optional[models.Comment]:
+    """
+    Асинхронно повертає коментар за заданим ID.
+    
+    Args:
+        db: Асинхронна сесія бази даних.
+        comment_id: ID коментаря.
+    
+    Returns:
+        Optional[models.Comment]: Коментар або None, якщо не знайдено.
+    """
+    return await db.get(models.Comment, comment_id)
+
 def update_comment(db: Session, comment: models.Comment, comment_in: schemas.CommentUpdate, current_user: Any) -> models.Comment:
     """
     Оновлює коментар.
@@ -127,8 +367,17 @@ def delete_comment(db: Session, comment: models.Comment, current_user: Any) -> N
     try:
         if current_user.role not in ("admin", "editor") and comment.author_id != current_user.id:
             raise HTTPException(status_code=403, detail="Недостатньо прав для видалення коментаря")
+        article_id = comment.article_id
         db.delete(comment)
+        db.flush()
+        # Разом із коментарем каскадно видаляються відповіді, тож лічильник перераховується
+        db.execute(
+            update(Article)
+            .where(Article.id == article_id)
+            .values(comment_count=_comment_count_subquery())
+        )
         db.commit()
+        response_cache.invalidate("articles")
     except SQLAlchemyError:
         db.rollback()
         raise HTTPException(status_code=500, detail="Помилка бази даних при видаленні коментаря")
\ No newline at end of file
@@ -0,0 +1,27 @@
+"""
+Службові задачі коментарів.
+
+Перерахунок денормалізованих лічильників коментарів статей:
+    python -m app.comments.jobs repair-counts --batch-size 10000
+"""
+import argparse
+
+from app.comments.crud import repair_comment_counts
+from app.db.database import SessionLocal
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    repair = subparsers.add_parser("repair-counts", help="Перерахувати comment_count усіх статей")
+    repair.add_argument("--batch-size", type=int, default=10000)
+    args = parser.parse_args()
+
+    if args.command == "repair-counts":
+        with SessionLocal() as db:
+            repaired = repair_comment_counts(db, batch_size=args.batch_size)
+        print(f"Виправлено лічильників: {repaired}")
+
+
+if __name__ == "__main__":
+    main()
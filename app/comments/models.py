@@ -1,4 +1,4 @@
-from sqlalchemy import Integer, Text, DateTime, ForeignKey
+from sqlalchemy import Integer, Text, DateTime, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 from app.db.database import Base
@@ -11,16 +11,22 @@ class Comment(Base):
     Зберігає вміст, зв’язки з автором, статтею, батьківським коментарем і відповідями.
     """
     __tablename__ = "comments"
+    __table_args__ = (
+        # Keyset-пагінація коментарів статті
+        Index("ix_comments_article_id_id", "article_id", "id"),
+        # Рекурсивний обхід дерева відповідей і сторінки відповідей на коментар
+        Index("ix_comments_parent_id_id", "parent_id", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     content: Mapped[str] = mapped_column(Text, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now)
-    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, onupdate=func.now)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, onupdate=func.now())
     parent_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("comments.id", ondelete="CASCADE"), nullable=True)
     article_id: Mapped[int] = mapped_column(Integer, ForeignKey("articles.id", ondelete="CASCADE"), nullable=False, index=True)
-    author_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    author_id: Mapped[int] = mapped_column(Integer, ForeignKey("authors.id", ondelete="CASCADE"), nullable=False, index=True)
 
     article: Mapped["Article"] = relationship("Article", back_populates="comments")
-    author: Mapped["User"] = relationship("User", back_populates="comments")
-    replies: Mapped[List["Comment"]] = relationship("Comment", back_populates="parent", remote_side=[id])
-    parent: Mapped[Optional["Comment"]] = relationship("Comment", back_populates="replies")
\ No newline at end of file
+    author: Mapped["Author"] = relationship("Author", back_populates="comments")
+    replies: Mapped[List["Comment"]] = relationship("Comment", back_populates="parent")
+    parent: Mapped[Optional["Comment"]] = relationship("Comment", back_populates="replies", remote_side=[id])
\ No newline at end of file
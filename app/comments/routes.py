@@ -1,24 +1,72 @@
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError  # Додаємо імпорт
-from typing import List, Any
+from typing import List, Any, Optional
+from datetime import datetime
 from app.comments import schemas, crud, models
-from app.db.database import get_db
+from app.db.database import get_db, get_async_db
+from app.core.config import settings
 from app.auth.dependencies import get_current_active_user
+from app.core.pagination import set_next_cursor
+from app.core.export import ExportFormat, export_response
 
 router = APIRouter()
 
 @router.get("/article/{article_id}", response_model=List[schemas.CommentOut], summary="Отримати коментарі до статті")
-def read_comments(
+async def read_comments(
+    response: Response,
     article_id: int = Path(..., description="ID статті", ge=1),
     skip: int = Query(0, ge=0, description="Кількість коментарів для пропуску"),
     limit: int = Query(100, ge=1, le=1000, description="Максимальна кількість коментарів"),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="Курсор наступної сторінки із заголовка X-Next-Cursor"),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Отримати усі коментарі для вказаної статті з пагінацією."""
-    comments = crud.get_comments_by_article(db, article_id, skip=skip, limit=limit)
+    """Отримати усі коментарі для вказаної статті з пагінацією (skip або cursor)."""
+    if settings.FAST_JSON_RESPONSES:
+        rows = await crud.get_comment_rows_async(db, article_id, skip=skip, limit=limit, cursor=cursor)
+        fast_response = ORJSONResponse(rows)
+        set_next_cursor(fast_response, rows, crud.COMMENT_CURSOR_ATTRS, limit)
+        return fast_response
+    comments = await crud.get_comments_by_article_async(db, article_id, skip=skip, limit=limit, cursor=cursor)
+    set_next_cursor(response, comments, crud.COMMENT_CURSOR_ATTRS, limit)
     return comments
 
+@router.get("/article/{article_id}/tree", response_model=List[schemas.CommentTreeOut], summary="Отримати дерево коментарів статті")
+async def read_comment_tree(
+    article_id: int = Path(..., description="ID статті", ge=1),
+    parent_id: Optional[int] = Query(None, ge=1, description="ID коментаря, гілку відповідей якого потрібно отримати"),
+    skip: int = Query(0, ge=0, description="Кількість кореневих коментарів для пропуску"),
+    limit: int = Query(20, ge=1, le=200, description="Максимальна кількість кореневих коментарів"),
+    max_depth: int = Query(10, ge=0, le=50, description="Максимальна глибина вкладеності"),
+    replies_limit: int = Query(50, ge=1, le=500, description="Максимальна кількість відповідей у кожному вузлі"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Отримати дерево коментарів одним запитом.
+    Якщо replies_total вузла більший за кількість вкладених replies, решту відповідей
+    можна дочитати з parent_id цього вузла та skip.
+    """
+    return await crud.get_comment_tree_async(
+        db, article_id, parent_id=parent_id, skip=skip, limit=limit,
+        max_depth=max_depth, replies_limit=replies_limit,
+    )
+
+@router.get("/export", response_class=StreamingResponse, summary="Вивантажити коментарі")
+def export_comments(
+    fmt: ExportFormat = Query(ExportFormat.NDJSON, alias="format", description="Формат вивантаження"),
+    created_from: Optional[datetime] = Query(None, description="Створені не раніше (включно)"),
+    created_to: Optional[datetime] = Query(None, description="Створені раніше (не включно)"),
+    category_id: Optional[int] = Query(None, ge=1, description="ID категорії статті"),
+    current_user: Any = Depends(get_current_active_user)
+):
+    """Потокове вивантаження коментарів у NDJSON або CSV (лише admin/editor)."""
+    if current_user.role not in ("admin", "editor"):
+        raise HTTPException(status_code=403, detail="Недостатньо прав для вивантаження коментарів")
+    stmt = crud.comments_export_stmt(created_from, created_to, category_id)
+    return export_response(stmt, crud.COMMENT_EXPORT_COLUMNS, fmt, "comments")
+
 @router.post("/", response_model=schemas.CommentOut, summary="Створити коментар")
 def create_comment(
     comment_in: schemas.CommentCreate,
@@ -32,12 +80,12 @@ def create_comment(
         raise HTTPException(status_code=500, detail="Помилка бази даних при створенні коментаря")
 
 @router.get("/{comment_id}", response_model=schemas.CommentOut, summary="Отримати коментар")
-def read_comment(
+async def read_comment(
     comment_id: int = Path(..., description="ID коментаря", ge=1),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Отримати коментар за його ID."""
-    comment = crud.get_comment(db, comment_id)
+    comment = await crud.get_comment_async(db, comment_id)
     if not comment:
         raise HTTPException(status_code=404, detail="Коментар не знайдено")
     return comment
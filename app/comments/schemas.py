@@ -1,5 +1,5 @@
 from pydantic import BaseModel, ConfigDict, Field, field_validator
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 class CommentBase(BaseModel):
@@ -12,7 +12,8 @@ class CommentBase(BaseModel):
     article_id: int = Field(..., ge=1)
 
     @field_validator("content")
-    def validate_content(self, v):
+    @classmethod
+    def validate_content(cls, v):
         if not v.strip():
             raise ValueError("Коментар не може бути порожнім")
         return v.strip()
@@ -33,7 +34,8 @@ class CommentUpdate(BaseModel):
     parent_id: Optional[int] = Field(None, ge=1)
 
     @field_validator("content")
-    def validate_content(self, v):
+    @classmethod
+    def validate_content(cls, v):
         if v is not None and not v.strip():
             raise ValueError("Коментар не може бути порожнім")
         return v.strip() if v else v
@@ -47,4 +49,14 @@ class CommentOut(CommentBase):
     author_id: int = Field(..., ge=1)
     created_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+class CommentTreeOut(CommentOut):
+    """
+    Вузол дерева коментарів.
+    Містить глибину, загальну кількість прямих відповідей і вкладені відповіді
+    (не більше replies_limit і не глибше max_depth).
+    """
+    depth: int = Field(..., ge=0)
+    replies_total: int = Field(0, ge=0)
+    replies: List["CommentTreeOut"] = Field(default_factory=list)
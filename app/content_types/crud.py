@@ -3,12 +3,14 @@ from sqlalchemy.exc import SQLAlchemyError
 from typing import List, Optional, Any
 from app.content_types import models, schemas
 from fastapi import HTTPException
+from app.core.http_cache import response_cache
+from app.taxonomy.cache import taxonomy_cache
 
 def get_content_types(db: Session, skip: int = 0, limit: int = 100) -> List[models.ContentType]:
     """
-    Повертає список типів контенту з пагінацією.
+    Повертає список типів контенту з пагінацією (з кешу довідників).
     """
-    return db.query(models.ContentType).offset(skip).limit(limit).all()
+    return taxonomy_cache.page(db, "content_types", skip, limit)
 
 def get_content_type(db: Session, content_type_id: int) -> Optional[models.ContentType]:
     """
@@ -34,7 +36,10 @@ def create_content_type(db: Session, content_type_in: schemas.ContentTypeCreate,
             created_by=current_user.id
         )
         db.add(content_type)
+        taxonomy_cache.bump(db, "content_types")
         db.commit()
+        response_cache.invalidate("content_types")
+        taxonomy_cache.reload(db, "content_types")
         db.refresh(content_type)
         return content_type
     except SQLAlchemyError as e:
@@ -55,7 +60,10 @@ def update_content_type(db: Session, content_type: models.ContentType, content_t
             content_type.name = content_type_in.name
         if content_type_in.description is not None:
             content_type.description = content_type_in.description
+        taxonomy_cache.bump(db, "content_types")
         db.commit()
+        response_cache.invalidate("content_types")
+        taxonomy_cache.reload(db, "content_types")
         db.refresh(content_type)
         return content_type
     except SQLAlchemyError as e:
@@ -73,7 +81,10 @@ def delete_content_type(db: Session, content_type: models.ContentType, current_u
         if not hasattr(current_user, "role") or current_user.role != "admin":
             raise HTTPException(status_code=403, detail="Недостатньо прав для видалення типу контенту")
         db.delete(content_type)
+        taxonomy_cache.bump(db, "content_types")
         db.commit()
+        response_cache.invalidate("content_types")
+        taxonomy_cache.reload(db, "content_types")
     except SQLAlchemyError as e:
         db.rollback()
         raise HTTPException(status_code=500, detail="Помилка бази даних при видаленні типу контенту")
\ No newline at end of file
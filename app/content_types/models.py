@@ -15,7 +15,7 @@ class ContentType(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(100), nullable=False, unique=True, index=True)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    created_by: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now)
+    created_by: Mapped[int] = mapped_column(Integer, ForeignKey("authors.id"), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
     
     articles: Mapped[List["Article"]] = relationship("Article", back_populates="content_type", cascade="all, delete-orphan")
\ No newline at end of file
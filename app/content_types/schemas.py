@@ -10,7 +10,8 @@ class ContentTypeBase(BaseModel):
     description: Optional[str] = None
 
     @field_validator("name")
-    def validate_name(self, v):
+    @classmethod
+    def validate_name(cls, v):
         if not v.strip():
             raise ValueError("Назва не може бути порожньою")
         return v.strip()
@@ -31,7 +32,8 @@ class ContentTypeUpdate(BaseModel):
     description: Optional[str] = None
 
     @field_validator("name")
-    def validate_name(self, v):
+    @classmethod
+    def validate_name(cls, v):
         if v is not None and not v.strip():
             raise ValueError("Назва не може бути порожньою")
         return v.strip() if v else v
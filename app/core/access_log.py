@@ -0,0 +1,90 @@
+import json
+import logging
+import queue
+import random
+import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+from app.core.request_stats import RequestStats
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """QueueHandler, що не форматує запис у потоці запиту: JSON серіалізує фоновий потік."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class JsonLineFormatter(logging.Formatter):
+    """Один JSON-рядок на запис; record.msg — словник полів."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return json.dumps(record.msg, ensure_ascii=False, separators=(",", ":"))
+
+
+class AccessLog:
+    """
+    Структурований журнал доступу: один JSON-рядок на запит (метод, шаблон маршруту, статус,
+    тривалість, кількість SQL-виразів). Викликається як спостерігач RequestInstrumentation
+    (app.core.metrics); запис іде через чергу, stdout пише фоновий потік.
+    Успішні відповіді логуються вибірково з частотою sample_rate; помилки (4xx/5xx) і повільні
+    запити логуються завжди.
+    """
+
+    def __init__(self, sample_rate: float = 0.1, slow_ms: float = 500.0, enabled: bool = True,
+                 handler: Optional[logging.Handler] = None) -> None:
+        self.sample_rate = sample_rate
+        self.slow_ms = slow_ms
+        self.enabled = enabled
+        self.handler = handler or logging.StreamHandler(sys.stdout)
+        self.handler.setFormatter(JsonLineFormatter())
+        self._queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        self.logger = logging.getLogger("upb.access")
+        self.logger.propagate = False
+        self.logger.setLevel(logging.INFO)
+        self.logger.addHandler(_DeferredQueueHandler(self._queue))
+        self._listener: Optional[QueueListener] = None
+
+    def start(self) -> None:
+        """Запустити фоновий потік запису."""
+        if self._listener is None:
+            self._listener = QueueListener(self._queue, self.handler)
+            self._listener.start()
+
+    def stop(self) -> None:
+        """Дописати чергу і зупинити фоновий потік."""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+    def should_log(self, status: int, duration_ms: float) -> bool:
+        if status >= 400 or duration_ms >= self.slow_ms:
+            return True
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+
+    def __call__(self, scope: Dict[str, Any], route: Optional[str], status: int, duration: float,
+                 stats: RequestStats) -> None:
+        """Спостерігач RequestInstrumentation: передати запис журналу в чергу, якщо він пройшов вибірку."""
+        duration_ms = duration * 1000
+        if not self.enabled or not self.should_log(status, duration_ms):
+            return
+        self.logger.info({
+            "ts": round(time.time(), 3),
+            "method": scope["method"],
+            # Шаблон маршруту замість повного URL; шлях — лише якщо маршрут не знайдено
+            "route": route or scope["path"],
+            "status": status,
+            "duration_ms": round(duration_ms, 2),
+            "db_queries": stats.queries,
+            "db_ms": round(stats.db_time * 1000, 2),
+        })
+
+
+access_log = AccessLog(
+    sample_rate=settings.ACCESS_LOG_SAMPLE_RATE,
+    slow_ms=settings.ACCESS_LOG_SLOW_MS,
+    enabled=settings.ACCESS_LOG_ENABLED,
+)
@@ -1,6 +1,6 @@
 from pydantic_settings import BaseSettings
 from pydantic import ConfigDict, Field, field_validator
-from typing import List
+from typing import List, Optional
 
 class Settings(BaseSettings):
     """
@@ -11,22 +11,55 @@ class Settings(BaseSettings):
     SECRET_KEY: str = Field(description="JWT secret key")
     ALGORITHM: str = Field(description="JWT algorithm")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(default=30, description="Access token expiration (minutes)")
+    REFRESH_TOKEN_EXPIRE_DAYS: int = Field(default=7, description="Refresh token expiration (days)")
+    DEBUG: bool = Field(default=False, description="Echo SQL statements (development only)")
     ALLOWED_ORIGINS: List[str] = Field(default=["http://localhost:8000"], description="List of allowed CORS origins")
+    ACCESS_LOG_ENABLED: bool = Field(default=True, description="Write structured JSON access log lines")
+    ACCESS_LOG_SAMPLE_RATE: float = Field(default=0.1, ge=0, le=1, description="Fraction of successful requests written to the access log")
+    ACCESS_LOG_SLOW_MS: float = Field(default=500.0, ge=0, description="Requests slower than this are always logged (milliseconds)")
+    ARTICLE_HISTORY_SNAPSHOT_INTERVAL: int = Field(default=20, ge=1, description="Every Nth article version is stored as a full snapshot")
+    ARTICLE_IMPORT_BATCH_SIZE: int = Field(default=1000, ge=1, description="Rows inserted per batch by the bulk article import")
+    ASYNC_DATABASE_URL: Optional[str] = Field(default=None, description="Async driver URL; derived from DATABASE_URL if empty")
+    ASYNC_POOL_SIZE: int = Field(default=20, ge=1, description="Async engine pool size")
+    ASYNC_MAX_OVERFLOW: int = Field(default=20, ge=0, description="Async engine pool overflow")
+    BCRYPT_ROUNDS: int = Field(default=12, ge=4, le=31, description="bcrypt cost factor")
+    FAST_JSON_RESPONSES: bool = Field(default=False, description="Serve opted-in list endpoints from column rows via orjson, skipping response_model validation (opt-in)")
+    MEDIA_ACCEL_REDIRECT_PREFIX: Optional[str] = Field(default=None, description="Internal nginx location for X-Accel-Redirect offload of media files; served by the app if empty")
+    MEDIA_MAX_UPLOAD_MB: int = Field(default=1024, ge=1, description="Max size of an uploaded media file (megabytes)")
+    MEDIA_RENDITION_WORKERS: int = Field(default=2, ge=1, description="Threads generating image renditions")
+    MEDIA_ROOT: str = Field(default="media", description="Local directory for uploaded media files")
+    MEDIA_URL: str = Field(default="/api/v1/media/files", description="URL prefix under which stored media files are served")
+    METRICS_ENABLED: bool = Field(default=True, description="Collect request metrics and expose them at /metrics")
+    PASSWORD_HASH_WORKERS: int = Field(default=2, ge=1, description="Threads dedicated to bcrypt hashing")
+    PASSWORD_HASH_QUEUE_LIMIT: int = Field(default=32, ge=0, description="Queued hashing jobs before 503")
+    PRINCIPAL_CACHE_TTL: float = Field(default=30.0, ge=0, description="Max staleness of cached authenticated users (seconds)")
+    PRINCIPAL_CACHE_MAX_SIZE: int = Field(default=10000, ge=1, description="Max cached authenticated users")
+    RESPONSE_CACHE_ENABLED: bool = Field(default=True, description="Cache public GET responses with ETags")
+    RESPONSE_CACHE_MAX_ENTRIES: int = Field(default=1024, ge=1, description="Max cached responses per worker")
+    TAXONOMY_CACHE_CHECK_INTERVAL: float = Field(default=5.0, gt=0, description="How often each worker compares taxonomy version stamps to reload stale categories, tags and content types (seconds)")
+    TRENDING_HALF_LIFE_HOURS: float = Field(default=6.0, gt=0, description="Half-life of a view in the trending score (hours)")
+    TRENDING_TOP_N: int = Field(default=50, ge=1, description="Articles kept in each trending leaderboard")
+    TRENDING_REFRESH_INTERVAL: float = Field(default=30.0, gt=0, description="Trending leaderboard refresh interval (seconds)")
+    VIEW_COUNT_FLUSH_INTERVAL: float = Field(default=5.0, gt=0, description="View counter flush interval (seconds)")
+    VIEW_COUNT_FLUSH_SIZE: int = Field(default=1000, ge=1, description="Buffered views that trigger an early flush")
 
     @field_validator("DATABASE_URL")
-    def validate_database_url(self, v):
+    @classmethod
+    def validate_database_url(cls, v):
         if not v.startswith(("postgresql://", "sqlite://", "mysql://")):
             raise ValueError("Некоректний формат DATABASE_URL")
         return v
 
     @field_validator("SECRET_KEY")
-    def validate_secret_key(self, v):
+    @classmethod
+    def validate_secret_key(cls, v):
         if len(v) < 32:
             raise ValueError("SECRET_KEY має бути щонайменше 32 символи")
         return v
 
     @field_validator("ALGORITHM")
-    def validate_algorithm(self, v):
+    @classmethod
+    def validate_algorithm(cls, v):
         valid_algorithms = {"HS256", "HS512", "RS256"}
         if v not in valid_algorithms:
             raise ValueError(f"Алгоритм має бути одним із: {valid_algorithms}")
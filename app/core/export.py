@@ -0,0 +1,86 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, AsyncIterator, Callable, Sequence
+
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.database import AsyncSessionLocal
+
+# Скільки рядків читається з серверного курсора і кодується в один фрагмент відповіді
+EXPORT_CHUNK_ROWS = 2000
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Тип {type(value).__name__} не серіалізується в JSON")
+
+
+def encode_rows(rows: Sequence[Sequence[Any]], columns: Sequence[str], fmt: ExportFormat) -> bytes:
+    """Закодувати порцію рядків у NDJSON або CSV (без заголовка)."""
+    if fmt == ExportFormat.CSV:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(
+            [value.isoformat() if isinstance(value, (datetime, date)) else value for value in row] for row in rows
+        )
+        return buffer.getvalue().encode("utf-8")
+    return "".join(
+        json.dumps(dict(zip(columns, row)), ensure_ascii=False, default=_json_default) + "\n" for row in rows
+    ).encode("utf-8")
+
+
+async def stream_export(
+    stmt,
+    columns: Sequence[str],
+    fmt: ExportFormat,
+    session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+    chunk_rows: int = EXPORT_CHUNK_ROWS,
+) -> AsyncIterator[bytes]:
+    """
+    Потоково вивантажити результат запиту через серверний курсор.
+    Сесія відкривається всередині генератора: залежності FastAPI закриваються ще до початку
+    передачі тіла StreamingResponse. Пам'ять обмежена однією порцією з chunk_rows рядків.
+
+    Args:
+        stmt: Core-запит, колонки якого відповідають columns.
+        columns: Назви колонок (ключі NDJSON і заголовок CSV).
+        fmt: Формат вивантаження.
+        session_factory: Фабрика асинхронних сесій.
+        chunk_rows: Кількість рядків в одній порції.
+
+    Yields:
+        bytes: Закодовані порції рядків.
+    """
+    if fmt == ExportFormat.CSV:
+        header = io.StringIO()
+        csv.writer(header).writerow(columns)
+        yield header.getvalue().encode("utf-8")
+    async with session_factory() as db:
+        result = await db.stream(stmt.execution_options(yield_per=chunk_rows))
+        async for partition in result.partitions():
+            yield encode_rows(partition, columns, fmt)
+
+
+def export_response(stmt, columns: Sequence[str], fmt: ExportFormat, filename: str,
+                    session_factory: Callable[[], AsyncSession] = AsyncSessionLocal) -> StreamingResponse:
+    """StreamingResponse з потоковим вивантаженням у вигляді файлу-вкладення."""
+    return StreamingResponse(
+        stream_export(stmt, columns, fmt, session_factory),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{fmt.value}"'},
+    )
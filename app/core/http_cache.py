@@ -0,0 +1,212 @@
+import hashlib
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Pattern, Tuple
+
+from fastapi import Request, Response
+
+from app.core.config import settings
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """
+    Збережена відповідь: тіло, тип вмісту, додаткові заголовки, сильний ETag, час завершення дії
+    і контекст для on_hit, який ендпоінт передав через set_hit_context.
+    """
+    body: bytes
+    media_type: Optional[str]
+    headers: Tuple[Tuple[str, str], ...]
+    etag: str
+    expires_at: float
+    hit_context: Mapping[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class CacheRule:
+    """
+    Правило кешування маршруту.
+    namespace групує записи для інвалідації з crud, on_hit викликається при відповіді з кешу
+    зі збігом шляху і контекстом, збереженим разом із відповіддю.
+    """
+    pattern: Pattern
+    ttl: int
+    namespace: str
+    on_hit: Optional[Callable[[re.Match, Mapping[str, Any]], None]] = None
+
+
+class ResponseCacheBackend(ABC):
+    """Базове сховище кешу відповідей."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Збережена відповідь за ключем або None, якщо її немає чи строк дії минув."""
+
+    @abstractmethod
+    def set(self, key: str, value: CachedResponse) -> None:
+        """Зберегти відповідь під ключем."""
+
+
+class InMemoryResponseCacheBackend(ResponseCacheBackend):
+    """Обмежений LRU-кеш відповідей у пам'яті процесу."""
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._items: "OrderedDict[str, CachedResponse]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            if item.expires_at < time.monotonic():
+                del self._items[key]
+                return None
+            self._items.move_to_end(key)
+            return item
+
+    def set(self, key: str, value: CachedResponse) -> None:
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+
+
+# Заголовки, які формуються заново при відповіді з кешу
+SKIPPED_HEADERS = {"content-length", "content-type", "etag", "cache-control", "set-cookie"}
+
+
+def origin_dependent(header: str) -> bool:
+    """CORS-заголовки (Access-Control-*, Vary) залежать від Origin запиту і в запис кешу не потрапляють."""
+    return header == "vary" or header.startswith("access-control-")
+
+
+def set_hit_context(request: Request, **values: Any) -> None:
+    """
+    Зберегти разом із відповіддю дані для on_hit правила, яких немає в URL (напр. категорію статті).
+    Викликається з обробника ендпоінта; request.state спільний для ендпоінта і middleware.
+    """
+    request.state.cache_hit_context = values
+
+
+def make_etag(body: bytes) -> str:
+    """Сильний ETag із вмісту відповіді."""
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Перевірити заголовок If-None-Match на збіг з ETag."""
+    if not if_none_match:
+        return False
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+class ResponseCache:
+    """
+    Кеш відповідей публічних GET-ендпоінтів із сильними ETag.
+    Інвалідація за простором імен: crud збільшує покоління простору, і старі ключі
+    просто перестають використовуватися (витісняються LRU).
+    """
+
+    def __init__(self, backend: Optional[ResponseCacheBackend] = None, enabled: bool = True) -> None:
+        self.backend = backend or InMemoryResponseCacheBackend()
+        self.enabled = enabled
+        self.rules: List[CacheRule] = []
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.bytes_saved = 0
+
+    def add_rule(self, path_regex: str, ttl: int, namespace: str,
+                 on_hit: Optional[Callable[[re.Match, Mapping[str, Any]], None]] = None) -> None:
+        """Кешувати GET-запити на шляхи, що повністю збігаються з path_regex, протягом ttl секунд."""
+        self.rules.append(CacheRule(re.compile(path_regex), ttl, namespace, on_hit))
+
+    def invalidate(self, *namespaces: str) -> None:
+        """Зробити недійсними всі записи вказаних просторів імен (викликається з crud після commit)."""
+        with self._lock:
+            for namespace in namespaces:
+                self._generations[namespace] = self._generations.get(namespace, 0) + 1
+
+    def stats(self) -> Dict[str, float]:
+        """Частка влучань у кеш і кількість байтів тіла, не переданих завдяки 304."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "not_modified": self.not_modified,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "bytes_saved": self.bytes_saved,
+            }
+
+    def _match(self, request: Request):
+        if not self.enabled or request.method != "GET":
+            return None, None
+        for rule in self.rules:
+            match = rule.pattern.fullmatch(request.url.path)
+            if match:
+                return rule, match
+        return None, None
+
+    def _key(self, rule: CacheRule, request: Request) -> str:
+        query = "&".join(sorted(request.url.query.split("&"))) if request.url.query else ""
+        return f"{rule.namespace}:{self._generations.get(rule.namespace, 0)}:{request.url.path}?{query}"
+
+    def _reply(self, request: Request, rule: CacheRule, entry: CachedResponse,
+               headers: Optional[Tuple[Tuple[str, str], ...]] = None) -> Response:
+        headers = dict(entry.headers if headers is None else headers)
+        headers.update({"ETag": entry.etag, "Cache-Control": f"public, max-age={rule.ttl}"})
+        if etag_matches(request.headers.get("if-none-match"), entry.etag):
+            with self._lock:
+                self.not_modified += 1
+                self.bytes_saved += len(entry.body)
+            return Response(status_code=304, headers=headers)
+        return Response(content=entry.body, media_type=entry.media_type, headers=headers)
+
+    async def __call__(self, request: Request, call_next) -> Response:
+        """HTTP-middleware: віддати відповідь із кешу або закешувати успішну відповідь."""
+        rule, match = self._match(request)
+        if rule is None:
+            return await call_next(request)
+        key = self._key(rule, request)
+        entry = self.backend.get(key)
+        if entry is not None:
+            with self._lock:
+                self.hits += 1
+            if rule.on_hit is not None:
+                rule.on_hit(match, entry.hit_context)
+            return self._reply(request, rule, entry)
+        with self._lock:
+            self.misses += 1
+        response = await call_next(request)
+        if response.status_code != 200:
+            return response
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        headers = tuple((name, value) for name, value in response.headers.items() if name not in SKIPPED_HEADERS)
+        entry = CachedResponse(
+            body=body,
+            media_type=response.headers.get("content-type"),
+            headers=tuple((name, value) for name, value in headers if not origin_dependent(name)),
+            etag=make_etag(body),
+            expires_at=time.monotonic() + rule.ttl,
+            hit_context=getattr(request.state, "cache_hit_context", {}),
+        )
+        # Якщо під час генерації відповіді простір інвалідовано, ключ уже застарілий і запис не буде прочитано
+        self.backend.set(key, entry)
+        return self._reply(request, rule, entry, headers)
+
+
+response_cache = ResponseCache(
+    backend=InMemoryResponseCacheBackend(max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES),
+    enabled=settings.RESPONSE_CACHE_ENABLED,
+)
@@ -0,0 +1,242 @@
+import bisect
+import threading
+import time
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.request_stats import RequestStats, begin_request
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+WAIT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric(ABC):
+    """Базова метрика з іменем, описом і назвами міток."""
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    @abstractmethod
+    def render(self) -> List[str]:
+        """Рядки метрики у текстовому форматі Prometheus."""
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str) -> None:
+        super().__init__(name, documentation)
+        self.value = 0
+
+    def inc(self) -> None:
+        with self._lock:
+            self.value += 1
+
+    def dec(self) -> None:
+        with self._lock:
+            self.value -= 1
+
+    def render(self) -> List[str]:
+        return self.header() + [f"{self.name} {_number(self.value)}"]
+
+
+class Histogram(Metric):
+    """
+    Гістограма з фіксованими межами кошиків.
+    Зберігає некумулятивні лічильники; кумулятивні значення le рахуються лише під час рендерингу.
+    """
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(buckets)
+        # label_values -> [лічильники кошиків + кошик +Inf, сума]
+        self._series: Dict[LabelValues, list] = {}
+
+    def observe(self, value: float, *label_values: str) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def render(self) -> List[str]:
+        with self._lock:
+            snapshot = {key: (list(counts), total) for key, (counts, total) in self._series.items()}
+        lines = self.header()
+        for key, (counts, total) in snapshot.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _number(bound)
+                bucket_label = f'le="{le}"'
+                lines.append(f"{self.name}_bucket{_labels(self.label_names, key, bucket_label)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.label_names, key)} {_number(total)}")
+            lines.append(f"{self.name}_count{_labels(self.label_names, key)} {cumulative}")
+        return lines
+
+
+class CallbackMetric(Metric):
+    """Метрика, значення якої читається функцією під час рендерингу (стан кешів, пулу)."""
+
+    def __init__(self, name: str, documentation: str, kind: str,
+                 collect: Callable[[], Union[float, Dict[LabelValues, float]]], labels: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labels)
+        self.kind = kind
+        self.collect = collect
+
+    def render(self) -> List[str]:
+        values = self.collect()
+        if not isinstance(values, dict):
+            values = {(): values}
+        return self.header() + [
+            f"{self.name}{_labels(self.label_names, key)} {_number(value)}" for key, value in values.items()
+        ]
+
+
+class MetricsRegistry:
+    """Реєстр метрик процесу, що рендериться в текстовому форматі Prometheus."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def callback(self, name: str, documentation: str, collect, kind: str = "gauge", labels: Sequence[str] = ()) -> None:
+        self.register(CallbackMetric(name, documentation, kind, collect, labels))
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+REQUEST_LATENCY = metrics.register(Histogram(
+    "upb_http_request_duration_seconds", "HTTP request latency by route template", ("method", "route", "status")))
+REQUEST_DB_STATEMENTS = metrics.register(Histogram(
+    "upb_http_request_db_statements", "SQL statements executed per request", ("route",), COUNT_BUCKETS))
+REQUEST_DB_TIME = metrics.register(Histogram(
+    "upb_http_request_db_seconds", "Time spent in SQL per request", ("route",)))
+REQUESTS_IN_FLIGHT = metrics.register(Gauge(
+    "upb_http_requests_in_flight", "Requests currently being processed"))
+POOL_CHECKOUT_WAIT = metrics.register(Histogram(
+    "upb_db_pool_checkout_wait_seconds", "Time spent waiting for a pooled DB connection", ("pool",), WAIT_BUCKETS))
+
+
+@lru_cache(maxsize=None)
+def timed_pool(pool_class: type) -> type:
+    """
+    Підклас пулу з'єднань, що вимірює очікування видачі з'єднання.
+    Подій "до checkout" у SQLAlchemy немає, тому вимірюється _do_get — місце, де пул чекає на вільне з'єднання.
+    """
+    label = pool_class.__name__
+
+    class TimedPool(pool_class):
+        def _do_get(self):
+            started = time.perf_counter()
+            try:
+                return super()._do_get()
+            finally:
+                POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started, label)
+
+    TimedPool.__name__ = TimedPool.__qualname__ = f"Timed{label}"
+    return TimedPool
+
+
+def observe_request(method: str, route: str, status: int, duration: float, stats: RequestStats) -> None:
+    """Записати метрики завершеного запиту."""
+    REQUEST_LATENCY.observe(duration, method, route, str(status))
+    REQUEST_DB_STATEMENTS.observe(stats.queries, route)
+    REQUEST_DB_TIME.observe(stats.db_time, route)
+
+
+RequestObserver = Callable[[Scope, Optional[str], int, float, RequestStats], None]
+
+
+class RequestInstrumentation:
+    """
+    Чистий ASGI-middleware вимірювання запитів (без BaseHTTPMiddleware і зайвої задачі на запит).
+    Рахує запити в обробці, визначає шаблон маршруту і передає тривалість, статус та SQL-статистику
+    спостерігачам: метрикам і журналу доступу.
+    """
+
+    def __init__(self, app: ASGIApp, routes: Iterable = (), observers: Sequence[RequestObserver] = ()) -> None:
+        self.app = app
+        self.routes = routes
+        self.observers = tuple(observers)
+
+    def _route_template(self, scope: Scope) -> Optional[str]:
+        route = scope.get("route")
+        if route is None:
+            # Відповіді з кешу не доходять до маршрутизатора — шукаємо шаблон самі
+            for candidate in self.routes:
+                match, _ = candidate.matches(scope)
+                if match == Match.FULL:
+                    route = candidate
+                    break
+        return getattr(route, "path", None)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        stats = begin_request()
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        REQUESTS_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration = time.perf_counter() - started
+            REQUESTS_IN_FLIGHT.dec()
+            route = self._route_template(scope)
+            for observer in self.observers:
+                observer(scope, route, status, duration, stats)
+
+
+def metrics_observer(scope: Scope, route: Optional[str], status: int, duration: float, stats: RequestStats) -> None:
+    """Спостерігач RequestInstrumentation для метрик; запити без маршруту групуються в unmatched."""
+    observe_request(scope["method"], route or "unmatched", status, duration, stats)
@@ -0,0 +1,111 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Callable, Mapping, Optional, Sequence
+
+from fastapi import HTTPException, Response
+from sqlalchemy import Select, tuple_
+
+# Заголовок відповіді з курсором наступної сторінки
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Непідтримуваний тип у курсорі: {type(value).__name__}")
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Закодувати значення ключа сортування в непрозорий курсор.
+
+    Args:
+        values: Значення ключа сортування останнього запису сторінки.
+
+    Returns:
+        str: Курсор у форматі base64url.
+    """
+    raw = json.dumps(values, default=_default, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, converters: Sequence[Callable[[Any], Any]]) -> tuple:
+    """
+    Розкодувати курсор у значення ключа сортування.
+
+    Args:
+        cursor: Курсор, отриманий від клієнта.
+        converters: Перетворювачі для кожного елемента ключа.
+
+    Returns:
+        tuple: Значення ключа сортування.
+
+    Raises:
+        HTTPException: Якщо курсор некоректний.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(converters):
+            raise ValueError
+        return tuple(convert(value) for convert, value in zip(converters, values))
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Некоректний курсор пагінації")
+
+
+def apply_keyset(
+    stmt: Select,
+    columns: Sequence[Any],
+    cursor: Optional[str],
+    converters: Sequence[Callable[[Any], Any]],
+    descending: bool = False,
+) -> Select:
+    """
+    Додати до запиту стабільне сортування та, якщо передано курсор, умову keyset-пагінації.
+    Порівняння кортежів (a, b) > (x, y) виконується як range scan по складеному індексу.
+
+    Args:
+        stmt: Запит SELECT.
+        columns: Стовпці ключа сортування (останній має бути унікальним).
+        cursor: Курсор попередньої сторінки або None.
+        converters: Перетворювачі значень курсора.
+        descending: Сортування за спаданням.
+
+    Returns:
+        Select: Запит із сортуванням і фільтром.
+    """
+    stmt = stmt.order_by(*(column.desc() if descending else column.asc() for column in columns))
+    if cursor:
+        values = decode_cursor(cursor, converters)
+        key = tuple_(*columns)
+        stmt = stmt.where(key < tuple_(*values) if descending else key > tuple_(*values))
+    return stmt
+
+
+def next_cursor(rows: Sequence[Any], attrs: Sequence[str], limit: int) -> Optional[str]:
+    """
+    Побудувати курсор наступної сторінки з останнього запису.
+
+    Args:
+        rows: Записи поточної сторінки (об'єкти або словники).
+        attrs: Імена атрибутів ключа сортування.
+        limit: Розмір сторінки.
+
+    Returns:
+        Optional[str]: Курсор або None, якщо це остання сторінка.
+    """
+    if len(rows) < limit:
+        return None
+    last = rows[-1]
+    # Рядки швидкого шляху — словники, ORM-об'єкти — з атрибутами
+    if isinstance(last, Mapping):
+        return encode_cursor(*(last[attr] for attr in attrs))
+    return encode_cursor(*(getattr(last, attr) for attr in attrs))
+
+
+def set_next_cursor(response: Response, rows: Sequence[Any], attrs: Sequence[str], limit: int) -> None:
+    """Записати курсор наступної сторінки в заголовок відповіді."""
+    cursor = next_cursor(rows, attrs, limit)
+    if cursor:
+        response.headers[NEXT_CURSOR_HEADER] = cursor
@@ -0,0 +1,47 @@
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+@dataclass
+class RequestStats:
+    """Лічильники SQL поточного запиту: кількість виразів і сумарний час у БД (секунди)."""
+    queries: int = 0
+    db_time: float = 0.0
+
+
+# Статистика запиту, що обробляється; копія контексту переходить і в потоки run_in_threadpool
+_current: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def begin_request() -> RequestStats:
+    """Почати збір статистики для поточного запиту."""
+    stats = RequestStats()
+    _current.set(stats)
+    return stats
+
+
+def current_request_stats() -> Optional[RequestStats]:
+    return _current.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._request_stats_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_time += time.perf_counter() - context._request_stats_started
+
+
+def track_queries(engine: Engine) -> None:
+    """Підписати рушій (для AsyncEngine — його sync_engine) на підрахунок SQL-виразів запиту."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
@@ -1,7 +1,10 @@
-from sqlalchemy import create_engine, MetaData
+from sqlalchemy import create_engine, MetaData, text
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from app.core.config import settings
+from app.core.metrics import timed_pool
 
 try:
     engine = create_engine(
@@ -9,16 +12,51 @@ try:
         echo=settings.DEBUG,  # Увімкнено лише в режимі розробки
         pool_size=5,
         max_overflow=10,
-        pool_timeout=30
+        pool_timeout=30,
+        # Пул вимірює очікування вільного з'єднання (метрика upb_db_pool_checkout_wait_seconds)
+        poolclass=timed_pool(QueuePool)
     )
     # Тестове підключення
     with engine.connect() as connection:
-        connection.execute("SELECT 1")
+        connection.execute(text("SELECT 1"))
 except OperationalError as e:
     raise Exception(f"Не вдалося підключитися до бази даних: {e}")
 
 SessionLocal = sessionmaker(bind=engine, autoflush=False)
 
+# Асинхронний рушій для ендпоінтів читання; синхронний залишається для міграцій, запису та тестів
+ASYNC_DRIVERS = {
+    "postgresql://": "postgresql+asyncpg://",
+    "sqlite://": "sqlite+aiosqlite://",
+    "mysql://": "mysql+aiomysql://",
+}
+
+def to_async_url(url: str) -> str:
+    """
+    Перетворює синхронний DATABASE_URL на URL з асинхронним драйвером.
+    
+    Args:
+        url: URL підключення до бази даних.
+    
+    Returns:
+        str: URL для create_async_engine.
+    """
+    for prefix, async_prefix in ASYNC_DRIVERS.items():
+        if url.startswith(prefix):
+            return async_prefix + url[len(prefix):]
+    return url
+
+async_engine = create_async_engine(
+    settings.ASYNC_DATABASE_URL or to_async_url(settings.DATABASE_URL),
+    echo=settings.DEBUG,
+    pool_size=settings.ASYNC_POOL_SIZE,
+    max_overflow=settings.ASYNC_MAX_OVERFLOW,
+    pool_timeout=30,
+    poolclass=timed_pool(AsyncAdaptedQueuePool)
+)
+
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
 def get_db():
     """
     Створює нову сесію SQLAlchemy для кожного запиту та закриває її після завершення.
@@ -33,5 +71,17 @@ def get_db():
     finally:
         db.close()
 
+async def get_async_db():
+    """
+    Створює асинхронну сесію SQLAlchemy для кожного запиту та закриває її після завершення.
+    Використовується як залежність в async-ендпоінтах читання.
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception:
+            await db.rollback()
+            raise
+
 class Base(DeclarativeBase):
     metadata = MetaData()
\ No newline at end of file
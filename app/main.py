@@ -1,4 +1,6 @@
-from fastapi import FastAPI, Request
+from contextlib import asynccontextmanager
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 import logging
 
@@ -9,18 +11,59 @@ from app.tags.routes import router as tags_router
 from app.comments.routes import router as comments_router
 from app.content_types.routes import router as content_types_router
 from app.media.routes import router as media_router
+from app.articles.views import view_counter, record_view
+from app.articles.trending import trending
+from app.auth.utils import password_hash_pool
+from app.media.renditions import rendition_pool
+from app.core.http_cache import response_cache
+from app.core.access_log import access_log
+from app.core.metrics import RequestInstrumentation, metrics, metrics_observer
+from app.auth.cache import principal_cache
+from app.taxonomy.cache import taxonomy_cache
+from app.core.request_stats import track_queries
+from app.db.database import engine, async_engine
 from app.core.config import settings  # Має містити налаштування (SECRET_KEY, DATABASE_URL тощо)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    access_log.start()
+    # Довідники завантажуються до першого запиту; далі штампи версій перевіряються у фоні
+    taxonomy_cache.start()
+    view_counter.start()
+    trending.start()
+    yield
+    trending.stop()
+    # Записуємо залишок буферизованих переглядів перед завершенням
+    view_counter.stop()
+    password_hash_pool.shutdown()
+    rendition_pool.shutdown()
+    taxonomy_cache.stop()
+    access_log.stop()
+
 app = FastAPI(
     title="UPB API",
     description="Бекенд для новинного ресурсу",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Налаштування логування
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("uvicorn")
 
+# Кешування публічних GET-відповідей з ETag (TTL у секундах для кожного маршруту).
+# Записи інвалідуються функціями запису в crud відповідного модуля. Middleware реєструється раніше
+# за CORSMiddleware: CORS обгортає кеш і додає заголовки для Origin кожного запиту, зокрема з кешу.
+response_cache.add_rule(
+    r"/api/v1/articles/(?P<article_id>\d+)", ttl=30, namespace="articles",
+    # Відповідь із кешу теж є переглядом статті; категорію read_article зберігає разом із відповіддю
+    on_hit=lambda match, context: record_view(int(match["article_id"]), context.get("category_id")),
+)
+response_cache.add_rule(r"/api/v1/categories/", ttl=300, namespace="categories")
+response_cache.add_rule(r"/api/v1/tags/", ttl=300, namespace="tags")
+response_cache.add_rule(r"/api/v1/content-types/", ttl=300, namespace="content_types")
+app.middleware("http")(response_cache)
+
 # Налаштування CORS
 origins = [
     "http://localhost",
@@ -44,18 +87,44 @@ app.include_router(comments_router, prefix="/api/v1/comments", tags=["comments"]
 app.include_router(content_types_router, prefix="/api/v1/content-types", tags=["content_types"])
 app.include_router(media_router, prefix="/api/v1/media", tags=["media"])
 
-# Middleware для логування запитів та відповідей
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    logger.info(f"Запит: {request.method} {request.url}")
-    response = await call_next(request)
-    logger.info(f"Відповідь: {response.status_code}")
-    return response
+# Вимірювання запитів: метрики Prometheus і структурований журнал доступу (JSON-рядок на запит,
+# вибірка для успішних відповідей). Зовнішній middleware, тож відповіді з кешу теж враховуються.
+track_queries(engine)
+track_queries(async_engine.sync_engine)
+app.add_middleware(
+    RequestInstrumentation,
+    routes=app.router.routes,
+    observers=[metrics_observer, access_log] if settings.METRICS_ENABLED else [access_log],
+)
+
+def _cache_stats(stats_fn, key):
+    return lambda: stats_fn()[key]
+
+for key in ("hits", "misses", "not_modified", "bytes_saved"):
+    metrics.callback(f"upb_response_cache_{key}_total", f"Response cache {key.replace('_', ' ')}",
+                     _cache_stats(response_cache.stats, key), kind="counter")
+for key in ("hits", "misses"):
+    metrics.callback(f"upb_principal_cache_{key}_total", f"Principal cache {key}",
+                     _cache_stats(principal_cache.stats, key), kind="counter")
+metrics.callback("upb_principal_cache_size", "Cached principals", _cache_stats(principal_cache.stats, "size"))
+metrics.callback("upb_taxonomy_cache_reloads_total", "Taxonomy reloads after version stamp changes",
+                 _cache_stats(taxonomy_cache.stats, "reloads"), kind="counter")
+metrics.callback(
+    "upb_db_pool_checked_out", "Connections currently checked out of the pool",
+    lambda: {("sync",): engine.pool.checkedout(), ("async",): async_engine.pool.checkedout()},
+    labels=("engine",),
+)
 
 @app.get("/")
 def root():
     return {"message": "UPB API"}
 
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+    def read_metrics():
+        """Метрики процесу в текстовому форматі Prometheus."""
+        return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
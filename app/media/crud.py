@@ -1,13 +1,72 @@
+from sqlalchemy import func, select, update
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from app.media import models, schemas
+from app.media.renditions import delete_renditions
+from app.media.storage import MediaStorage, storage
+from app.media.upload import StoredUpload
 from app.articles.models import Article
+from app.core.http_cache import response_cache
 from fastapi import HTTPException
-from typing import Any
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, List, Optional, Tuple
+
+ALLOWED_MEDIA_TYPES = {"image", "video", "audio"}
 
 def get_media(db: Session, media_id: int):
     return db.query(models.Media).filter(models.Media.id == media_id).first()
 
+def get_media_batch(db: Session, media_ids: List[int]) -> List[models.Media]:
+    """
+    Отримати кілька медіа одним запитом за первинним ключем.
+    
+    Args:
+        db: Сесія бази даних.
+        media_ids: ID медіа.
+    
+    Returns:
+        List[models.Media]: Знайдені медіа в порядку media_ids; відсутні ID пропускаються.
+    
+    Raises:
+        HTTPException: Якщо сталася помилка бази даних.
+    """
+    try:
+        found = {
+            media.id: media
+            for media in db.execute(select(models.Media).where(models.Media.id.in_(media_ids))).scalars()
+        }
+    except SQLAlchemyError:
+        raise HTTPException(status_code=500, detail="Помилка бази даних при отриманні медіа")
+    return [found[media_id] for media_id in media_ids if media_id in found]
+
+async def get_article_media_async(db: AsyncSession, article_id: int) -> Optional[List[models.Media]]:
+    """
+    Асинхронно отримати медіа статті в порядку додавання.
+    Один range scan за індексом (article_id, id); існування статті перевіряється лише для порожнього результату.
+    
+    Args:
+        db: Асинхронна сесія бази даних.
+        article_id: ID статті.
+    
+    Returns:
+        Optional[List[models.Media]]: Медіа статті або None, якщо статтю не знайдено.
+    
+    Raises:
+        HTTPException: Якщо сталася помилка бази даних.
+    """
+    try:
+        result = await db.execute(
+            select(models.Media).where(models.Media.article_id == article_id).order_by(models.Media.id)
+        )
+        media_items = list(result.scalars())
+        if not media_items and await db.get(Article, article_id) is None:
+            return None
+        return media_items
+    except SQLAlchemyError:
+        raise HTTPException(status_code=500, detail="Помилка бази даних при отриманні медіа статті")
+
 def create_media(db: Session, media_in: schemas.MediaCreate, current_user: Any):
     """
     Створює новий запис медіа, прив'язаний до користувача (current_user).
@@ -19,24 +78,129 @@ def create_media(db: Session, media_in: schemas.MediaCreate, current_user: Any):
         article = db.query(Article).filter(Article.id == media_in.article_id).first()
         if not article:
             raise HTTPException(status_code=404, detail="Стаття не знайдена")
-        allowed_types = {"image", "video", "audio"}
-        if media_in.media_type not in allowed_types:
+        if media_in.media_type not in ALLOWED_MEDIA_TYPES:
             raise HTTPException(status_code=400, detail="Недопустимий тип медіа")
         new_media = models.Media(
             article_id=media_in.article_id,
             media_type=media_in.media_type,
-            url=media_in.url,
+            url=str(media_in.url),
             description=media_in.description,
             created_by=current_user.id
         )
         db.add(new_media)
         db.commit()
+        # Медіа вбудовуються у відповіді статей (?embed=media)
+        response_cache.invalidate("articles")
         db.refresh(new_media)
         return new_media
     except SQLAlchemyError as e:
         db.rollback()
         raise HTTPException(status_code=500, detail="Помилка бази даних при створенні медіа")
 
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+def acquire_blob(db: Session, content_hash: str, storage_key: str, size: int) -> models.MediaBlob:
+    """
+    Додає посилання на блоб із заданим хешем, створюючи блоб за потреби (без коміту).
+    Рядок блоба блокується до кінця транзакції, тож збирач сміття не видалить його паралельно.
+    
+    Args:
+        db: Сесія бази даних.
+        content_hash: SHA-256 вмісту.
+        storage_key: Ключ файлу, якщо блоб створюється вперше.
+        size: Розмір вмісту в байтах.
+    
+    Returns:
+        models.MediaBlob: Блоб зі збільшеним ref_count.
+    """
+    query = db.query(models.MediaBlob).filter(models.MediaBlob.content_hash == content_hash).with_for_update()
+    blob = query.first()
+    if blob is None:
+        blob = models.MediaBlob(content_hash=content_hash, storage_key=storage_key, size=size, ref_count=1)
+        try:
+            with db.begin_nested():
+                db.add(blob)
+        except IntegrityError:
+            # Той самий вміст щойно завантажив інший запит — посилаємося на його блоб
+            blob = query.one()
+        else:
+            return blob
+    blob.ref_count += 1
+    blob.released_at = None
+    db.flush()
+    return blob
+
+def release_blob(db: Session, content_hash: str) -> None:
+    """Знімає посилання на блоб (без коміту); блоб без посилань позначається для збирача сміття."""
+    db.execute(
+        update(models.MediaBlob)
+        .where(models.MediaBlob.content_hash == content_hash)
+        .values(ref_count=models.MediaBlob.ref_count - 1)
+    )
+    db.execute(
+        update(models.MediaBlob)
+        .where(models.MediaBlob.content_hash == content_hash, models.MediaBlob.ref_count <= 0)
+        .values(ref_count=0, released_at=_utcnow())
+    )
+
+def create_uploaded_media(db: Session, upload: StoredUpload, current_user: Any):
+    """
+    Створює запис медіа для потоково завантаженого файлу з дедуплікацією за хешем вмісту.
+    Тип медіа визначається з Content-Type файлу (image/*, video/*, audio/*). Посилання на блоб
+    комітиться раніше за файл: доки ref_count > 0, збирач сміття блоб не чіпає, а дублікат
+    вмісту, що вже є у сховищі, просто відкидається.
+    
+    Args:
+        db: Сесія бази даних.
+        upload: Записаний файл і поля форми (article_id, description).
+        current_user: Користувач, що завантажив файл.
+    
+    Returns:
+        models.Media: Створений запис медіа.
+    
+    Raises:
+        HTTPException: Якщо поля форми некоректні, стаття не знайдена або тип файлу не підтримується.
+    """
+    try:
+        article_id = int(upload.fields.get("article_id", ""))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Некоректний article_id")
+    media_type = (upload.content_type or "").split("/", 1)[0].lower()
+    if media_type not in ALLOWED_MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail="Недопустимий тип медіа")
+    try:
+        article = db.query(Article.id).filter(Article.id == article_id).first()
+        if not article:
+            raise HTTPException(status_code=404, detail="Стаття не знайдена")
+        blob = acquire_blob(db, upload.content_hash, upload.key, upload.size)
+        new_media = models.Media(
+            article_id=article_id,
+            media_type=media_type,
+            url=storage.url(blob.storage_key),
+            description=upload.fields.get("description") or None,
+            created_by=current_user.id,
+            storage_key=blob.storage_key,
+            content_type=upload.content_type,
+            size=upload.size,
+            content_hash=blob.content_hash,
+            renditions=blob.renditions,
+        )
+        db.add(new_media)
+        db.commit()
+        response_cache.invalidate("articles")
+    except SQLAlchemyError:
+        db.rollback()
+        raise HTTPException(status_code=500, detail="Помилка бази даних при створенні медіа")
+    try:
+        upload.key = new_media.storage_key
+        upload.commit()
+    except OSError:
+        delete_media(db, new_media, current_user)
+        raise HTTPException(status_code=500, detail="Не вдалося зберегти файл медіа")
+    db.refresh(new_media)
+    return new_media
+
 def delete_media(db: Session, media_item: models.Media, current_user: Any):
     """
     Видаляє медіа-елемент.
@@ -49,9 +213,100 @@ def delete_media(db: Session, media_item: models.Media, current_user: Any):
             raise HTTPException(status_code=400, detail="Некоректні дані користувача")
         if media_item.created_by != current_user.id:
             raise HTTPException(status_code=403, detail="Недостатньо прав для видалення медіа")
+        content_hash = media_item.content_hash
         db.delete(media_item)
+        # Файл спільний для всіх медіа з тим самим вмістом: лише знімаємо посилання, видаляє його збирач сміття
+        if content_hash:
+            release_blob(db, content_hash)
         db.commit()
+        response_cache.invalidate("articles")
         return None
     except SQLAlchemyError as e:
         db.rollback()
-        raise HTTPException(status_code=500, detail="Помилка бази даних при видаленні медіа")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Помилка бази даних при видаленні медіа")
+
+def collect_garbage(db: Session, media_storage: MediaStorage = storage, grace: float = 3600.0,
+                    batch_size: int = 500) -> Tuple[int, int]:
+    """
+    Видаляє блоби без посилань, звільнені щонайменше grace секунд тому, разом із похідними версіями.
+    Рядки блокуються (SKIP LOCKED), а файли видаляються до коміту: паралельне завантаження того самого
+    вмісту або чекає на блокування і створює блоб заново, або встигає повернути ref_count > 0.
+    
+    Args:
+        db: Сесія бази даних.
+        media_storage: Сховище файлів.
+        grace: Пауза між звільненням блоба і видаленням (секунди).
+        batch_size: Кількість блобів в одній транзакції.
+    
+    Returns:
+        Tuple[int, int]: Кількість видалених блобів і звільнені байти.
+    """
+    cutoff = _utcnow() - timedelta(seconds=grace)
+    removed = freed = 0
+    while True:
+        blobs = (
+            db.query(models.MediaBlob)
+            .filter(models.MediaBlob.ref_count == 0, models.MediaBlob.released_at < cutoff)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+        if not blobs:
+            return removed, freed
+        for blob in blobs:
+            media_storage.delete(blob.storage_key)
+            delete_renditions(media_storage, blob.storage_key)
+            db.delete(blob)
+            freed += blob.size
+        db.commit()
+        removed += len(blobs)
+
+def sweep_orphan_files(db: Session, media_storage: MediaStorage = storage, grace: float = 3600.0,
+                       prefixes: Tuple[str, ...] = ("blobs/", "originals/"), batch_size: int = 1000) -> int:
+    """
+    Видаляє файли оригіналів, на які не посилається жоден блоб чи запис медіа, і недописані файли.
+    Файли, молодші за grace секунд, не чіпаються: їхнє завантаження може ще тривати.
+    
+    Returns:
+        int: Кількість видалених файлів.
+    """
+    cutoff = time.time() - grace
+    removed = media_storage.cleanup_tmp(grace)
+    for prefix in prefixes:
+        candidates = [key for key, mtime in media_storage.iter_keys(prefix) if mtime < cutoff]
+        for start in range(0, len(candidates), batch_size):
+            batch = candidates[start:start + batch_size]
+            referenced = set(db.execute(
+                select(models.MediaBlob.storage_key).where(models.MediaBlob.storage_key.in_(batch))
+            ).scalars())
+            referenced.update(db.execute(
+                select(models.Media.storage_key).where(models.Media.storage_key.in_(batch))
+            ).scalars())
+            for key in batch:
+                if key not in referenced:
+                    media_storage.delete(key)
+                    delete_renditions(media_storage, key)
+                    removed += 1
+    return removed
+
+def storage_report(db: Session) -> schemas.MediaStorageReport:
+    """
+    Звіт про ефект дедуплікації: логічний обсяг завантажень проти фактично збережених байтів.
+    
+    Args:
+        db: Сесія бази даних.
+    
+    Returns:
+        schemas.MediaStorageReport: Кількість медіа й блобів, байти та зекономлена частка.
+    """
+    media_count, logical = db.execute(
+        select(func.count(models.Media.id), func.coalesce(func.sum(models.Media.size), 0))
+        .where(models.Media.content_hash.is_not(None))
+    ).one()
+    blob_count, stored = db.execute(
+        select(func.count(models.MediaBlob.content_hash), func.coalesce(func.sum(models.MediaBlob.size), 0))
+    ).one()
+    return schemas.MediaStorageReport(
+        media=media_count, blobs=blob_count, logical_bytes=logical, stored_bytes=stored,
+        saved_bytes=max(logical - stored, 0), saved_ratio=(logical - stored) / logical if logical else 0.0,
+    )
@@ -0,0 +1,42 @@
+"""
+Службові задачі медіа.
+
+Видалення блобів без посилань (і осиротілих файлів зі --sweep) після паузи --grace секунд:
+    python -m app.media.jobs gc --grace 3600 --sweep
+Звіт про зекономлене дедуплікацією місце:
+    python -m app.media.jobs report
+"""
+import argparse
+
+from app.db.database import SessionLocal
+from app.media.crud import collect_garbage, storage_report, sweep_orphan_files
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    gc = subparsers.add_parser("gc", help="Видалити блоби без посилань")
+    gc.add_argument("--grace", type=float, default=3600.0, help="Пауза після звільнення блоба (секунди)")
+    gc.add_argument("--sweep", action="store_true", help="Також прибрати файли, на які немає посилань у БД")
+    subparsers.add_parser("report", help="Звіт про дедуплікацію")
+    args = parser.parse_args()
+
+    if args.command == "gc":
+        with SessionLocal() as db:
+            removed, freed = collect_garbage(db, grace=args.grace)
+            print(f"Видалено блобів: {removed}, звільнено: {freed / 1024 / 1024:.1f} MB")
+            if args.sweep:
+                print(f"Видалено осиротілих файлів: {sweep_orphan_files(db, grace=args.grace)}")
+    elif args.command == "report":
+        with SessionLocal() as db:
+            report = storage_report(db)
+        print(
+            f"Медіа: {report.media}, унікальних файлів: {report.blobs}\n"
+            f"Завантажено: {report.logical_bytes / 1024 / 1024:.1f} MB, "
+            f"збережено: {report.stored_bytes / 1024 / 1024:.1f} MB, "
+            f"зекономлено: {report.saved_bytes / 1024 / 1024:.1f} MB ({report.saved_ratio:.1%})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,52 @@
-from typing import Optional
+from typing import Any, Dict, Optional
 from datetime import datetime
-from sqlalchemy import Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import JSON, BigInteger, Integer, String, Text, DateTime, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func  # Коректний імпорт
 from app.db.database import Base
 
 class Media(Base):
     __tablename__ = "media"
+    __table_args__ = (
+        # Медіа статті в порядку додавання — один range scan (GET /articles/{id}/media, вбудовування)
+        Index("ix_media_article_id_id", "article_id", "id"),
+    )
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     media_type: Mapped[str] = mapped_column(String(20), nullable=False)
     url: Mapped[str] = mapped_column(String(500), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now)  # Без виклику
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    created_by: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("authors.id", ondelete="SET NULL"), nullable=True)
+    # Файл у сховищі (app.media.storage); порожньо для медіа, доданих зовнішнім URL
+    storage_key: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    content_type: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    size: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+    # SHA-256 вмісту (hex): посилання на блоб і сильний ETag при віддачі файлу
+    content_hash: Mapped[Optional[str]] = mapped_column(
+        String(64), ForeignKey("media_blobs.content_hash"), nullable=True, index=True
+    )
+    # Похідні версії зображення: назва -> url, width, height, size; заповнюється фоновим пулом
+    renditions: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
     
     article_id: Mapped[int] = mapped_column(Integer, ForeignKey("articles.id"), nullable=False, index=True)
     
-    article: Mapped["Article"] = relationship("Article", back_populates="media_items")
\ No newline at end of file
+    article: Mapped["Article"] = relationship("Article", back_populates="media_items")
+
+
+class MediaBlob(Base):
+    """
+    Файл у сховищі, адресований хешем вмісту.
+    Однаковий вміст зберігається один раз; ref_count — кількість записів Media, що на нього посилаються.
+    Блоби з ref_count = 0 видаляє збирач сміття (app.media.jobs gc) після паузи released_at.
+    """
+    __tablename__ = "media_blobs"
+
+    content_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    storage_key: Mapped[str] = mapped_column(String(255), nullable=False)
+    size: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    ref_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    renditions: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    # Коли ref_count упав до нуля; None, поки на блоб є посилання
+    released_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True, index=True)
@@ -0,0 +1,123 @@
+import io
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict
+
+from PIL import Image, ImageOps
+from sqlalchemy import update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.http_cache import response_cache
+from app.db.database import SessionLocal
+from app.media.models import Media, MediaBlob
+from app.media.storage import MediaStorage, storage
+
+logger = logging.getLogger("uvicorn")
+
+# Похідні версії зображень: назва -> найбільша сторона в пікселях; усі кодуються у WebP
+RENDITIONS = {
+    "thumbnail": 320,
+    "webp": 1600,
+}
+WEBP_QUALITY = 80
+
+
+def rendition_key(key: str, name: str) -> str:
+    """Ключ похідної версії: renditions/<шлях оригіналу без розширення>/<назва>.webp."""
+    stem = os.path.splitext(key.split("/", 1)[-1])[0]
+    return f"renditions/{stem}/{name}.webp"
+
+
+def generate_renditions(media_storage: MediaStorage, key: str) -> Dict[str, dict]:
+    """
+    Згенерувати похідні версії зображення і записати їх у сховище.
+
+    Args:
+        media_storage: Сховище з оригіналом.
+        key: Ключ оригіналу.
+
+    Returns:
+        Dict[str, dict]: Назва версії -> url, width, height і size у байтах.
+    """
+    renditions = {}
+    with media_storage.open(key) as source, Image.open(source) as image:
+        # JPEG декодується одразу в зменшеному масштабі, якщо оригінал значно більший за найбільшу версію
+        largest = max(RENDITIONS.values())
+        image.draft("RGB", (largest, largest))
+        image = ImageOps.exif_transpose(image)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "transparency" in image.info or image.mode in ("LA", "PA") else "RGB")
+        # Від найбільшої версії до найменшої: кожна зменшується на місці з попередньої, а не з оригіналу
+        for name, max_side in sorted(RENDITIONS.items(), key=lambda item: -item[1]):
+            image.thumbnail((max_side, max_side), Image.Resampling.LANCZOS)
+            buffer = io.BytesIO()
+            image.save(buffer, format="WEBP", quality=WEBP_QUALITY, method=4)
+            target = rendition_key(key, name)
+            writer = media_storage.open_writer(target)
+            try:
+                writer.write(buffer.getvalue())
+                size = writer.commit()
+            except BaseException:
+                writer.abort()
+                raise
+            renditions[name] = {
+                "url": media_storage.url(target), "width": image.width, "height": image.height, "size": size,
+            }
+    return renditions
+
+
+class RenditionPool:
+    """
+    Пул фонових потоків для генерації похідних версій зображень.
+    Pillow звільняє GIL під час декодування, масштабування й кодування, тож потоки працюють паралельно
+    і не блокують обробку запитів. Версії генеруються один раз на блоб і записуються в блоб та всі
+    записи Media з тим самим вмістом окремою сесією.
+    """
+
+    def __init__(self, workers: int, media_storage: MediaStorage = storage,
+                 session_factory: Callable[[], Session] = SessionLocal) -> None:
+        self.workers = workers
+        self.storage = media_storage
+        self.session_factory = session_factory
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="renditions")
+
+    def submit(self, content_hash: str, key: str):
+        """Поставити зображення в чергу на генерацію похідних версій."""
+        return self._executor.submit(self.process, content_hash, key)
+
+    def process(self, content_hash: str, key: str) -> Dict[str, dict]:
+        try:
+            renditions = generate_renditions(self.storage, key)
+        except Exception:
+            logger.exception("Не вдалося згенерувати похідні версії блоба %s", content_hash)
+            return {}
+        db = self.session_factory()
+        try:
+            db.execute(update(MediaBlob).where(MediaBlob.content_hash == content_hash).values(renditions=renditions))
+            db.execute(update(Media).where(Media.content_hash == content_hash).values(renditions=renditions))
+            db.commit()
+            # Похідні версії потрапляють у медіа, вбудовані у відповіді статей
+            response_cache.invalidate("articles")
+        except SQLAlchemyError:
+            db.rollback()
+            logger.exception("Не вдалося зберегти похідні версії блоба %s", content_hash)
+            return {}
+        finally:
+            db.close()
+        # Файли версій видаляє збирач сміття разом із блобом
+        return renditions
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+def delete_renditions(media_storage: MediaStorage, key: str) -> None:
+    """Видалити всі похідні версії оригіналу з ключем key."""
+    for name in RENDITIONS:
+        media_storage.delete(rendition_key(key, name))
+
+
+rendition_pool = RenditionPool(settings.MEDIA_RENDITION_WORKERS)
@@ -1,12 +1,42 @@
-from fastapi import APIRouter, Depends, HTTPException, Path
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from app.media import schemas, crud, models
+from app.media.renditions import rendition_pool
+from app.media.serving import IMMUTABLE_CACHE_CONTROL, MEDIA_CACHE_CONTROL, media_file_response
+from app.media.storage import storage
+from app.media.upload import MultipartUploadReader
 from app.db.database import get_db
+from app.core.config import settings
 from app.auth.dependencies import get_current_active_user
-from typing import Any
+from typing import Any, List
 
 router = APIRouter()
 
+@router.get("/", response_model=List[schemas.MediaOut], summary="Отримати кілька медіа за ID")
+def read_media_batch(
+    ids: str = Query(..., description=f"ID медіа через кому, напр. 1,2,3 (не більше {schemas.MAX_MEDIA_BATCH})"),
+    db: Session = Depends(get_db)
+):
+    """
+    Отримати кілька медіа одним запитом замість окремого запиту на кожне зображення сторінки.
+    
+    Args:
+        ids: ID медіа через кому.
+        db: Сесія бази даних.
+    
+    Returns:
+        List[schemas.MediaOut]: Знайдені медіа в порядку ids; відсутні ID пропускаються.
+    
+    Raises:
+        HTTPException: 400, якщо ids некоректні або їх забагато.
+    """
+    try:
+        media_ids = schemas.parse_media_ids(ids)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return crud.get_media_batch(db, media_ids)
+
 @router.get("/{media_id}", response_model=schemas.MediaOut, summary="Отримати медіа за ID")
 def read_media(
     media_id: int = Path(..., description="ID медіа", ge=1),
@@ -18,6 +48,43 @@ def read_media(
         raise HTTPException(status_code=404, detail="Медіа не знайдено")
     return media_item
 
+@router.get("/files/{key:path}", summary="Файл зі сховища медіа", include_in_schema=False)
+async def read_media_file(request: Request, key: str):
+    """
+    Віддати файл за ключем сховища (MEDIA_URL); ключі незмінні, тож кешуються назавжди.
+    Оголошено перед /{media_id}/file, щоб ключ "files/file" не сприймався як ID медіа.
+    """
+    return await media_file_response(request, storage, key, IMMUTABLE_CACHE_CONTROL)
+
+@router.get("/{media_id}/file", summary="Завантажити файл медіа")
+async def download_media(
+    request: Request,
+    media_id: int = Path(..., description="ID медіа", ge=1),
+    db: Session = Depends(get_db)
+):
+    """
+    Віддати оригінальний файл медіа.
+    Підтримує Range/If-Range (перемотування відео), ETag із SHA-256 вмісту та If-None-Match.
+    
+    Args:
+        request: Поточний запит.
+        media_id: ID медіа.
+        db: Сесія бази даних.
+    
+    Returns:
+        Response: Файл (200/206), 304 або X-Accel-Redirect.
+    
+    Raises:
+        HTTPException: Якщо медіа не знайдено або воно не має збереженого файлу.
+    """
+    media_item = await run_in_threadpool(crud.get_media, db, media_id)
+    if not media_item or not media_item.storage_key:
+        raise HTTPException(status_code=404, detail="Медіа не знайдено")
+    return await media_file_response(
+        request, storage, media_item.storage_key, MEDIA_CACHE_CONTROL,
+        media_type=media_item.content_type, content_hash=media_item.content_hash,
+    )
+
 @router.post("/", response_model=schemas.MediaOut, summary="Створити медіа")
 def create_media(
     media_in: schemas.MediaCreate,
@@ -27,6 +94,43 @@ def create_media(
     """Створити новий медіа-об'єкт."""
     return crud.create_media(db, media_in, current_user)
 
+@router.post("/upload", response_model=schemas.MediaOut, status_code=201, summary="Завантажити файл медіа")
+async def upload_media(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: Any = Depends(get_current_active_user)
+):
+    """
+    Завантажити файл медіа (multipart/form-data: file, article_id, description).
+    Тіло читається потоком і записується у сховище порціями, не збираючись у пам'яті;
+    однаковий вміст зберігається один раз (адресація за SHA-256). Для зображень похідні версії
+    (мініатюра, WebP) генеруються у фоновому пулі.
+    
+    Args:
+        request: Запит із тілом multipart/form-data.
+        db: Сесія бази даних.
+        current_user: Аутентифікований користувач.
+    
+    Returns:
+        schemas.MediaOut: Створений запис медіа (renditions з'являються після обробки).
+    
+    Raises:
+        HTTPException: 413, якщо файл завеликий; 400/404, якщо поля форми некоректні.
+    """
+    reader = MultipartUploadReader(
+        storage, request.headers.get("content-type", ""), settings.MEDIA_MAX_UPLOAD_MB * 1024 * 1024
+    )
+    upload = await reader.read(request.stream())
+    try:
+        media_item = await run_in_threadpool(crud.create_uploaded_media, db, upload, current_user)
+    except BaseException:
+        upload.discard()
+        raise
+    # Для дубліката вже обробленого зображення версії беруться з блоба
+    if media_item.media_type == "image" and media_item.renditions is None:
+        rendition_pool.submit(media_item.content_hash, media_item.storage_key)
+    return media_item
+
 @router.delete("/{media_id}", status_code=204, summary="Видалити медіа")
 def delete_media(
     media_id: int = Path(..., description="ID медіа", ge=1),
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, ConfigDict, Field, HttpUrl
-from typing import Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 class MediaBase(BaseModel):
@@ -11,9 +11,61 @@ class MediaBase(BaseModel):
 class MediaCreate(MediaBase):
     pass  # Залишено, якщо потрібен для структури
 
+class MediaRendition(BaseModel):
+    url: str
+    width: int
+    height: int
+    size: int = Field(..., description="Розмір файлу в байтах")
+
 class MediaOut(MediaBase):
     id: int = Field(..., ge=1)
-    created_by: int = Field(..., ge=1)
-    uploaded_at: datetime
+    # Завантажені файли мають відносний URL сховища (MEDIA_URL)
+    url: str
+    created_by: Optional[int] = None
+    uploaded_at: datetime = Field(..., validation_alias="created_at")
+    content_type: Optional[str] = None
+    size: Optional[int] = Field(None, description="Розмір оригіналу в байтах")
+    renditions: Optional[Dict[str, MediaRendition]] = Field(
+        None, description="Похідні версії зображення; з'являються після фонової обробки"
+    )
+
+    model_config = ConfigDict(from_attributes=True)
+
+# Найбільша кількість ID у пакетному запиті GET /media?ids=...
+MAX_MEDIA_BATCH = 100
+
+def parse_media_ids(ids: str) -> List[int]:
+    """
+    Розібрати ID медіа, передані через кому.
+    
+    Args:
+        ids: Рядок виду "1,2,3".
+    
+    Returns:
+        List[int]: Унікальні ID у порядку першої появи.
+    
+    Raises:
+        ValueError: Якщо ID некоректні, їх немає або забагато.
+    """
+    parsed = []
+    for part in ids.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if not part.isdigit() or int(part) < 1:
+            raise ValueError(f"Некоректний ID медіа: {part}")
+        parsed.append(int(part))
+    parsed = list(dict.fromkeys(parsed))
+    if not parsed:
+        raise ValueError("Не передано жодного ID медіа")
+    if len(parsed) > MAX_MEDIA_BATCH:
+        raise ValueError(f"Не більше {MAX_MEDIA_BATCH} ID за запит")
+    return parsed
 
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+class MediaStorageReport(BaseModel):
+    media: int = Field(..., description="Записів медіа із завантаженим файлом")
+    blobs: int = Field(..., description="Унікальних файлів у сховищі")
+    logical_bytes: int = Field(..., description="Сумарний розмір усіх завантажень")
+    stored_bytes: int = Field(..., description="Фактично збережено байтів")
+    saved_bytes: int
+    saved_ratio: float = Field(..., description="Частка зекономленого місця, 0..1")
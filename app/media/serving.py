@@ -0,0 +1,109 @@
+import hashlib
+import os
+import re
+from functools import lru_cache
+from mimetypes import guess_type
+from typing import Optional
+
+import anyio
+from fastapi import HTTPException, Request, Response
+from fastapi.responses import FileResponse
+from starlette.types import Receive, Scope, Send
+
+from app.core.config import settings
+from app.media.storage import MediaStorage
+
+# Ключі похідних версій не перезаписуються, тож їх можна кешувати назавжди
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+MEDIA_CACHE_CONTROL = "public, max-age=3600"
+HASH_CHUNK = 1024 * 1024
+_SHA256_HEX = re.compile(r"[0-9a-f]{64}")
+
+
+@lru_cache(maxsize=4096)
+def _file_sha256(path: str, mtime_ns: int, size: int) -> str:
+    # mtime і розмір входять у ключ кешу: змінений файл хешується заново
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        while chunk := file.read(HASH_CHUNK):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def content_etag(path: str, stat_result: os.stat_result, content_hash: Optional[str] = None) -> str:
+    """
+    Сильний ETag із SHA-256 вмісту файлу.
+    Використовує відомий хеш (Media.content_hash або хеш в імені файлу), інакше хешує файл один раз
+    і запам'ятовує результат для пари (mtime, розмір).
+    """
+    if content_hash is None:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        content_hash = stem if _SHA256_HEX.fullmatch(stem) else _file_sha256(
+            path, stat_result.st_mtime_ns, stat_result.st_size
+        )
+    return f'"{content_hash}"'
+
+
+class MediaFileResponse(FileResponse):
+    """
+    FileResponse для файлів медіа.
+    Range/If-Range і multipart/byteranges обробляє Starlette; тут більші порції читання
+    (менше переходів у пул потоків на мегабайт) і розширення ASGI http.response.pathsend,
+    з яким сервер віддає файл сам (sendfile) без читання в Python.
+    """
+    chunk_size = 1024 * 1024
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        pathsend = "http.response.pathsend" in scope.get("extensions", {})
+        if pathsend and scope["method"] == "GET" and b"range" not in dict(scope["headers"]):
+            await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+            await send({"type": "http.response.pathsend", "path": str(self.path)})
+            return
+        await super().__call__(scope, receive, send)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    return if_none_match.strip() == "*" or etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+
+async def media_file_response(
+    request: Request,
+    storage: MediaStorage,
+    key: str,
+    cache_control: str,
+    media_type: Optional[str] = None,
+    content_hash: Optional[str] = None,
+) -> Response:
+    """
+    Віддати файл зі сховища з підтримкою Range/If-Range, сильним ETag і заголовками кешування.
+    Якщо задано MEDIA_ACCEL_REDIRECT_PREFIX, тіло і діапазони віддає nginx (X-Accel-Redirect, sendfile).
+
+    Args:
+        request: Поточний запит (If-None-Match).
+        storage: Сховище файлів.
+        key: Ключ файлу.
+        cache_control: Значення Cache-Control.
+        media_type: MIME-тип; визначається за розширенням, якщо не задано.
+        content_hash: Відомий SHA-256 вмісту для ETag.
+
+    Returns:
+        Response: 200/206 з файлом, 304, якщо ETag збігся, або відповідь X-Accel-Redirect.
+
+    Raises:
+        HTTPException: 404, якщо файлу немає.
+    """
+    try:
+        path = storage.path(key)
+        stat_result = await anyio.to_thread.run_sync(os.stat, path)
+    except (ValueError, FileNotFoundError):
+        raise HTTPException(status_code=404, detail="Файл не знайдено")
+    etag = await anyio.to_thread.run_sync(content_etag, path, stat_result, content_hash)
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    media_type = media_type or guess_type(key)[0] or "application/octet-stream"
+    if settings.MEDIA_ACCEL_REDIRECT_PREFIX:
+        headers["X-Accel-Redirect"] = f"{settings.MEDIA_ACCEL_REDIRECT_PREFIX.rstrip('/')}/{key}"
+        return Response(headers=headers, media_type=media_type)
+    return MediaFileResponse(path, headers=headers, media_type=media_type, stat_result=stat_result)
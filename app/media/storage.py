@@ -0,0 +1,172 @@
+import os
+import time
+import uuid
+from abc import ABC, abstractmethod
+from typing import BinaryIO, Iterator, Optional, Tuple
+
+from app.core.config import settings
+
+# Службовий каталог недописаних файлів; ключі з сегментами на "." недоступні ззовні
+TMP_DIR = ".tmp"
+
+
+class StorageWriter(ABC):
+    """
+    Запис одного файлу у сховище порціями.
+    Файл стає видимим під своїм ключем лише після commit; abort прибирає недописаний файл.
+    """
+
+    @abstractmethod
+    def write(self, chunk: bytes) -> None:
+        """Дописати порцію вмісту."""
+
+    @abstractmethod
+    def commit(self, key: Optional[str] = None) -> int:
+        """
+        Завершити запис.
+        Ключ можна передати лише тут (наприклад, хеш вмісту, відомий після запису). Якщо файл
+        з таким ключем уже існує, новий вміст відкидається: ключі сховища незмінні.
+
+        Returns:
+            int: Розмір записаного файлу в байтах.
+        """
+
+    @abstractmethod
+    def abort(self) -> None:
+        """Скасувати запис і видалити недописаний файл."""
+
+
+class MediaStorage(ABC):
+    """
+    Базове сховище файлів медіа: оригіналів і похідних версій.
+    Файли адресуються ключами виду "originals/ab/abcdef.jpg"; URL для клієнта будується з ключа.
+    """
+
+    @abstractmethod
+    def open_writer(self, key: Optional[str] = None) -> StorageWriter:
+        """Почати запис нового файлу; ключ можна передати тут або в commit."""
+
+    @abstractmethod
+    def open(self, key: str) -> BinaryIO:
+        """Відкрити збережений файл для читання."""
+
+    @abstractmethod
+    def path(self, key: str) -> str:
+        """Шлях до файлу в локальній файловій системі (для віддачі через FileResponse)."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Видалити файл; відсутній файл не є помилкою."""
+
+    @abstractmethod
+    def url(self, key: str) -> str:
+        """URL файлу для клієнта."""
+
+    @abstractmethod
+    def iter_keys(self, prefix: str) -> Iterator[Tuple[str, float]]:
+        """Ключі файлів під префіксом разом із часом зміни (для прибирання осиротілих файлів)."""
+
+    @abstractmethod
+    def cleanup_tmp(self, max_age: float) -> int:
+        """Видалити недописані файли, старші за max_age секунд (після збоїв посеред завантаження)."""
+
+
+class LocalFileWriter(StorageWriter):
+    def __init__(self, storage: "LocalFileStorage", key: Optional[str] = None) -> None:
+        self.storage = storage
+        self.key = key
+        # Недописані файли лежать у службовому каталозі тієї ж файлової системи: rename атомарний
+        os.makedirs(storage.tmp_dir, exist_ok=True)
+        self._tmp_path = os.path.join(storage.tmp_dir, f"{uuid.uuid4().hex}.part")
+        self._file = open(self._tmp_path, "wb")
+        self.size = 0
+
+    def write(self, chunk: bytes) -> None:
+        self._file.write(chunk)
+        self.size += len(chunk)
+
+    def commit(self, key: Optional[str] = None) -> int:
+        path = self.storage.path(key or self.key)
+        self._file.close()
+        if os.path.exists(path):
+            os.remove(self._tmp_path)
+            return self.size
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Атомарна заміна: читачі ніколи не бачать недописаний файл
+        os.replace(self._tmp_path, path)
+        return self.size
+
+    def abort(self) -> None:
+        self._file.close()
+        try:
+            os.remove(self._tmp_path)
+        except FileNotFoundError:
+            pass
+
+
+class LocalFileStorage(MediaStorage):
+    """Сховище в локальній файловій системі під каталогом root."""
+
+    def __init__(self, root: str, base_url: str) -> None:
+        self.root = os.path.abspath(root)
+        self.base_url = base_url.rstrip("/")
+        self.tmp_dir = os.path.join(self.root, TMP_DIR)
+
+    def path(self, key: str) -> str:
+        """
+        Шлях до файлу за ключем.
+
+        Raises:
+            ValueError: Якщо ключ виходить за межі каталогу сховища або вказує на службовий каталог.
+        """
+        if any(part.startswith(".") for part in key.split("/")):
+            raise ValueError(f"Некоректний ключ сховища: {key}")
+        path = os.path.abspath(os.path.join(self.root, key))
+        if not path.startswith(self.root + os.sep):
+            raise ValueError(f"Некоректний ключ сховища: {key}")
+        return path
+
+    def open_writer(self, key: Optional[str] = None) -> LocalFileWriter:
+        if key is not None:
+            self.path(key)
+        return LocalFileWriter(self, key)
+
+    def open(self, key: str) -> BinaryIO:
+        return open(self.path(key), "rb")
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self.path(key))
+        except FileNotFoundError:
+            pass
+
+    def url(self, key: str) -> str:
+        return f"{self.base_url}/{key}"
+
+    def iter_keys(self, prefix: str) -> Iterator[Tuple[str, float]]:
+        top = os.path.join(self.root, prefix)
+        for directory, _, names in os.walk(top):
+            for name in names:
+                path = os.path.join(directory, name)
+                try:
+                    mtime = os.stat(path).st_mtime
+                except FileNotFoundError:
+                    continue
+                yield os.path.relpath(path, self.root).replace(os.sep, "/"), mtime
+
+    def cleanup_tmp(self, max_age: float) -> int:
+        if not os.path.isdir(self.tmp_dir):
+            return 0
+        cutoff = time.time() - max_age
+        removed = 0
+        for entry in os.scandir(self.tmp_dir):
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+                    removed += 1
+            except FileNotFoundError:
+                continue
+        return removed
+
+
+storage = LocalFileStorage(settings.MEDIA_ROOT, settings.MEDIA_URL)
@@ -0,0 +1,164 @@
+import hashlib
+import os
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, List, Optional
+
+from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+from python_multipart.multipart import MultipartParser, parse_options_header
+
+from app.media.storage import MediaStorage, StorageWriter
+
+# Частина форми з файлом; решта частин — короткі текстові поля
+FILE_FIELD = "file"
+MAX_FIELD_SIZE = 64 * 1024
+
+
+@dataclass
+class StoredUpload:
+    """
+    Результат потокового завантаження: записаний, але ще не зафіксований файл і текстові поля форми.
+    Файл отримує ключ за хешем вмісту; commit або discard викликає код, що зберігає посилання в БД.
+    """
+    key: Optional[str] = None
+    filename: Optional[str] = None
+    content_type: Optional[str] = None
+    size: int = 0
+    # SHA-256 вмісту, обчислений під час запису (hex)
+    content_hash: Optional[str] = None
+    fields: Dict[str, str] = field(default_factory=dict)
+    writer: Optional[StorageWriter] = None
+
+    def commit(self) -> None:
+        """Зафіксувати файл під ключем key; якщо такий вміст уже є у сховищі, копія відкидається."""
+        self.writer.commit(self.key)
+
+    def discard(self) -> None:
+        self.writer.abort()
+
+
+def file_extension(filename: Optional[str]) -> str:
+    ext = os.path.splitext(filename or "")[1].lower()
+    return ext if ext[1:].isalnum() and len(ext) <= 10 else ""
+
+
+def blob_key(content_hash: str, extension: str = "") -> str:
+    """Ключ блоба за хешем вмісту: однаковий вміст завжди отримує той самий ключ."""
+    return f"blobs/{content_hash[:2]}/{content_hash}{extension}"
+
+
+class MultipartUploadReader:
+    """
+    Потоковий розбір multipart/form-data з записом частини file безпосередньо у сховище
+    і підрахунком SHA-256 вмісту на льоту (для адресації вмісту й дедуплікації).
+    На відміну від request.form(), файл не спулиться в тимчасовий файл і не збирається в пам'яті:
+    кожна отримана порція тіла одразу дописується у сховище, тож пам'ять обмежена однією порцією.
+    """
+
+    def __init__(self, storage: MediaStorage, content_type: str, max_size: int) -> None:
+        ctype, params = parse_options_header(content_type)
+        boundary = params.get(b"boundary")
+        if ctype != b"multipart/form-data" or not boundary:
+            raise HTTPException(status_code=415, detail="Очікується тіло multipart/form-data")
+        self.storage = storage
+        self.max_size = max_size
+        self.upload = StoredUpload()
+        self._writer: Optional[StorageWriter] = None
+        self._hasher = hashlib.sha256()
+        self._pending: List[bytes] = []
+        self._headers: Dict[bytes, bytes] = {}
+        self._header_field = b""
+        self._header_value = b""
+        self._part_name: Optional[str] = None
+        self._part_is_file = False
+        self._field_data = bytearray()
+        self._error: Optional[HTTPException] = None
+        self._parser = MultipartParser(boundary, {
+            "on_part_begin": self._on_part_begin,
+            "on_part_data": self._on_part_data,
+            "on_part_end": self._on_part_end,
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished,
+        })
+
+    def _on_part_begin(self) -> None:
+        self._headers = {}
+        self._field_data = bytearray()
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._headers[self._header_field.lower()] = self._header_value
+        self._header_field = self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+        self._part_name = options.get(b"name", b"").decode("utf-8", errors="replace")
+        filename = options.get(b"filename")
+        self._part_is_file = self._part_name == FILE_FIELD and filename is not None
+        if self._part_is_file:
+            if self._writer is not None:
+                self._part_is_file = False
+                self._error = HTTPException(status_code=400, detail="Дозволено лише один файл на запит")
+                return
+            self.upload.filename = filename.decode("utf-8", errors="replace")
+            self.upload.content_type = self._headers.get(b"content-type", b"application/octet-stream").decode("latin-1")
+            self._writer = self.storage.open_writer()
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._error is not None:
+            return
+        if self._part_is_file:
+            self.upload.size += end - start
+            if self.upload.size > self.max_size:
+                self._error = HTTPException(status_code=413, detail="Файл перевищує максимальний розмір")
+                return
+            self._pending.append(data[start:end])
+        else:
+            self._field_data += data[start:end]
+            if len(self._field_data) > MAX_FIELD_SIZE:
+                self._error = HTTPException(status_code=400, detail="Поле форми занадто довге")
+
+    def _on_part_end(self) -> None:
+        if not self._part_is_file and self._part_name:
+            self.upload.fields[self._part_name] = self._field_data.decode("utf-8", errors="replace")
+
+    def _write(self, data: bytes) -> None:
+        # hashlib звільняє GIL на великих порціях, тож хешування йде разом із записом поза циклом подій
+        self._hasher.update(data)
+        self._writer.write(data)
+
+    async def read(self, chunks: AsyncIterator[bytes]) -> StoredUpload:
+        """
+        Прочитати тіло запиту і записати файл у тимчасове місце сховища.
+        Ключ визначається хешем вмісту; викликач має зробити upload.commit() або upload.discard().
+
+        Raises:
+            HTTPException: 400, якщо файлу немає або форма некоректна; 413, якщо файл завеликий.
+        """
+        try:
+            async for chunk in chunks:
+                self._parser.write(chunk)
+                if self._error is not None:
+                    raise self._error
+                if self._pending:
+                    data, self._pending = b"".join(self._pending), []
+                    # Запис у файл — блокуюча операція, тож виконується поза циклом подій
+                    await run_in_threadpool(self._write, data)
+            self._parser.finalize()
+            if self._writer is None:
+                raise HTTPException(status_code=400, detail="Файл не передано")
+            self.upload.content_hash = self._hasher.hexdigest()
+            self.upload.key = blob_key(self.upload.content_hash, file_extension(self.upload.filename))
+            self.upload.writer = self._writer
+        except BaseException:
+            if self._writer is not None:
+                self._writer.abort()
+            raise
+        return self.upload
@@ -1,14 +1,28 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 from app.tags import models, schemas
 from fastapi import HTTPException
+from typing import Optional
+from app.core.http_cache import response_cache
+from app.taxonomy.cache import taxonomy_cache
 
-def get_tags(db: Session, skip: int = 0, limit: int = 100):
+TAG_CURSOR_ATTRS = ("tag_id",)
+
+def _check_page(skip: int, limit: int) -> None:
     if skip < 0:
         raise HTTPException(status_code=400, detail="Параметр skip не може бути від'ємним")
     if limit < 1 or limit > 1000:
         raise HTTPException(status_code=400, detail="Параметр limit має бути від 1 до 1000")
-    return db.query(models.Tag).offset(skip).limit(limit).all()
+
+# Списки тегів віддаються з кешу довідників (app.taxonomy.cache) у порядку tag_id
+def get_tags(db: Session, skip: int = 0, limit: int = 100, cursor: Optional[str] = None):
+    _check_page(skip, limit)
+    return taxonomy_cache.page(db, "tags", skip, limit, cursor)
+
+async def get_tags_async(db: AsyncSession, skip: int = 0, limit: int = 100, cursor: Optional[str] = None):
+    _check_page(skip, limit)
+    return await db.run_sync(taxonomy_cache.page, "tags", skip, limit, cursor)
 
 def create_tag(db: Session, tag_in: schemas.TagCreate):
     try:
@@ -17,7 +31,10 @@ def create_tag(db: Session, tag_in: schemas.TagCreate):
             raise HTTPException(status_code=400, detail="Тег із таким ім'ям уже існує")
         new_tag = models.Tag(name=tag_in.name)
         db.add(new_tag)
+        taxonomy_cache.bump(db, "tags")
         db.commit()
+        response_cache.invalidate("tags")
+        taxonomy_cache.reload(db, "tags")
         db.refresh(new_tag)
         return new_tag
     except SQLAlchemyError as e:
@@ -37,7 +54,10 @@ def update_tag(db: Session, tag: models.Tag, tag_update: schemas.TagUpdate):
                 if existing_tag and existing_tag.id != tag.id:
                     raise HTTPException(status_code=400, detail="Тег із таким ім'ям уже існує")
                 tag.name = tag_update.name
+        taxonomy_cache.bump(db, "tags")
         db.commit()
+        response_cache.invalidate("tags")
+        taxonomy_cache.reload(db, "tags")
         db.refresh(tag)
         return tag
     except SQLAlchemyError as e:
@@ -49,7 +69,10 @@ def delete_tag(db: Session, tag: models.Tag):
         raise HTTPException(status_code=404, detail="Тег не знайдено")
     try:
         db.delete(tag)
+        taxonomy_cache.bump(db, "tags")
         db.commit()
+        response_cache.invalidate("tags")
+        taxonomy_cache.reload(db, "tags")
         return None
     except SQLAlchemyError as e:
         db.rollback()
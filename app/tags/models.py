@@ -1,13 +1,15 @@
 from typing import List
-from sqlalchemy import Integer, String, Table, Column, ForeignKey
+from sqlalchemy import Integer, String, Table, Column, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.database import Base
 
 article_tags = Table(
     "article_tags",
     Base.metadata,
-    Column("article_id", Integer, ForeignKey("articles.article_id", ondelete="CASCADE"), primary_key=True),
-    Column("tag_id", Integer, ForeignKey("tags.tag_id", ondelete="CASCADE"), primary_key=True)
+    Column("article_id", Integer, ForeignKey("articles.id", ondelete="CASCADE"), primary_key=True),
+    Column("tag_id", Integer, ForeignKey("tags.tag_id", ondelete="CASCADE"), primary_key=True),
+    # Первинний ключ (article_id, tag_id) не допомагає вибірці статей за тегом
+    Index("ix_article_tags_tag_id_article_id", "tag_id", "article_id"),
 )
 
 class Tag(Base):
@@ -1,20 +1,26 @@
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Response
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.tags import schemas, crud, models
-from app.db.database import get_db
+from app.db.database import get_db, get_async_db
 from app.auth.dependencies import get_current_active_user
-from typing import Any
+from app.core.pagination import set_next_cursor
+from typing import Any, Optional
 
 router = APIRouter()
 
 @router.get("/", response_model=list[schemas.TagOut], summary="Отримати список тегів")
-def read_tags(
+async def read_tags(
+    response: Response,
     skip: int = Query(0, ge=0, description="Кількість записів для пропуску"),
     limit: int = Query(100, ge=1, le=1000, description="Максимальна кількість тегів"),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="Курсор наступної сторінки із заголовка X-Next-Cursor"),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Отримати список тегів з пагінацією."""
-    return crud.get_tags(db, skip=skip, limit=limit)
+    """Отримати список тегів з пагінацією (skip або cursor)."""
+    tags = await crud.get_tags_async(db, skip=skip, limit=limit, cursor=cursor)
+    set_next_cursor(response, tags, crud.TAG_CURSOR_ATTRS, limit)
+    return tags
 
 @router.post("/", response_model=schemas.TagOut, summary="Створити тег")
 def create_tag(
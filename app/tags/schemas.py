@@ -11,6 +11,7 @@ class TagUpdate(BaseModel):
     name: Optional[str] = None
 
 class TagOut(TagBase):
-    id: int = Field(..., ge=1)
+    # Первинний ключ моделі — tag_id; у відповіді лишається "id"
+    id: int = Field(..., ge=1, validation_alias="tag_id")
 
     model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -0,0 +1,229 @@
+import logging
+import threading
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import Table, insert, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.categories.models import Category
+from app.content_types.models import ContentType
+from app.core.config import settings
+from app.core.pagination import decode_cursor
+from app.db.database import SessionLocal
+from app.tags.models import Tag
+from app.taxonomy.models import TaxonomyVersion
+
+logger = logging.getLogger("uvicorn")
+
+
+class TaxonomySource(NamedTuple):
+    """Таблиця довідника та назва її первинного ключа."""
+    table: Table
+    id_attr: str
+
+
+# Довідники: вид -> джерело; вид є також простором імен response_cache
+TAXONOMIES = {
+    "categories": TaxonomySource(Category.__table__, "id"),
+    "content_types": TaxonomySource(ContentType.__table__, "id"),
+    "tags": TaxonomySource(Tag.__table__, "tag_id"),
+}
+
+
+@dataclass(frozen=True)
+class TaxonomySnapshot:
+    """Незмінний знімок довідника: рядки за зростанням ID та індекси за ID і за назвою."""
+    version: int
+    items: Tuple[Row, ...]
+    ids: Tuple[int, ...]
+    by_id: Dict[int, Row]
+    by_name: Dict[str, Row]
+
+
+class TaxonomyCache:
+    """
+    Кеш довідників (категорії, теги, типи контенту) у пам'яті процесу.
+
+    Довідники малі й змінюються рідко, тож завантажуються цілком при старті, а пошук за ID чи назвою
+    коштує O(1) без звернення до БД. Функції запису в crud перед commit викликають bump, що збільшує
+    штамп версії в taxonomy_versions у тій самій транзакції, а після commit — reload для цього процесу.
+    Інші воркери раз на check_interval секунд читають штампи (один запит на три рядки) і
+    перезавантажують лише змінені довідники. Промах за ID перевіряється в БД (read-through),
+    тож щойно створений в іншому воркері запис не відхиляється як відсутній.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal, check_interval: float = 5.0) -> None:
+        self.session_factory = session_factory
+        self.check_interval = check_interval
+        self.reloads = 0
+        self._lock = threading.Lock()
+        self._snapshots: Dict[str, TaxonomySnapshot] = {}
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def load(self, db: Session, kinds: Iterable[str] = TAXONOMIES) -> None:
+        """Завантажити довідники з БД і замінити їхні знімки."""
+        kinds = tuple(kinds)
+        # Штампи читаються раніше за рядки: зміна між двома запитами дасть старіший штамп і повторне завантаження
+        versions = self._read_versions(db)
+        snapshots = {}
+        for kind in kinds:
+            source = TAXONOMIES[kind]
+            id_column = source.table.c[source.id_attr]
+            items = tuple(db.execute(select(source.table).order_by(id_column)).all())
+            snapshots[kind] = TaxonomySnapshot(
+                version=versions.get(kind, 0),
+                items=items,
+                ids=tuple(getattr(item, source.id_attr) for item in items),
+                by_id={getattr(item, source.id_attr): item for item in items},
+                by_name={item.name: item for item in items},
+            )
+        with self._lock:
+            self._snapshots.update(snapshots)
+            self.reloads += len(snapshots)
+
+    def _read_versions(self, db: Session) -> Dict[str, int]:
+        table = TaxonomyVersion.__table__
+        return dict(db.execute(select(table.c.kind, table.c.version)).all())
+
+    def _snapshot(self, db: Session, kind: str) -> TaxonomySnapshot:
+        snapshot = self._snapshots.get(kind)
+        if snapshot is None:
+            # Кеш ще не завантажено (CLI, тести без lifespan) — завантажуємо під час першого звернення
+            self.load(db, (kind,))
+            snapshot = self._snapshots[kind]
+        return snapshot
+
+    def get(self, kind: str, item_id: int) -> Optional[Row]:
+        """Запис довідника за ID зі знімка або None (без звернення до БД)."""
+        snapshot = self._snapshots.get(kind)
+        return snapshot.by_id.get(item_id) if snapshot else None
+
+    def get_by_name(self, kind: str, name: str) -> Optional[Row]:
+        """Запис довідника за назвою зі знімка або None (без звернення до БД)."""
+        snapshot = self._snapshots.get(kind)
+        return snapshot.by_name.get(name) if snapshot else None
+
+    def exists(self, db: Session, kind: str, ids: Iterable[int]) -> bool:
+        """
+        Перевірити, що всі записи з ids існують.
+        ID, яких немає у знімку, перевіряються одним запитом за первинним ключем; якщо хоч один
+        знайдено, довідник змінився в іншому воркері і перезавантажується.
+
+        Args:
+            db: Сесія бази даних.
+            kind: Вид довідника (ключ TAXONOMIES).
+            ids: ID записів.
+
+        Returns:
+            bool: True, якщо існують усі записи.
+        """
+        snapshot = self._snapshot(db, kind)
+        missing = set(ids) - snapshot.by_id.keys()
+        if not missing:
+            return True
+        source = TAXONOMIES[kind]
+        id_column = source.table.c[source.id_attr]
+        found = set(db.execute(select(id_column).where(id_column.in_(missing))).scalars())
+        if found:
+            self.load(db, (kind,))
+        return found == missing
+
+    def page(self, db: Session, kind: str, skip: int = 0, limit: int = 100,
+             cursor: Optional[str] = None) -> List[Row]:
+        """
+        Сторінка довідника за зростанням ID: ті самі skip/cursor, що й keyset-пагінація в SQL.
+
+        Raises:
+            HTTPException: Якщо курсор некоректний.
+        """
+        snapshot = self._snapshot(db, kind)
+        if cursor:
+            (last_id,) = decode_cursor(cursor, (int,))
+            start = bisect_right(snapshot.ids, last_id)
+        else:
+            start = skip
+        return list(snapshot.items[start:start + limit])
+
+    def bump(self, db: Session, kind: str) -> None:
+        """
+        Збільшити штамп версії довідника в поточній транзакції (викликається з crud перед commit).
+        Штамп комітиться разом зі зміною довідника, тож інші воркери не пропустять зміну, навіть якщо
+        процес завершиться одразу після commit. Помилка БД не перехоплюється: запис відкочується разом зі штампом.
+        """
+        table = TaxonomyVersion.__table__
+        bumped = db.execute(update(table).where(table.c.kind == kind).values(version=table.c.version + 1))
+        if bumped.rowcount == 0:
+            # Рядки штампів створює міграція; без неї (create_all) рядок додається під час першого запису
+            db.execute(insert(table).values(kind=kind, version=1))
+
+    def reload(self, db: Session, kind: str) -> None:
+        """Перезавантажити довідник у цьому процесі після commit, не чекаючи перевірки штампів."""
+        try:
+            self.load(db, (kind,))
+        except SQLAlchemyError:
+            # Без знімка довідник завантажиться заново під час наступного звернення
+            with self._lock:
+                self._snapshots.pop(kind, None)
+            logger.exception("Не вдалося перезавантажити довідник %s", kind)
+
+    def refresh(self) -> int:
+        """
+        Порівняти штампи версій у БД зі знімками і перезавантажити змінені довідники.
+
+        Returns:
+            int: Кількість перезавантажених довідників.
+        """
+        db = self.session_factory()
+        try:
+            versions = self._read_versions(db)
+            stale = [
+                kind for kind in TAXONOMIES
+                if kind not in self._snapshots or self._snapshots[kind].version != versions.get(kind, 0)
+            ]
+            if stale:
+                self.load(db, stale)
+            return len(stale)
+        except SQLAlchemyError:
+            logger.exception("Не вдалося перевірити версії довідників")
+            return 0
+        finally:
+            db.close()
+
+    def clear(self) -> None:
+        """Скинути всі знімки: довідники завантажаться заново під час наступного звернення."""
+        with self._lock:
+            self._snapshots.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Кількість записів у знімках і перезавантажень."""
+        with self._lock:
+            stats = {kind: len(snapshot.items) for kind, snapshot in self._snapshots.items()}
+            stats["reloads"] = self.reloads
+            return stats
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.check_interval):
+            self.refresh()
+
+    def start(self) -> None:
+        """Завантажити довідники і запустити фонову перевірку штампів версій."""
+        if self._thread is not None:
+            return
+        self.refresh()
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="taxonomy-cache", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+taxonomy_cache = TaxonomyCache(check_interval=settings.TAXONOMY_CACHE_CHECK_INTERVAL)
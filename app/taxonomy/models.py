@@ -0,0 +1,13 @@
+from sqlalchemy import Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.database import Base
+
+class TaxonomyVersion(Base):
+    """
+    Штамп версії довідника (categories, tags, content_types).
+    Кожен запис у довідник збільшує version; воркери порівнюють штампи, щоб виявити застарілий кеш.
+    """
+    __tablename__ = "taxonomy_versions"
+
+    kind: Mapped[str] = mapped_column(String(32), primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
@@ -0,0 +1,91 @@
+"""
+Розмір історії редагувань і затримка відновлення версії: повні копії проти знімків і різниць.
+
+Моделює статтю з --edits дрібними правками (кожна змінює кілька слів) і рахує байти вмісту,
+які зберігаються в article_history, та час відновлення останньої версії з найближчого знімка:
+    python -m benchmarks.bench_article_history --edits 500 --words 1500
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ.setdefault("DATABASE_URL", "sqlite:///" + os.path.join(tempfile.gettempdir(), "upb_bench.db"))
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-benchmark-secret-key")
+os.environ.setdefault("ALGORITHM", "HS256")
+
+from app.articles.history import apply_delta, history_content
+from app.core.config import settings
+
+VOCABULARY = [
+    "новини", "економіка", "політика", "спорт", "культура", "технології", "наука", "енергетика",
+    "освіта", "медицина", "бюджет", "вибори", "футбол", "фестиваль", "клімат", "транспорт",
+]
+
+
+def edit(rng: random.Random, words: list) -> list:
+    words = list(words)
+    for _ in range(rng.randint(1, 5)):
+        position = rng.randrange(len(words))
+        action = rng.random()
+        if action < 0.6:
+            words[position] = rng.choice(VOCABULARY)
+        elif action < 0.8:
+            words.insert(position, rng.choice(VOCABULARY))
+        elif len(words) > 1:
+            del words[position]
+    return words
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--edits", type=int, default=500)
+    parser.add_argument("--words", type=int, default=1500)
+    parser.add_argument("--interval", type=int, default=settings.ARTICLE_HISTORY_SNAPSHOT_INTERVAL)
+    parser.add_argument("--repeats", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    words = rng.choices(VOCABULARY, k=args.words)
+    previous = " ".join(words)
+    versions, entries = [], []
+    started = time.perf_counter()
+    for version_num in range(1, args.edits + 1):
+        words = edit(rng, words)
+        current = " ".join(words)
+        entries.append(history_content(version_num, previous, current, args.interval))
+        versions.append(current)
+        previous = current
+    write_ms = (time.perf_counter() - started) * 1000 / args.edits
+
+    full_bytes = sum(len(content.encode("utf-8")) for content in versions)
+    stored_bytes = sum(
+        len(entry["content"].encode("utf-8")) if entry["is_snapshot"] else len(entry["delta"])
+        for entry in entries
+    )
+    snapshots = sum(entry["is_snapshot"] for entry in entries)
+    print(f"full copies   {full_bytes / 1024:>10.1f} KiB")
+    print(f"deltas        {stored_bytes / 1024:>10.1f} KiB  ({snapshots} snapshots, "
+          f"{full_bytes / stored_bytes:.1f}x smaller)")
+    print(f"write         {write_ms:>10.2f} ms per edit (diff + compress)")
+
+    last_snapshot = max(i for i, entry in enumerate(entries) if entry["is_snapshot"])
+    chain = entries[last_snapshot:]
+    latencies = []
+    for _ in range(args.repeats):
+        started = time.perf_counter()
+        content = None
+        for entry in chain:
+            content = entry["content"] if entry["is_snapshot"] else apply_delta(content, entry["delta"])
+        latencies.append((time.perf_counter() - started) * 1000)
+    assert content == versions[-1]
+    print(f"rebuild v{args.edits:<5} {statistics.median(latencies):>7.2f} ms median "
+          f"({len(chain) - 1} deltas after snapshot)")
+
+
+if __name__ == "__main__":
+    main()
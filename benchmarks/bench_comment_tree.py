@@ -0,0 +1,96 @@
+"""
+Побудова дерева коментарів: запит на кожен вузол проти одного рекурсивного CTE.
+
+Заповнює гілку коментарів статті (якщо їх менше, ніж --count) і вимірює обидва підходи.
+Стаття та автор з вказаними ID мають існувати:
+    python -m benchmarks.bench_comment_tree --url postgresql://... --article-id 1 --count 10000
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.comments.crud import get_comment_tree_async
+from app.comments.models import Comment
+from app.db.database import to_async_url
+
+
+def seed(url: str, article_id: int, author_id: int, count: int):
+    """Створити гілку: кожен коментар відповідає на випадковий попередній або стає кореневим."""
+    engine = create_engine(url)
+    table = Comment.__table__
+    with engine.begin() as conn:
+        ids = list(conn.execute(select(table.c.id).where(table.c.article_id == article_id)).scalars())
+    rng = random.Random(42)
+    with engine.begin() as conn:
+        for n in range(len(ids), count):
+            parent_id = rng.choice(ids) if ids and rng.random() > 0.05 else None
+            comment_id = conn.execute(insert(table).values(
+                content=f"Коментар {n}", parent_id=parent_id, article_id=article_id, author_id=author_id,
+            ).returning(table.c.id)).scalar_one()
+            ids.append(comment_id)
+    engine.dispose()
+
+
+def walk_per_node(url: str, article_id: int, max_depth: int) -> int:
+    """Наївний обхід: окремий запит відповідей для кожного вузла."""
+    engine = create_engine(url)
+    table = Comment.__table__
+    queries = 0
+    with engine.connect() as conn:
+        frontier = [None]
+        for depth in range(max_depth + 1):
+            next_frontier = []
+            for parent_id in frontier:
+                condition = table.c.parent_id == parent_id if parent_id else table.c.parent_id.is_(None)
+                next_frontier.extend(conn.execute(
+                    select(table.c.id).where(table.c.article_id == article_id, condition)
+                ).scalars())
+                queries += 1
+            frontier = next_frontier
+    engine.dispose()
+    return queries
+
+
+async def tree_cte(url: str, article_id: int, max_depth: int) -> int:
+    engine = create_async_engine(to_async_url(url))
+    async with AsyncSession(engine) as db:
+        roots = await get_comment_tree_async(db, article_id, limit=1000, max_depth=max_depth, replies_limit=10_000)
+    await engine.dispose()
+    return len(roots)
+
+
+def measure(label, fn, repeats):
+    latencies = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        result = fn()
+        latencies.append((time.perf_counter() - started) * 1000)
+    print(f"{label:<10} median={statistics.median(latencies):>9.1f} ms  max={max(latencies):>9.1f} ms  ({result})")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", required=True)
+    parser.add_argument("--article-id", type=int, default=1)
+    parser.add_argument("--author-id", type=int, default=1)
+    parser.add_argument("--count", type=int, default=10_000)
+    parser.add_argument("--max-depth", type=int, default=50)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+    seed(args.url, args.article_id, args.author_id, args.count)
+    measure("per-node", lambda: f"{walk_per_node(args.url, args.article_id, args.max_depth)} queries", args.repeats)
+    measure("cte", lambda: f"{asyncio.run(tree_cte(args.url, args.article_id, args.max_depth))} roots, 1 query",
+            args.repeats)
+
+
+if __name__ == "__main__":
+    main()
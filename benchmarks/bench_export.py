@@ -0,0 +1,85 @@
+"""
+Пікова пам'ять потокового вивантаження статей.
+
+Заповнює таблицю синтетичними статтями (якщо їх менше, ніж --count), вивантажує її через
+stream_export і друкує пікове RSS процесу після кожних 10% рядків — воно має залишатися сталим.
+Автор, категорія та тип контенту з вказаними ID мають існувати:
+    python -m benchmarks.bench_export --url postgresql://... --count 5000000 --format csv
+"""
+import argparse
+import asyncio
+import os
+import resource
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.articles.crud import ARTICLE_EXPORT_COLUMNS, articles_export_stmt
+from app.articles.models import Article
+from app.core.export import ExportFormat, stream_export
+from app.db.database import to_async_url
+
+
+def seed(url: str, count: int, batch: int, author_id: int, category_id: int, content_type_id: int):
+    engine = create_engine(url)
+    with engine.begin() as conn:
+        existing = conn.execute(select(func.count()).select_from(Article.__table__)).scalar_one()
+    for start in range(existing, count, batch):
+        rows = [{
+            "title": f"Article {n}",
+            "content": "Lorem ipsum dolor sit amet " * 20,
+            "view_count": 0,
+            "author_id": author_id,
+            "category_id": category_id,
+            "content_type_id": content_type_id,
+        } for n in range(start, min(start + batch, count))]
+        with engine.begin() as conn:
+            conn.execute(insert(Article.__table__), rows)
+        print(f"seeded {start + len(rows)}/{count}", end="\r")
+    engine.dispose()
+    print()
+
+
+def peak_rss_mib() -> float:
+    # ru_maxrss — у кілобайтах на Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def export(url: str, count: int, fmt: ExportFormat):
+    engine = create_async_engine(to_async_url(url))
+    session_factory = async_sessionmaker(bind=engine)
+    started = time.perf_counter()
+    total_bytes, newlines, step = 0, 0, max(count // 10, 1)
+    next_report = step
+    print(f"start       peak RSS {peak_rss_mib():>8.1f} MiB")
+    async for chunk in stream_export(articles_export_stmt(), ARTICLE_EXPORT_COLUMNS, fmt, session_factory):
+        total_bytes += len(chunk)
+        newlines += chunk.count(b"\n")
+        if newlines >= next_report:
+            print(f"{newlines:>10} rows  peak RSS {peak_rss_mib():>8.1f} MiB")
+            next_report += step
+    elapsed = time.perf_counter() - started
+    print(f"exported {total_bytes / 2**20:.0f} MiB in {elapsed:.1f} s ({newlines / elapsed:.0f} lines/s)")
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", required=True)
+    parser.add_argument("--count", type=int, default=5_000_000)
+    parser.add_argument("--batch", type=int, default=10_000)
+    parser.add_argument("--format", choices=[f.value for f in ExportFormat], default=ExportFormat.NDJSON.value)
+    parser.add_argument("--author-id", type=int, default=1)
+    parser.add_argument("--category-id", type=int, default=1)
+    parser.add_argument("--content-type-id", type=int, default=1)
+    args = parser.parse_args()
+    seed(args.url, args.count, args.batch, args.author_id, args.category_id, args.content_type_id)
+    asyncio.run(export(args.url, args.count, ExportFormat(args.format)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Швидкість пакетного імпорту статей з NDJSON.
+
+Генерує --count рядків і імпортує їх через ArticleImporter у вказану БД.
+Автор, категорія, тип контенту й теги з вказаними ID мають існувати:
+    python -m benchmarks.bench_import --url postgresql://... --count 100000 --batch-size 5000
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.articles.importer import ArticleImporter
+
+VOCABULARY = ["новини", "економіка", "політика", "спорт", "культура", "технології", "наука", "енергетика"]
+
+
+def generate(count: int, author_id: int, category_id: int, content_type_id: int, tag_ids: list):
+    rng = random.Random(42)
+    for _ in range(count):
+        yield json.dumps({
+            "title": " ".join(rng.choices(VOCABULARY, k=6)),
+            "content": " ".join(rng.choices(VOCABULARY, k=300)),
+            "author_id": author_id,
+            "category_id": category_id,
+            "content_type_id": content_type_id,
+            "tag_ids": rng.sample(tag_ids, k=min(2, len(tag_ids))),
+        }, ensure_ascii=False)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", required=True)
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--author-id", type=int, default=1)
+    parser.add_argument("--category-id", type=int, default=1)
+    parser.add_argument("--content-type-id", type=int, default=1)
+    parser.add_argument("--tag-ids", type=int, nargs="*", default=[1, 2, 3])
+    args = parser.parse_args()
+
+    lines = list(generate(args.count, args.author_id, args.category_id, args.content_type_id, args.tag_ids))
+    Session = sessionmaker(bind=create_engine(args.url), autoflush=False)
+    with Session() as db:
+        started = time.perf_counter()
+        report = ArticleImporter(db, args.batch_size).feed(lines)
+        elapsed = time.perf_counter() - started
+    print(f"imported {report.imported}/{report.total} (failed {report.failed}) in {elapsed:.1f} s "
+          f"— {report.imported / elapsed:.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Затримка GET статті під час "шторму" логінів.
+
+Спершу вимірюється фонова затримка GET, потім та сама вибірка під час паралельних /login.
+Потрібен працюючий сервер і зареєстрований користувач:
+    python -m benchmarks.bench_login_storm --email bench@example.com --password 'Bench123!'
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+
+async def probe(client: httpx.AsyncClient, path: str, samples: int, latencies: list):
+    for _ in range(samples):
+        started = time.perf_counter()
+        await client.get(path)
+        latencies.append((time.perf_counter() - started) * 1000)
+        await asyncio.sleep(0.01)
+
+
+async def login_storm(client: httpx.AsyncClient, email: str, password: str, stop: asyncio.Event, statuses: list):
+    while not stop.is_set():
+        resp = await client.post("/api/v1/auth/login", data={"username": email, "password": password})
+        statuses.append(resp.status_code)
+
+
+def report(label: str, latencies: list):
+    latencies = sorted(latencies)
+    p99 = latencies[max(int(len(latencies) * 0.99) - 1, 0)]
+    print(f"{label:<14} median={statistics.median(latencies):.1f} ms  p99={p99:.1f} ms")
+
+
+async def run(args):
+    limits = httpx.Limits(max_connections=args.logins + 8)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=60) as client:
+        baseline: list = []
+        await probe(client, args.path, args.samples, baseline)
+        report("baseline", baseline)
+
+        stop = asyncio.Event()
+        statuses: list = []
+        storm = [asyncio.create_task(login_storm(client, args.email, args.password, stop, statuses))
+                 for _ in range(args.logins)]
+        during: list = []
+        await probe(client, args.path, args.samples, during)
+        stop.set()
+        await asyncio.gather(*storm)
+        report("login storm", during)
+        rejected = sum(1 for status in statuses if status == 503)
+        print(f"logins={len(statuses)} rejected(503)={rejected}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--path", default="/api/v1/articles/1")
+    parser.add_argument("--email", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--logins", type=int, default=64, help="Паралельні клієнти логіну")
+    parser.add_argument("--samples", type=int, default=300)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Бенчмарк дедуплікації медіа на реалістичній вибірці.
+
+Агентські фото: --photos унікальних файлів (розмір логнормальний, медіана ~600 KB) прикріплюються
+до статей --uploads разів із популярністю за законом Ципфа — кілька знімків дня повторюються десятки
+разів, більшість — один-два. Кожне завантаження проходить MultipartUploadReader (потоковий запис із
+SHA-256) і фіксується в адресованому вмістом сховищі; звіт порівнює логічний обсяг із зайнятим на диску:
+    python -m benchmarks.bench_media_dedup --photos 300 --uploads 2000
+"""
+import argparse
+import asyncio
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ.setdefault("DATABASE_URL", "sqlite:///" + os.path.join(tempfile.gettempdir(), "upb_bench.db"))
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-benchmark-secret-key")
+os.environ.setdefault("ALGORITHM", "HS256")
+
+from app.media.storage import LocalFileStorage
+from app.media.upload import MultipartUploadReader
+
+BOUNDARY = "upb-benchmark-boundary"
+CHUNK = 64 * 1024
+
+
+async def multipart_body(payload: bytes):
+    yield (
+        f"--{BOUNDARY}\r\nContent-Disposition: form-data; name=\"file\"; filename=\"photo.jpg\"\r\n"
+        "Content-Type: image/jpeg\r\n\r\n"
+    ).encode()
+    for offset in range(0, len(payload), CHUNK):
+        yield payload[offset:offset + CHUNK]
+    yield f"\r\n--{BOUNDARY}--\r\n".encode()
+
+
+async def upload_all(storage: LocalFileStorage, photos, picks) -> int:
+    logical = 0
+    for index in picks:
+        reader = MultipartUploadReader(storage, f"multipart/form-data; boundary={BOUNDARY}", 1 << 30)
+        upload = await reader.read(multipart_body(photos[index]))
+        upload.commit()
+        logical += upload.size
+    return logical
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--photos", type=int, default=300)
+    parser.add_argument("--uploads", type=int, default=2000)
+    parser.add_argument("--zipf", type=float, default=1.1, help="Показник закону Ципфа для популярності фото")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    photos = [rng.randbytes(int(min(rng.lognormvariate(13.3, 0.6), 8 * 1024 * 1024))) for _ in range(args.photos)]
+    weights = [1 / (rank + 1) ** args.zipf for rank in range(args.photos)]
+    # Кожне фото хоча б раз, решта завантажень — за популярністю
+    picks = list(range(args.photos)) + rng.choices(range(args.photos), weights, k=max(args.uploads - args.photos, 0))
+    rng.shuffle(picks)
+
+    root = tempfile.mkdtemp(prefix="upb_media_")
+    try:
+        storage = LocalFileStorage(root, "/files")
+        started = time.perf_counter()
+        logical = asyncio.run(upload_all(storage, photos, picks))
+        elapsed = time.perf_counter() - started
+        stored = sum(os.path.getsize(storage.path(key)) for key, _ in storage.iter_keys("blobs/"))
+        print(f"завантажень: {len(picks)}, унікальних файлів: {len(set(picks))}")
+        print(f"логічний обсяг: {logical / 1024 / 1024:9.1f} MB")
+        print(f"на диску:       {stored / 1024 / 1024:9.1f} MB")
+        print(f"зекономлено:    {(logical - stored) / 1024 / 1024:9.1f} MB ({(logical - stored) / logical:.1%})")
+        print(f"пропускна здатність: {logical / elapsed / 1024 / 1024:.1f} MB/s")
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Бенчмарк віддачі файлів медіа: стандартний FileResponse проти MediaFileResponse.
+
+Файл заданого розміру віддається через httpx.ASGITransport повністю та випадковими діапазонами
+по 1 MB (перемотування відео). Вимірюються пропускна здатність і процесорний час на запит;
+з ASGI-сервером, що підтримує http.response.pathsend, або з nginx (MEDIA_ACCEL_REDIRECT_PREFIX)
+тіло взагалі не проходить через Python:
+    python -m benchmarks.bench_media_serving --size-mb 200 --ranges 200
+"""
+import argparse
+import asyncio
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ.setdefault("DATABASE_URL", "sqlite:///" + os.path.join(tempfile.gettempdir(), "upb_bench.db"))
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-benchmark-secret-key")
+os.environ.setdefault("ALGORITHM", "HS256")
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import FileResponse
+
+from app.media.serving import IMMUTABLE_CACHE_CONTROL, media_file_response
+from app.media.storage import LocalFileStorage
+
+KEY = "renditions/bench/video.mp4"
+RANGE = 1024 * 1024
+
+
+def build_app(storage: LocalFileStorage, optimized: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/file")
+    async def read_file(request: Request):
+        if optimized:
+            return await media_file_response(request, storage, KEY, IMMUTABLE_CACHE_CONTROL)
+        return FileResponse(storage.path(KEY))
+
+    return app
+
+
+async def measure(app: FastAPI, size: int, ranges: int):
+    transport = httpx.ASGITransport(app=app)
+    results = {}
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.get("/file", headers={"Range": "bytes=0-0"})  # прогрів, хеш для ETag
+        for label, count, headers_for in (
+            ("повністю", 3, lambda: {}),
+            ("діапазони", ranges, lambda: {"Range": f"bytes={(start := random.randrange(size - RANGE))}-{start + RANGE - 1}"}),
+        ):
+            wall, cpu, total = time.perf_counter(), time.process_time(), 0
+            for _ in range(count):
+                response = await client.get("/file", headers=headers_for())
+                total += len(response.content)
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+            results[label] = (total / wall / 1024 / 1024, cpu / count * 1000)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=int, default=200)
+    parser.add_argument("--ranges", type=int, default=200)
+    args = parser.parse_args()
+    size = args.size_mb * 1024 * 1024
+
+    root = tempfile.mkdtemp(prefix="upb_media_")
+    try:
+        storage = LocalFileStorage(root, "/files")
+        writer = storage.open_writer(KEY)
+        block = os.urandom(RANGE)
+        for _ in range(args.size_mb):
+            writer.write(block)
+        writer.commit()
+        for label, optimized in (("FileResponse", False), ("MediaFileResponse", True)):
+            for mode, (throughput, cpu_ms) in asyncio.run(measure(build_app(storage, optimized), size, args.ranges)).items():
+                print(f"{label:18} {mode:10} {throughput:8.1f} MB/s  CPU {cpu_ms:8.2f} ms/запит")
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Бенчмарк потокового завантаження медіа: MultipartUploadReader проти request.form().
+
+Міні-застосунок обслуговується через httpx.ASGITransport; тіло multipart генерується порціями,
+тож сам бенчмарк не тримає файл у пам'яті. Вимірюються пропускна здатність і пікові алокації
+Python (tracemalloc) для відео заданого розміру:
+    python -m benchmarks.bench_media_upload --size-mb 500
+"""
+import argparse
+import asyncio
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ.setdefault("DATABASE_URL", "sqlite:///" + os.path.join(tempfile.gettempdir(), "upb_bench.db"))
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-benchmark-secret-key")
+os.environ.setdefault("ALGORITHM", "HS256")
+
+import httpx
+from fastapi import FastAPI, Request
+
+from app.media.storage import LocalFileStorage
+from app.media.upload import MultipartUploadReader
+
+BOUNDARY = "upb-benchmark-boundary"
+CHUNK = 1024 * 1024
+
+
+async def multipart_body(size: int):
+    yield (
+        f"--{BOUNDARY}\r\nContent-Disposition: form-data; name=\"article_id\"\r\n\r\n1\r\n"
+        f"--{BOUNDARY}\r\nContent-Disposition: form-data; name=\"file\"; filename=\"video.mp4\"\r\n"
+        "Content-Type: video/mp4\r\n\r\n"
+    ).encode()
+    block = os.urandom(CHUNK)
+    for offset in range(0, size, CHUNK):
+        yield block[:min(CHUNK, size - offset)]
+    yield f"\r\n--{BOUNDARY}--\r\n".encode()
+
+
+def build_app(storage: LocalFileStorage, streaming: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/upload")
+    async def upload(request: Request):
+        if streaming:
+            reader = MultipartUploadReader(storage, request.headers["content-type"], 1 << 40)
+            stored = await reader.read(request.stream())
+            return {"size": stored.size}
+        # Стандартний шлях: Starlette спулить файл у тимчасовий файл, потім копіюємо у сховище
+        form = await request.form()
+        writer = storage.open_writer("originals/form/video.mp4")
+        while chunk := await form["file"].read(CHUNK):
+            writer.write(chunk)
+        return {"size": writer.commit()}
+
+    return app
+
+
+async def measure(app: FastAPI, size: int):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        tracemalloc.start()
+        started = time.perf_counter()
+        response = await client.post(
+            "/upload", content=multipart_body(size),
+            headers={"Content-Type": f"multipart/form-data; boundary={BOUNDARY}"},
+        )
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    assert response.json()["size"] == size, response.text
+    return elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=int, default=500)
+    args = parser.parse_args()
+    size = args.size_mb * 1024 * 1024
+
+    root = tempfile.mkdtemp(prefix="upb_media_")
+    try:
+        storage = LocalFileStorage(root, "/files")
+        for label, streaming in (("request.form()", False), ("потоковий", True)):
+            elapsed, peak = asyncio.run(measure(build_app(storage, streaming), size))
+            print(f"{label:15} {size / elapsed / 1024 / 1024:8.1f} MB/s  пік алокацій {peak / 1024 / 1024:7.1f} MB")
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
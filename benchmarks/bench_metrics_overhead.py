@@ -0,0 +1,60 @@
+"""
+Мікробенчмарк накладних витрат вимірювання запитів (RequestInstrumentation: метрики + журнал доступу).
+
+Міні-застосунок FastAPI з одним маршрутом обслуговується через httpx.ASGITransport без мережі;
+порівнюється пропускна здатність без middleware і з ним:
+    python -m benchmarks.bench_metrics_overhead --requests 5000
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import httpx
+from fastapi import FastAPI
+
+from app.core.access_log import AccessLog
+from app.core.metrics import RequestInstrumentation, metrics_observer
+
+
+def build_app(instrumented: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: int):
+        return {"id": item_id}
+
+    if instrumented:
+        log = AccessLog(sample_rate=0.1, slow_ms=500, handler=logging.NullHandler())
+        app.add_middleware(RequestInstrumentation, routes=app.router.routes, observers=[metrics_observer, log])
+    return app
+
+
+async def measure(app: FastAPI, requests: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for i in range(100):
+            await client.get(f"/items/{i}")
+        started = time.perf_counter()
+        for i in range(requests):
+            await client.get(f"/items/{i}")
+        return requests / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    baseline = asyncio.run(measure(build_app(False), args.requests))
+    instrumented = asyncio.run(measure(build_app(True), args.requests))
+    print(f"без вимірювання: {baseline:10.0f} req/s")
+    print(f"з вимірюванням:  {instrumented:10.0f} req/s ({(1 - instrumented / baseline) * 100:+.1f}% накладних витрат)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Навантажувальний бенчмарк публічних GET-ендпоінтів: запити/с та p99 затримки при високій конкурентності.
+
+Запускається проти працюючого сервера, тож порівняння sync/async робиться двома прогонами
+на різних ревізіях (або різних інстансах):
+    uvicorn app.main:app --workers 1 &
+    python -m benchmarks.bench_read_load --base-url http://localhost:8000 --concurrency 256 --requests 20000
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+PATHS = [
+    "/api/v1/articles/?limit=20",
+    "/api/v1/articles/1",
+    "/api/v1/comments/article/1?limit=50",
+    "/api/v1/categories/",
+    "/api/v1/tags/",
+]
+
+
+async def worker(client: httpx.AsyncClient, queue: asyncio.Queue, latencies: list, errors: list):
+    while True:
+        try:
+            path = queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+        started = time.perf_counter()
+        try:
+            resp = await client.get(path)
+            if resp.status_code >= 500:
+                errors.append(resp.status_code)
+        except httpx.HTTPError as e:
+            errors.append(type(e).__name__)
+        latencies.append(time.perf_counter() - started)
+
+
+async def run(base_url: str, concurrency: int, total: int):
+    queue: asyncio.Queue = asyncio.Queue()
+    for i in range(total):
+        queue.put_nowait(PATHS[i % len(PATHS)])
+    latencies: list = []
+    errors: list = []
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(client, queue, latencies, errors) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+    print(f"concurrency={concurrency} requests={total} errors={len(errors)}")
+    print(f"{total / elapsed:.0f} req/s  median={statistics.median(latencies) * 1000:.1f} ms  p99={p99:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--concurrency", type=int, default=256)
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+    asyncio.run(run(args.base_url, args.concurrency, args.requests))
+
+
+if __name__ == "__main__":
+    main()
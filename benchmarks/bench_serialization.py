@@ -0,0 +1,91 @@
+"""
+Мікробенчмарк серіалізації сторінок списку: стандартний шлях FastAPI проти швидкого.
+
+Стандартний шлях: ORM-подібні об'єкти -> валідація response_model (from_attributes) ->
+dump у JSON-сумісні типи -> json.dumps. Швидкий шлях: словники з кортежів колонок -> orjson.
+Для кожного ендпоінта вимірюються процесорний час і пікові алокації (tracemalloc):
+    python -m benchmarks.bench_serialization --page 100 --content 10000
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ.setdefault("DATABASE_URL", "sqlite:///" + os.path.join(tempfile.gettempdir(), "upb_bench.db"))
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-benchmark-secret-key")
+os.environ.setdefault("ALGORITHM", "HS256")
+
+import orjson
+from pydantic import TypeAdapter
+
+from app.articles.schemas import ArticleOut
+from app.comments.schemas import CommentOut
+
+
+def article_rows(page: int, content: int):
+    now = datetime(2026, 1, 1)
+    return [{
+        "id": i, "title": f"Article {i}", "description": "Опис статті", "content": "ї" * content,
+        "view_count": i * 10, "author_id": 1, "category_id": 2, "tag_ids": [1, 2, 3], "comment_count": 4,
+        "created_at": now + timedelta(minutes=i), "updated_at": now + timedelta(minutes=i), "published_at": None,
+    } for i in range(1, page + 1)]
+
+
+def comment_rows(page: int, content: int):
+    now = datetime(2026, 1, 1)
+    return [{
+        "id": i, "content": "к" * min(content, 1000), "parent_id": None, "article_id": 1, "author_id": 1,
+        "created_at": now + timedelta(minutes=i),
+    } for i in range(1, page + 1)]
+
+
+def standard(adapter: TypeAdapter, objects) -> bytes:
+    validated = adapter.validate_python(objects, from_attributes=True)
+    return json.dumps(adapter.dump_python(validated, mode="json"), ensure_ascii=False,
+                      separators=(",", ":")).encode("utf-8")
+
+
+def fast(rows) -> bytes:
+    return orjson.dumps(rows)
+
+
+def measure(label: str, fn, repeats: int):
+    fn()
+    started = time.process_time()
+    for _ in range(repeats):
+        body = fn()
+    cpu_ms = (time.process_time() - started) * 1000 / repeats
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<9} {cpu_ms:>8.3f} ms CPU  {peak / 1024:>9.1f} KiB peak alloc  {len(body) / 1024:>8.1f} KiB body")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--page", type=int, default=100)
+    parser.add_argument("--content", type=int, default=10000)
+    parser.add_argument("--repeats", type=int, default=200)
+    args = parser.parse_args()
+
+    endpoints = {
+        "GET /api/v1/articles/": (ArticleOut, article_rows(args.page, args.content)),
+        "GET /api/v1/comments/article/{id}": (CommentOut, comment_rows(args.page, args.content)),
+    }
+    for name, (schema, rows) in endpoints.items():
+        adapter = TypeAdapter(list[schema])
+        objects = [SimpleNamespace(**row) for row in rows]
+        print(name)
+        measure("standard", lambda: standard(adapter, objects), args.repeats)
+        measure("fast", lambda: fast(rows), args.repeats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Бенчмарк перевірок довідників під час запису статті: SELECT категорії й тегів проти кешу довідників.
+
+Запуск:
+    python -m benchmarks.bench_taxonomy_cache --writes 20000 --tags 5
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ.setdefault("DATABASE_URL", "sqlite:///" + os.path.join(tempfile.gettempdir(), "upb_bench.db"))
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-benchmark-secret-key")
+os.environ.setdefault("ALGORITHM", "HS256")
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from app.authors.models import Author
+from app.categories.models import Category
+from app.tags.models import Tag
+from app.taxonomy.cache import TaxonomyCache
+from app.taxonomy.models import TaxonomyVersion
+
+CATEGORIES = 50
+TAGS = 500
+
+
+def setup(url: str):
+    engine = create_engine(url, connect_args={"check_same_thread": False})
+    tables = [Author.__table__, Category.__table__, Tag.__table__, TaxonomyVersion.__table__]
+    for table in reversed(tables):
+        table.drop(engine, checkfirst=True)
+    for table in tables:
+        table.create(engine)
+    Session = sessionmaker(bind=engine, autoflush=False)
+    with Session() as db:
+        db.execute(Category.__table__.insert(), [
+            {"id": i, "name": f"category-{i}", "created_by": 1} for i in range(1, CATEGORIES + 1)
+        ])
+        db.execute(Tag.__table__.insert(), [{"tag_id": i, "name": f"tag-{i}"} for i in range(1, TAGS + 1)])
+        db.commit()
+    return engine, Session
+
+
+def check_with_selects(db, category_id, tag_ids):
+    # Як create_article/update_article до кешу: окремі SELECT категорії і тегів
+    category = db.execute(select(Category.__table__).where(Category.id == category_id)).first()
+    tags = db.execute(select(Tag.__table__).where(Tag.tag_id.in_(tag_ids))).all()
+    return category is not None and len(tags) == len(tag_ids)
+
+
+def check_with_cache(db, cache, category_id, tag_ids):
+    return cache.exists(db, "categories", (category_id,)) and cache.exists(db, "tags", tag_ids)
+
+
+def run(label, fn, writes, tags):
+    started = time.perf_counter()
+    for i in range(writes):
+        tag_ids = [(i + k) % TAGS + 1 for k in range(tags)]
+        assert fn(i % CATEGORIES + 1, tag_ids)
+    elapsed = time.perf_counter() - started
+    print(f"{label:<8} {writes / elapsed:>10.0f} checks/s  ({elapsed * 1e6 / writes:.1f} us/write)")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--writes", type=int, default=20000)
+    parser.add_argument("--tags", type=int, default=5)
+    parser.add_argument("--url", default=os.environ["DATABASE_URL"])
+    args = parser.parse_args()
+
+    engine, Session = setup(args.url)
+    with Session() as db:
+        run("selects", lambda category_id, tag_ids: check_with_selects(db, category_id, tag_ids),
+            args.writes, args.tags)
+        cache = TaxonomyCache(session_factory=Session)
+        cache.load(db, ("categories", "tags"))
+        run("cache", lambda category_id, tag_ids: check_with_cache(db, cache, category_id, tag_ids),
+            args.writes, args.tags)
+
+
+if __name__ == "__main__":
+    main()
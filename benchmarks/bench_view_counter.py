@@ -0,0 +1,80 @@
+"""
+Бенчмарк читання однієї "гарячої" статті: коміт на кожен перегляд проти буферизованого лічильника.
+
+Запуск:
+    python -m benchmarks.bench_view_counter --reads 20000 --threads 16
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ.setdefault("DATABASE_URL", "sqlite:///" + os.path.join(tempfile.gettempdir(), "upb_bench.db"))
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-benchmark-secret-key")
+os.environ.setdefault("ALGORITHM", "HS256")
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.articles.models import Article
+from app.articles.views import ViewCounter
+
+
+def setup(url: str):
+    engine = create_engine(url, connect_args={"check_same_thread": False})
+    Article.__table__.drop(engine, checkfirst=True)
+    Article.__table__.create(engine)
+    Session = sessionmaker(bind=engine, autoflush=False)
+    with Session() as db:
+        db.add(Article(id=1, title="Hot", content="x" * 2000, view_count=0,
+                       author_id=1, category_id=1, content_type_id=1))
+        db.commit()
+    return engine, Session
+
+
+def read_with_commit(Session):
+    with Session() as db:
+        article = db.get(Article, 1)
+        article.view_count += 1
+        db.commit()
+
+
+def read_buffered(Session, counter: ViewCounter):
+    with Session() as db:
+        article = db.get(Article, 1)
+        counter.record(article.id)
+
+
+def run(label, fn, reads, threads):
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        for _ in pool.map(lambda _: fn(), range(reads)):
+            pass
+    elapsed = time.perf_counter() - started
+    print(f"{label:<12} {reads / elapsed:>10.0f} reads/s  ({elapsed:.2f} s)")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--reads", type=int, default=20000)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--url", default=os.environ["DATABASE_URL"])
+    args = parser.parse_args()
+
+    engine, Session = setup(args.url)
+    run("commit", lambda: read_with_commit(Session), args.reads, args.threads)
+
+    counter = ViewCounter(session_factory=Session, flush_interval=1.0, flush_size=1000)
+    counter.start()
+    run("buffered", lambda: read_buffered(Session, counter), args.reads, args.threads)
+    counter.stop()
+
+    with Session() as db:
+        print("view_count:", db.get(Article, 1).view_count, "expected:", 2 * args.reads)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import os, sys
+from contextlib import contextmanager
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from app.main import app
+from app.db import database as db
+from app.core.http_cache import response_cache
+from app.taxonomy.cache import taxonomy_cache
+
+class QueryTestDB:
+    """
+    Окрема файлова SQLite для модуля тестів: синхронний рушій готує дані,
+    асинхронний обслуговує ендпоінти, і обидва бачать ті самі таблиці.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+        self.async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        self.Session = sessionmaker(bind=self.engine, autoflush=False)
+        self.AsyncSession = async_sessionmaker(bind=self.async_engine, autoflush=False, expire_on_commit=False)
+
+    @contextmanager
+    def count_queries(self, target=None):
+        """Підрахувати SQL-запити, виконані рушієм (за замовчуванням — асинхронним) усередині блоку."""
+        target = target if target is not None else self.async_engine.sync_engine
+        statements = []
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+        event.listen(target, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(target, "before_cursor_execute", before_cursor_execute)
+
+    def seed_articles(self, count: int) -> None:
+        """Автор, категорія і тип контенту з ID 1, теги 1–3 і count статей із 1–3 тегами кожна."""
+        from app.articles.models import Article
+        from app.authors.models import Author
+        from app.categories.models import Category
+        from app.content_types.models import ContentType
+        from app.tags.models import Tag
+        with self.Session() as session:
+            session.add(Author(id=1, email="author@example.com", hashed_password="x", name="Author", role="admin", created_by=1))
+            session.add(Category(id=1, name="News", created_by=1))
+            session.add(ContentType(id=1, name="Text", created_by=1))
+            tags = [Tag(name=f"tag-{i}") for i in range(3)]
+            session.add_all(tags)
+            for i in range(count):
+                session.add(Article(
+                    title=f"Article {i}", content="Content", view_count=0,
+                    author_id=1, category_id=1, content_type_id=1, tags=tags[: i % 3 + 1],
+                ))
+            session.commit()
+
+def _reset_process_caches():
+    # Кеші процесу переживають модуль тестів і віддавали б дані з бази попереднього модуля
+    response_cache.invalidate(*{rule.namespace for rule in response_cache.rules})
+    taxonomy_cache.clear()
+
+@pytest.fixture(scope="module")
+def query_db(tmp_path_factory):
+    """Чиста база для модуля; залежності get_db і get_async_db ендпоінтів перевизначено на неї."""
+    test_db = QueryTestDB(str(tmp_path_factory.mktemp("db") / "test.db"))
+    db.Base.metadata.create_all(bind=test_db.engine)
+
+    def override_get_db():
+        with test_db.Session() as session:
+            yield session
+
+    async def override_get_async_db():
+        async with test_db.AsyncSession() as session:
+            yield session
+
+    previous = dict(app.dependency_overrides)
+    app.dependency_overrides[db.get_db] = override_get_db
+    app.dependency_overrides[db.get_async_db] = override_get_async_db
+    _reset_process_caches()
+    try:
+        yield test_db
+    finally:
+        app.dependency_overrides.clear()
+        app.dependency_overrides.update(previous)
+        _reset_process_caches()
+        test_db.engine.dispose()
+
+@pytest.fixture(scope="module")
+def client(query_db):
+    return TestClient(app)
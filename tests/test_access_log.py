@@ -0,0 +1,43 @@
+import json
+import logging
+import os, sys
+
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from app.core.access_log import AccessLog
+from app.core.metrics import RequestInstrumentation
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.lines = []
+
+    def emit(self, record):
+        self.lines.append(json.loads(self.format(record)))
+
+def test_errors_and_slow_requests_bypass_sampling():
+    handler = ListHandler()
+    log = AccessLog(sample_rate=0.0, slow_ms=50, handler=handler)
+    app = FastAPI()
+    app.add_middleware(RequestInstrumentation, observers=[log])
+
+    @app.get("/items/{item_id}")
+    def item(item_id: int, slow: bool = False):
+        if slow:
+            import time
+            time.sleep(0.06)
+        if item_id == 404:
+            raise HTTPException(status_code=404)
+        return {"id": item_id}
+
+    log.start()
+    client = TestClient(app)
+    client.get("/items/1")
+    client.get("/items/404")
+    client.get("/items/2?slow=true")
+    log.stop()
+    assert [(line["route"], line["status"]) for line in handler.lines] == [("/items/{item_id}", 404), ("/items/{item_id}", 200)]
+    assert handler.lines[1]["duration_ms"] >= 50
+    assert handler.lines[0]["db_queries"] == 0
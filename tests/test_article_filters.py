@@ -0,0 +1,11 @@
+import pytest
+
+@pytest.fixture(scope="module", autouse=True)
+def articles(query_db):
+    query_db.seed_articles(60)
+
+def test_article_listing_filters_are_plain_query_params(client):
+    resp = client.get("/api/v1/articles/?limit=50&tag_id=3&order_by=view_count")
+    assert resp.status_code == 200
+    assert resp.json() and all(3 in article["tag_ids"] for article in resp.json())
+    assert client.get("/api/v1/articles/?category_id=0").status_code == 422
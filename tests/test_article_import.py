@@ -0,0 +1,34 @@
+import asyncio
+import json
+
+import pytest
+
+from app.articles.importer import ArticleImporter, iter_ndjson_lines
+
+@pytest.fixture(scope="module", autouse=True)
+def references(query_db):
+    # Автор, категорія, тип контенту і теги, на які посилаються імпортовані рядки
+    query_db.seed_articles(0)
+
+def test_bulk_import_resolves_references_per_batch_and_reports_bad_rows(query_db):
+    session = query_db.Session()
+    row = {"title": "Imported", "content": "Body", "author_id": 1, "category_id": 1, "content_type_id": 1, "tag_ids": [1, 2]}
+    lines = [json.dumps(row)] * 250 + ["{not json", json.dumps({**row, "category_id": 99})]
+    with query_db.count_queries(query_db.engine) as statements:
+        report = ArticleImporter(session, batch_size=100).feed(lines)
+    session.close()
+    assert (report.total, report.imported, report.failed) == (252, 250, 2)
+    assert [error.line for error in report.errors] == [251, 252]
+    selects = [statement for statement in statements if statement.lstrip().upper().startswith("SELECT")]
+    # Посилання перевіряються один раз, наступні пакети беруть ID із пам'яті; відсутня категорія — ще один запит
+    assert len(selects) <= 5, selects
+
+def test_ndjson_lines_are_reassembled_across_chunks():
+    async def chunks():
+        for chunk in (b'{"a": "\xd1', b"\x97", b'"}\n{"b"', b": 1}\n", b"\n", b'{"c": 2}'):
+            yield chunk
+
+    async def collect():
+        return [line async for line in iter_ndjson_lines(chunks())]
+
+    assert asyncio.run(collect()) == ['{"a": "ї"}', '{"b": 1}', "", '{"c": 2}']
@@ -0,0 +1,58 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.media import crud as media_crud
+from app.media.models import Media
+from app.media.schemas import MediaCreate
+
+# Стаття з тегами — два запити; вбудовані медіа додають ще один
+MAX_DETAIL_QUERIES = 3
+
+@pytest.fixture(scope="module", autouse=True)
+def articles(query_db):
+    query_db.seed_articles(5)
+
+def test_article_media_is_listed_batched_and_embedded_with_one_query_each(query_db, client):
+    session = query_db.Session()
+    media_items = [Media(article_id=4, media_type="image", url=f"https://example.com/{i}.jpg") for i in range(5)]
+    session.add_all(media_items)
+    session.commit()
+    ids = [media.id for media in media_items]
+    with query_db.count_queries(query_db.engine) as statements:
+        batch = media_crud.get_media_batch(session, [ids[3], 10**6, ids[1]])
+    assert [media.id for media in batch] == [ids[3], ids[1]]
+    assert len(statements) == 1, statements
+    session.close()
+
+    with query_db.count_queries() as statements:
+        resp = client.get("/api/v1/articles/4/media")
+    assert resp.status_code == 200
+    assert [media["id"] for media in resp.json()] == ids
+    assert len(statements) == 1, statements
+    assert client.get("/api/v1/articles/5/media").json() == []
+    assert client.get("/api/v1/articles/100000/media").status_code == 404
+
+    with query_db.count_queries() as statements:
+        resp = client.get("/api/v1/articles/4?embed=media")
+    assert resp.status_code == 200
+    assert [media["id"] for media in resp.json()["media"]] == ids
+    assert len(statements) <= MAX_DETAIL_QUERIES, statements
+    assert "media" not in client.get("/api/v1/articles/4").json()
+    assert client.get("/api/v1/articles/4?embed=media&view=summary").status_code == 400
+
+def test_media_writes_invalidate_cached_article_responses(query_db, client):
+    author = SimpleNamespace(id=1)
+    assert client.get("/api/v1/articles/2?embed=media").json()["media"] == []
+
+    session = query_db.Session()
+    media = media_crud.create_media(session, MediaCreate(
+        article_id=2, media_type="image", url="https://example.com/new.jpg",
+    ), author)
+    resp = client.get("/api/v1/articles/2?embed=media")
+    assert [item["id"] for item in resp.json()["media"]] == [media.id]
+    assert [item["id"] for item in client.get("/api/v1/articles/2/media").json()] == [media.id]
+
+    media_crud.delete_media(session, media, author)
+    session.close()
+    assert client.get("/api/v1/articles/2?embed=media").json()["media"] == []
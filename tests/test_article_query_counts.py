@@ -0,0 +1,23 @@
+import pytest
+
+# Межа кількості SQL-запитів на ендпоінт, незалежна від розміру сторінки
+MAX_ARTICLE_QUERIES = 2
+
+@pytest.fixture(scope="module", autouse=True)
+def articles(query_db):
+    query_db.seed_articles(60)
+
+def test_article_listing_query_count_does_not_grow_with_page_size(query_db, client):
+    for limit in (5, 50):
+        with query_db.count_queries() as statements:
+            resp = client.get(f"/api/v1/articles/?limit={limit}")
+        assert resp.status_code == 200
+        assert len(resp.json()) == limit
+        assert all(article["tag_ids"] for article in resp.json())
+        assert len(statements) <= MAX_ARTICLE_QUERIES, statements
+
+def test_article_detail_query_count(query_db, client):
+    with query_db.count_queries() as statements:
+        resp = client.get("/api/v1/articles/1")
+    assert resp.status_code == 200
+    assert len(statements) <= MAX_ARTICLE_QUERIES, statements
@@ -0,0 +1,21 @@
+import pytest
+
+from app.articles import crud as articles_crud
+from app.articles.models import Article, ArticleHistory
+from app.articles.schemas import ArticleUpdate
+
+@pytest.fixture(scope="module", autouse=True)
+def articles(query_db):
+    query_db.seed_articles(3)
+
+def test_article_edits_number_versions_without_counting_history(query_db):
+    session = query_db.Session()
+    article = session.get(Article, 1)
+    for i in range(3):
+        with query_db.count_queries(query_db.engine) as statements:
+            articles_crud.update_article(session, article, ArticleUpdate(title=f"Edit {i}"))
+        assert not any("count(" in statement.lower() for statement in statements), statements
+    versions = session.query(ArticleHistory.version_num).filter(ArticleHistory.article_id == 1).all()
+    assert sorted(v for (v,) in versions) == [1, 2, 3]
+    assert article.current_version == 3
+    session.close()
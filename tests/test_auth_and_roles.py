@@ -2,6 +2,7 @@ import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 import os, sys
 
 # Налаштування шляху до застосунку
@@ -9,10 +10,13 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from app.main import app
 from app.db import database as db
 from app.authors.models import Author
+from app.categories.models import Category
+from app.content_types.models import ContentType
 
 # Тестова БД (SQLite in-memory)
 TEST_DATABASE_URL = "sqlite:///:memory:"
-engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False})
+# StaticPool: одне з'єднання на всі сесії, інакше кожне з'єднання бачить власну порожню in-memory БД
+engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False}, poolclass=StaticPool)
 TestingSessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
 
 # Перевизначення залежності get_db для використання тестової БД
@@ -39,13 +43,13 @@ def get_auth_headers(token: str):
 def test_registration_and_login_and_me():
     # Реєстрація нового користувача
     email = "testuser@example.com"
-    resp = create_user(email, "Test User", "password123")
+    resp = create_user(email, "Test User", "Password123!")
     assert resp.status_code == 200
     data = resp.json()
     assert data["email"] == email
     assert "id" in data
     # Логін та отримання токенів
-    resp = login_user(email, "password123")
+    resp = login_user(email, "Password123!")
     assert resp.status_code == 200
     tokens = resp.json()
     assert "access_token" in tokens and "refresh_token" in tokens
@@ -62,8 +66,8 @@ def test_registration_and_login_and_me():
 
 def test_refresh_token_flow():
     email = "refresher@example.com"
-    create_user(email, "Refresher User", "refreshpass")
-    resp = login_user(email, "refreshpass")
+    create_user(email, "Refresher User", "Refresh123!")
+    resp = login_user(email, "Refresh123!")
     tokens = resp.json()
     access_token = tokens["access_token"]
     refresh_token = tokens["refresh_token"]
@@ -79,23 +83,27 @@ def test_refresh_token_flow():
 
 def test_role_based_access():
     # Створення 3 користувачів: user, editor, admin
-    create_user("user1@example.com", "Normal User", "pass12345")
-    create_user("editor1@example.com", "Editor User", "pass12345")
-    create_user("admin1@example.com", "Admin User", "pass12345")
+    create_user("user1@example.com", "Normal User", "Pass12345!")
+    create_user("editor1@example.com", "Editor User", "Pass12345!")
+    create_user("admin1@example.com", "Admin User", "Pass12345!")
     # Призначення ролей editor та admin
     session = TestingSessionLocal()
     user = session.query(Author).filter(Author.email == "user1@example.com").first()
     editor = session.query(Author).filter(Author.email == "editor1@example.com").first()
     admin = session.query(Author).filter(Author.email == "admin1@example.com").first()
     assert user and editor and admin
+    user_id = user.id
     editor.role = "editor"
     admin.role = "admin"
+    # Категорія і тип контенту для статей
+    session.add(Category(id=1, name="General", created_by=admin.id))
+    session.add(ContentType(id=1, name="Text", created_by=admin.id))
     session.commit()
     session.close()
     # Отримання токенів для кожного
-    tok_user = login_user("user1@example.com", "pass12345").json()
-    tok_editor = login_user("editor1@example.com", "pass12345").json()
-    tok_admin = login_user("admin1@example.com", "pass12345").json()
+    tok_user = login_user("user1@example.com", "Pass12345!").json()
+    tok_editor = login_user("editor1@example.com", "Pass12345!").json()
+    tok_admin = login_user("admin1@example.com", "Pass12345!").json()
     at_user = tok_user["access_token"]; at_editor = tok_editor["access_token"]; at_admin = tok_admin["access_token"]
     # Звичайний користувач створює статтю
     art_data = {
@@ -109,7 +117,7 @@ def test_role_based_access():
     # Редактор створює іншу статтю від імені user
     art_data2 = {
         "title": "Other Article", "description": "Desc", "content": "Content", "view_count": 0,
-        "author_id": user.id, "category_id": 1, "content_type_id": 1, "tag_ids": []
+        "author_id": user_id, "category_id": 1, "content_type_id": 1, "tag_ids": []
     }
     resp2 = client.post("/api/v1/articles/", json=art_data2, headers=get_auth_headers(at_editor))
     assert resp2.status_code == 200
@@ -141,3 +149,14 @@ def test_role_based_access():
     # Адмін може видалити категорію
     cat_del2 = client.delete(f"/api/v1/categories/{cat_id}", headers=get_auth_headers(at_admin))
     assert cat_del2.status_code == 204
+
+def test_register_rejects_duplicates_before_hashing(monkeypatch):
+    from app.auth import utils
+    create_user("dup@example.com", "Dup User", "Password123!")
+    async def fail_hash(password):
+        raise AssertionError("дублікат не повинен потрапляти в пул bcrypt")
+    monkeypatch.setattr(utils, "get_password_hash_async", fail_hash)
+    assert create_user("dup@example.com", "Other Name", "Password123!").status_code == 400
+    assert create_user("other@example.com", "Dup User", "Password123!").status_code == 400
+    # Пароль, довший за 72 байти, відхиляється валідацією, а не помилкою bcrypt
+    assert create_user("long@example.com", "Long User", "Aa1!" + "a" * 69).status_code == 422
@@ -0,0 +1,28 @@
+import pytest
+
+from app.articles.models import Article
+from app.auth.cache import Principal
+from app.comments import crud as comments_crud
+from app.comments.schemas import CommentCreate
+
+# Лічильник коментарів читається зі статті, тож кількість запитів списку не змінюється
+MAX_LISTING_QUERIES = 2
+
+@pytest.fixture(scope="module", autouse=True)
+def articles(query_db):
+    query_db.seed_articles(10)
+
+def test_comment_count_is_maintained_and_listed_without_extra_queries(query_db, client):
+    session = query_db.Session()
+    user = Principal(id=1, role="user", is_active=True)
+    comments = [comments_crud.create_comment(session, CommentCreate(content=f"c{i}", article_id=2), user) for i in range(3)]
+    comments_crud.delete_comment(session, comments[0], user)
+    session.execute(Article.__table__.update().where(Article.id == 3).values(comment_count=7))
+    session.commit()
+    assert comments_crud.repair_comment_counts(session, batch_size=16) == 1
+    session.close()
+    with query_db.count_queries() as statements:
+        resp = client.get("/api/v1/articles/?limit=10")
+    counts = {article["id"]: article["comment_count"] for article in resp.json()}
+    assert counts[2] == 2 and counts[3] == 0
+    assert len(statements) <= MAX_LISTING_QUERIES, statements
@@ -0,0 +1,23 @@
+import os, sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from app.comments.crud import build_comment_tree
+
+def _row(id, parent_id, depth, replies_total=0):
+    return {"id": id, "parent_id": parent_id, "depth": depth, "replies_total": replies_total}
+
+def test_build_comment_tree_nests_and_limits_replies():
+    rows = [
+        _row(1, None, 0, 3), _row(2, None, 0),
+        _row(3, 1, 1, 1), _row(4, 1, 1), _row(5, 1, 1, 1),
+        _row(6, 3, 2), _row(7, 5, 2),
+    ]
+    roots = build_comment_tree(rows, replies_limit=2)
+    assert [node["id"] for node in roots] == [1, 2]
+    first = roots[0]
+    assert first["replies_total"] == 3
+    assert [node["id"] for node in first["replies"]] == [3, 4]
+    assert [node["id"] for node in first["replies"][0]["replies"]] == [6]
+    # Відповідь 7 належить відрізаному піддереву 5 і не потрапляє в дерево
+    assert all(node["id"] != 7 for node in first["replies"][1]["replies"])
+    assert roots[1]["replies"] == []
@@ -0,0 +1,21 @@
+import asyncio
+
+import pytest
+
+from app.articles import crud as articles_crud
+from app.core.export import ExportFormat, stream_export
+
+@pytest.fixture(scope="module", autouse=True)
+def articles(query_db):
+    query_db.seed_articles(30)
+
+def test_export_streams_every_row_in_chunks(query_db):
+    async def collect(fmt):
+        stmt = articles_crud.articles_export_stmt(category_id=1)
+        return [chunk async for chunk in stream_export(stmt, articles_crud.ARTICLE_EXPORT_COLUMNS, fmt, query_db.AsyncSession, chunk_rows=7)]
+    csv_lines = b"".join(asyncio.run(collect(ExportFormat.CSV))).decode().splitlines()
+    assert csv_lines[0].split(",") == list(articles_crud.ARTICLE_EXPORT_COLUMNS)
+    assert len(csv_lines) - 1 == 30
+    ndjson_chunks = asyncio.run(collect(ExportFormat.NDJSON))
+    assert len(ndjson_chunks) > 1
+    assert b"".join(ndjson_chunks).count(b"\n") == 30
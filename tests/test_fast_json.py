@@ -0,0 +1,21 @@
+import pytest
+
+from app.core.config import settings
+
+@pytest.fixture(scope="module", autouse=True)
+def articles(query_db):
+    query_db.seed_articles(20)
+
+def get_listing(client, fast: bool):
+    previous = settings.FAST_JSON_RESPONSES
+    settings.FAST_JSON_RESPONSES = fast
+    try:
+        return client.get("/api/v1/articles/?limit=10")
+    finally:
+        settings.FAST_JSON_RESPONSES = previous
+
+def test_fast_listing_matches_validated_response(client):
+    fast = get_listing(client, True)
+    validated = get_listing(client, False)
+    assert fast.json() == validated.json()
+    assert fast.headers["X-Next-Cursor"] == validated.headers["X-Next-Cursor"]
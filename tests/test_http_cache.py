@@ -0,0 +1,92 @@
+import os, sys
+
+from fastapi import FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.testclient import TestClient
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from app.core.http_cache import ResponseCache, set_hit_context
+
+def make_client():
+    cache = ResponseCache()
+    cache.add_rule(r"/items/", ttl=60, namespace="items")
+    calls = []
+    app = FastAPI()
+    app.middleware("http")(cache)
+
+    @app.get("/items/")
+    def items():
+        calls.append(1)
+        return [{"id": 1}]
+
+    return TestClient(app), cache, calls
+
+def test_repeat_get_is_served_from_cache_with_etag():
+    client, cache, calls = make_client()
+    first = client.get("/items/")
+    second = client.get("/items/")
+    assert first.json() == second.json() == [{"id": 1}]
+    assert first.headers["etag"] == second.headers["etag"]
+    assert len(calls) == 1
+    not_modified = client.get("/items/", headers={"If-None-Match": first.headers["etag"]})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    stats = cache.stats()
+    assert stats["hits"] == 2 and stats["misses"] == 1
+    assert stats["bytes_saved"] == len(first.content)
+
+def test_invalidate_forces_regeneration():
+    client, cache, calls = make_client()
+    client.get("/items/")
+    cache.invalidate("items")
+    client.get("/items/")
+    assert len(calls) == 2
+
+def test_hits_receive_the_context_stored_with_the_response():
+    cache = ResponseCache()
+    hits = []
+    cache.add_rule(r"/items/(?P<item_id>\d+)", ttl=60, namespace="items",
+                   on_hit=lambda match, context: hits.append((int(match["item_id"]), context.get("group_id"))))
+    app = FastAPI()
+    app.middleware("http")(cache)
+
+    @app.get("/items/{item_id}")
+    def item(item_id: int, request: Request):
+        # Група відома лише після читання з БД; з кешу її треба відновити без запиту
+        set_hit_context(request, group_id=item_id * 10)
+        return {"id": item_id}
+
+    client = TestClient(app)
+    client.get("/items/3")
+    assert hits == []
+    client.get("/items/3")
+    client.get("/items/3", headers={"If-None-Match": client.get("/items/3").headers["etag"]})
+    assert hits == [(3, 30)] * 3
+
+def test_cors_headers_follow_the_origin_of_each_hit(client):
+    # Перший запит без Origin заповнює кеш; влучання мають отримати CORS-заголовки свого Origin
+    assert client.get("/api/v1/tags/").status_code == 200
+    for origin in ("http://localhost:3000", "http://localhost"):
+        resp = client.get("/api/v1/tags/", headers={"Origin": origin})
+        assert resp.headers["access-control-allow-origin"] == origin
+    assert "access-control-allow-origin" not in client.get("/api/v1/tags/", headers={"Origin": "https://evil.example"}).headers
+    assert "access-control-allow-origin" not in client.get("/api/v1/tags/").headers
+
+def test_stored_entries_leave_out_cors_headers():
+    # CORS усередині кешу: заголовки запиту, що заповнив запис, не повинні дістатися іншому Origin
+    cache = ResponseCache()
+    cache.add_rule(r"/items/", ttl=60, namespace="items")
+    app = FastAPI()
+    app.add_middleware(CORSMiddleware, allow_origins=["http://a.example", "http://b.example"])
+    app.middleware("http")(cache)
+
+    @app.get("/items/")
+    def items():
+        return [{"id": 1}]
+
+    client = TestClient(app)
+    assert client.get("/items/", headers={"Origin": "http://a.example"}).headers["access-control-allow-origin"] == "http://a.example"
+    hit = client.get("/items/", headers={"Origin": "http://b.example"})
+    assert cache.stats()["hits"] == 1
+    assert "access-control-allow-origin" not in hit.headers
+    assert "vary" not in hit.headers
@@ -0,0 +1,41 @@
+import hashlib, os
+from types import SimpleNamespace
+
+import pytest
+
+from app.media import crud as media_crud
+from app.media.models import MediaBlob
+from app.media.storage import LocalFileStorage
+from app.media.upload import StoredUpload, blob_key
+
+@pytest.fixture(scope="module", autouse=True)
+def articles(query_db):
+    query_db.seed_articles(1)
+
+def test_duplicate_uploads_share_one_blob_until_collected(query_db, tmp_path):
+    media_storage = LocalFileStorage(str(tmp_path), "/files")
+    payload = os.urandom(4096)
+    content_hash = hashlib.sha256(payload).hexdigest()
+    user = SimpleNamespace(id=1)
+    session = query_db.Session()
+    uploads = []
+    for _ in range(2):
+        writer = media_storage.open_writer()
+        writer.write(payload)
+        upload = StoredUpload(key=blob_key(content_hash, ".jpg"), content_type="image/jpeg", size=len(payload),
+                              content_hash=content_hash, fields={"article_id": "1"}, writer=writer)
+        uploads.append(media_crud.create_uploaded_media(session, upload, user))
+    assert uploads[0].storage_key == uploads[1].storage_key
+    assert session.get(MediaBlob, content_hash).ref_count == 2
+    assert [key for key, _ in media_storage.iter_keys("blobs/")] == [uploads[0].storage_key]
+    assert media_crud.storage_report(session).saved_bytes >= len(payload)
+
+    media_crud.delete_media(session, uploads[0], user)
+    assert media_crud.collect_garbage(session, media_storage, grace=0) == (0, 0)
+    media_crud.delete_media(session, uploads[1], user)
+    session.expire_all()
+    assert session.get(MediaBlob, content_hash).ref_count == 0
+    assert media_crud.collect_garbage(session, media_storage, grace=0) == (1, len(payload))
+    assert session.get(MediaBlob, content_hash) is None
+    assert list(media_storage.iter_keys("blobs/")) == []
+    session.close()
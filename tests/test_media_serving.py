@@ -0,0 +1,41 @@
+import hashlib
+import os, sys
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from app.media.serving import IMMUTABLE_CACHE_CONTROL, media_file_response
+from app.media.storage import LocalFileStorage
+
+def serving_client(tmp_path, payload):
+    storage = LocalFileStorage(str(tmp_path), "/files")
+    writer = storage.open_writer("renditions/ab/clip.mp4")
+    writer.write(payload)
+    writer.commit()
+    app = FastAPI()
+
+    @app.get("/files/{key:path}")
+    async def read_file(request: Request, key: str):
+        return await media_file_response(request, storage, key, IMMUTABLE_CACHE_CONTROL)
+
+    return TestClient(app)
+
+def test_ranges_and_content_hash_etag(tmp_path):
+    payload = os.urandom(3 * 1024 * 1024 + 17)
+    client = serving_client(tmp_path, payload)
+    full = client.get("/files/renditions/ab/clip.mp4")
+    etag = f'"{hashlib.sha256(payload).hexdigest()}"'
+    assert full.content == payload and full.headers["etag"] == etag
+    assert full.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL and full.headers["content-type"] == "video/mp4"
+
+    part = client.get("/files/renditions/ab/clip.mp4", headers={"Range": "bytes=1048576-2097151", "If-Range": etag})
+    assert part.status_code == 206 and part.content == payload[1048576:2097152]
+    assert part.headers["content-range"] == f"bytes 1048576-2097151/{len(payload)}"
+    # Застарілий If-Range: повертається весь файл, а не діапазон іншої версії
+    stale = client.get("/files/renditions/ab/clip.mp4", headers={"Range": "bytes=0-9", "If-Range": '"stale"'})
+    assert stale.status_code == 200 and len(stale.content) == len(payload)
+
+    assert client.get("/files/renditions/ab/clip.mp4", headers={"If-None-Match": etag}).status_code == 304
+    assert client.get("/files/renditions/ab/missing.mp4").status_code == 404
+    assert client.get("/files/..%2F..%2Fetc%2Fpasswd").status_code == 404
@@ -0,0 +1,55 @@
+import hashlib
+import io
+import os, sys
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from PIL import Image
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from app.media.renditions import generate_renditions
+from app.media.storage import LocalFileStorage
+from app.media.upload import MultipartUploadReader
+
+def upload_app(storage, max_size):
+    app = FastAPI()
+
+    @app.post("/upload")
+    async def upload(request: Request):
+        reader = MultipartUploadReader(storage, request.headers.get("content-type", ""), max_size)
+        stored = await reader.read(request.stream())
+        stored.commit()
+        return {"key": stored.key, "size": stored.size, "fields": stored.fields, "content_type": stored.content_type}
+
+    return TestClient(app)
+
+def test_upload_is_streamed_to_storage(tmp_path):
+    storage = LocalFileStorage(str(tmp_path), "/files")
+    client = upload_app(storage, max_size=1024 * 1024)
+    payload = os.urandom(300 * 1024)
+    response = client.post("/upload", data={"article_id": "7"}, files={"file": ("clip.MP4", payload, "video/mp4")})
+    body = response.json()
+    digest = hashlib.sha256(payload).hexdigest()
+    assert response.status_code == 200
+    assert body["key"] == f"blobs/{digest[:2]}/{digest}.mp4"
+    assert body["size"] == len(payload) and body["fields"] == {"article_id": "7"}
+    with storage.open(body["key"]) as stored:
+        assert stored.read() == payload
+    too_big = client.post("/upload", files={"file": ("big.bin", os.urandom(2 * 1024 * 1024), "video/mp4")})
+    assert too_big.status_code == 413
+    # Після відхилення в сховищі лишається тільки перший файл, без недописаних .part
+    assert [name for _, _, names in os.walk(tmp_path) for name in names] == [os.path.basename(body["key"])]
+
+def test_renditions_are_scaled_webp(tmp_path):
+    storage = LocalFileStorage(str(tmp_path), "/files")
+    buffer = io.BytesIO()
+    Image.new("RGB", (4000, 2000), "red").save(buffer, format="JPEG")
+    writer = storage.open_writer("originals/ab/photo.jpg")
+    writer.write(buffer.getvalue())
+    writer.commit()
+    renditions = generate_renditions(storage, "originals/ab/photo.jpg")
+    assert (renditions["webp"]["width"], renditions["webp"]["height"]) == (1600, 800)
+    assert (renditions["thumbnail"]["width"], renditions["thumbnail"]["height"]) == (320, 160)
+    assert renditions["thumbnail"]["url"] == "/files/renditions/ab/photo/thumbnail.webp"
+    with Image.open(storage.path("renditions/ab/photo/thumbnail.webp")) as thumbnail:
+        assert thumbnail.format == "WEBP"
@@ -0,0 +1,34 @@
+import os, sys
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from app.core.metrics import Histogram, MetricsRegistry, RequestInstrumentation
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    histogram = registry.register(Histogram("latency", "Latency", ("route",), buckets=(0.1, 1.0)))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value, "/a")
+    lines = registry.render().splitlines()
+    assert 'latency_bucket{route="/a",le="0.1"} 2' in lines
+    assert 'latency_bucket{route="/a",le="1.0"} 3' in lines
+    assert 'latency_bucket{route="/a",le="+Inf"} 4' in lines
+    assert 'latency_count{route="/a"} 4' in lines
+
+def test_instrumentation_labels_requests_by_route_template():
+    observed = []
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    def item(item_id: int):
+        return {"id": item_id}
+
+    app.add_middleware(RequestInstrumentation, routes=app.router.routes,
+                       observers=[lambda scope, route, status, duration, stats: observed.append((route, status))])
+    client = TestClient(app)
+    client.get("/items/1")
+    client.get("/items/2")
+    client.get("/missing")
+    assert observed == [("/items/{item_id}", 200), ("/items/{item_id}", 200), (None, 404)]
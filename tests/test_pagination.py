@@ -0,0 +1,27 @@
+import os, sys
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from app.core.pagination import encode_cursor, decode_cursor, next_cursor
+
+def test_cursor_roundtrip():
+    created = datetime(2025, 4, 1, 12, 30, 5)
+    cursor = encode_cursor(created, 42)
+    assert decode_cursor(cursor, (datetime.fromisoformat, int)) == (created, 42)
+
+def test_invalid_cursor_is_rejected():
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor("not-a-cursor", (int,))
+    assert exc.value.status_code == 400
+    with pytest.raises(HTTPException):
+        decode_cursor(encode_cursor(1, 2), (int,))
+
+def test_next_cursor_only_for_full_page():
+    class Row:
+        def __init__(self, id):
+            self.id = id
+    assert next_cursor([Row(1), Row(2)], ("id",), limit=3) is None
+    assert decode_cursor(next_cursor([Row(1), Row(2)], ("id",), limit=2), (int,)) == (2,)
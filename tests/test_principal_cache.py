@@ -0,0 +1,26 @@
+import os, sys, time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from app.auth.cache import Principal, PrincipalCache
+
+def test_hits_misses_and_invalidation():
+    cache = PrincipalCache(max_size=10, ttl=60)
+    assert cache.get(1) is None
+    cache.put(Principal(id=1, role="user", is_active=True))
+    assert cache.get(1).role == "user"
+    cache.invalidate(1)
+    assert cache.get(1) is None
+    assert cache.stats() == {"hits": 1, "misses": 2, "size": 0}
+
+def test_lru_eviction_and_ttl():
+    cache = PrincipalCache(max_size=2, ttl=60)
+    for user_id in (1, 2):
+        cache.put(Principal(id=user_id, role="user", is_active=True))
+    cache.get(1)
+    cache.put(Principal(id=3, role="user", is_active=True))
+    assert cache.get(2) is None
+    assert cache.get(1) is not None
+    expiring = PrincipalCache(max_size=2, ttl=0.01)
+    expiring.put(Principal(id=1, role="admin", is_active=True))
+    time.sleep(0.02)
+    assert expiring.get(1) is None
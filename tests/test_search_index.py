@@ -0,0 +1,20 @@
+import os, sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from app.articles.search import InvertedIndex, highlight, tokenize
+
+def test_prefix_search_ranks_and_requires_all_terms():
+    index = InvertedIndex()
+    index.add(1, "Економіка України", "Бюджет і економіка на наступний рік")
+    index.add(2, "Спорт", "Футбольний матч завершився внічию")
+    index.add(3, "Економічні новини", "Футбол та економіка")
+    assert sorted(hit[0] for hit in index.search(tokenize("економ"), limit=10)) == [1, 3]
+    assert [hit[0] for hit in index.search(tokenize("футбол економ"), limit=10)] == [3]
+    index.remove(3)
+    assert index.search(tokenize("футбол економ"), limit=10) == []
+    index.add(2, "Спорт", "Перенесено")
+    assert index.search(tokenize("футб"), limit=10) == []
+
+def test_highlight_marks_prefix_matches():
+    snippet = highlight("Уряд ухвалив бюджет на рік", tokenize("бюдж"))
+    assert "<mark>бюджет</mark>" in snippet
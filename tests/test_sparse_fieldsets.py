@@ -0,0 +1,18 @@
+import re
+
+import pytest
+
+@pytest.fixture(scope="module", autouse=True)
+def articles(query_db):
+    query_db.seed_articles(10)
+
+def test_sparse_fieldsets_project_columns_in_sql(query_db, client):
+    with query_db.count_queries() as statements:
+        resp = client.get("/api/v1/articles/?limit=5&view=summary")
+    assert resp.status_code == 200
+    assert "content" not in resp.json()[0] and "tag_ids" in resp.json()[0]
+    assert not re.search(r"articles\.content\b", statements[0]), statements[0]
+    assert resp.headers.get("X-Next-Cursor")
+    resp = client.get("/api/v1/articles/1?fields=title")
+    assert set(resp.json()) == {"id", "title"}
+    assert client.get("/api/v1/articles/?fields=title,nope").status_code == 400
@@ -0,0 +1,152 @@
+import os, sys, tempfile
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+import app.articles.models  # noqa: F401 — зв'язки моделей довідників
+from app.db.database import Base
+from app.core.pagination import encode_cursor
+from app.tags.models import Tag
+from app.taxonomy.cache import TaxonomyCache
+
+engine = create_engine(f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'taxonomy.db')}")
+SessionLocal = sessionmaker(bind=engine)
+
+def setup_module(module):
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as session:
+        session.execute(Tag.__table__.insert(), [{"tag_id": i, "name": f"tag-{i}"} for i in range(1, 6)])
+        session.commit()
+
+def test_lookups_and_pages_come_from_the_snapshot():
+    cache = TaxonomyCache(session_factory=SessionLocal)
+    with SessionLocal() as session:
+        assert [tag.tag_id for tag in cache.page(session, "tags", skip=1, limit=2)] == [2, 3]
+        assert [tag.tag_id for tag in cache.page(session, "tags", limit=2, cursor=encode_cursor(3))] == [4, 5]
+        assert cache.exists(session, "tags", [1, 5]) and not cache.exists(session, "tags", [1, 99])
+    assert cache.get("tags", 2).name == "tag-2"
+    assert cache.get_by_name("tags", "tag-4").tag_id == 4
+
+def test_version_stamp_reloads_other_workers():
+    writer, reader = TaxonomyCache(session_factory=SessionLocal), TaxonomyCache(session_factory=SessionLocal)
+    assert writer.refresh() == 3 and reader.refresh() == 3
+    assert reader.refresh() == 0
+    with SessionLocal() as session:
+        session.execute(Tag.__table__.update().where(Tag.tag_id == 1).values(name="renamed"))
+        writer.bump(session, "tags")
+        session.commit()
+        writer.reload(session, "tags")
+    assert writer.get("tags", 1).name == "renamed"
+    assert reader.get("tags", 1).name == "tag-1"
+    assert reader.refresh() == 1
+    assert reader.get_by_name("tags", "renamed").tag_id == 1
+
+def test_version_stamp_commits_with_the_write(monkeypatch):
+    from fastapi import HTTPException
+    from app.tags import crud as tags_crud
+    from app.tags.schemas import TagUpdate
+    from app.taxonomy.models import TaxonomyVersion
+    writer, reader = TaxonomyCache(session_factory=SessionLocal), TaxonomyCache(session_factory=SessionLocal)
+    monkeypatch.setattr(tags_crud, "taxonomy_cache", writer)
+    writer.refresh(), reader.refresh()
+    with SessionLocal() as session:
+        tags_crud.update_tag(session, tags_crud.get_tag(session, 2), TagUpdate(name="second"))
+    assert writer.get("tags", 2).name == "second"
+    assert reader.refresh() == 1 and reader.get("tags", 2).name == "second"
+
+    # Штамп не вдалося записати — зміна довідника відкочується разом із ним, а не губиться для інших воркерів
+    TaxonomyVersion.__table__.drop(engine)
+    try:
+        with SessionLocal() as session, pytest.raises(HTTPException) as exc:
+            tags_crud.update_tag(session, tags_crud.get_tag(session, 2), TagUpdate(name="lost"))
+        assert exc.value.status_code == 500
+        with SessionLocal() as session:
+            assert tags_crud.get_tag(session, 2).name == "second"
+    finally:
+        TaxonomyVersion.__table__.create(engine)
+
+@pytest.fixture(scope="module")
+def seeded_db(query_db):
+    query_db.seed_articles(1)
+    return query_db
+
+def test_article_writes_check_taxonomy_from_cache(seeded_db):
+    query_db = seeded_db
+    from fastapi import HTTPException
+    from app.articles import crud as articles_crud
+    from app.articles.models import Article
+    from app.articles.schemas import ArticleUpdate
+    from app.categories import crud as categories_crud
+    from app.categories.models import Category
+    from app.categories.schemas import CategoryUpdate
+    from app.taxonomy.cache import taxonomy_cache
+    session = query_db.Session()
+    taxonomy_cache.load(session)
+    article = session.get(Article, 1)
+    with query_db.count_queries(query_db.engine) as statements:
+        articles_crud.update_article(session, article, ArticleUpdate(category_id=1, tag_ids=[2, 3]))
+    taxonomy_selects = [statement for statement in statements
+                        if statement.lstrip().upper().startswith("SELECT") and ("categories" in statement or "tags" in statement)]
+    assert taxonomy_selects == []
+    assert sorted(article.tag_ids) == [2, 3]
+
+    # Категорію створено в обхід кешу (інший воркер): промах перевіряється в БД
+    session.execute(Category.__table__.insert().values(id=2, name="Sport", created_by=1))
+    session.commit()
+    assert articles_crud.update_article(session, article, ArticleUpdate(category_id=2)).category_id == 2
+    categories_crud.update_category(session, categories_crud.get_category(session, 2), CategoryUpdate(name="Sports"))
+    assert taxonomy_cache.get_by_name("categories", "Sports").id == 2
+    try:
+        articles_crud.update_article(session, article, ArticleUpdate(category_id=99))
+        assert False, "очікувалась помилка"
+    except HTTPException as exc:
+        assert exc.status_code == 400
+    session.close()
+
+def test_stale_taxonomy_cache_rejects_deleted_category_with_400(seeded_db):
+    from fastapi import HTTPException
+    from app.articles import crud as articles_crud
+    from app.articles.models import Article
+    from app.articles.schemas import ArticleCreate, ArticleUpdate
+    from app.categories.models import Category
+    from app.tags.models import Tag
+    from app.taxonomy.cache import taxonomy_cache
+
+    def enable_foreign_keys(dbapi_connection, connection_record):
+        dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+    event.listen(seeded_db.engine, "connect", enable_foreign_keys)
+    seeded_db.engine.dispose()
+    session = seeded_db.Session()
+    try:
+        session.execute(Category.__table__.insert().values(id=3, name="Stale", created_by=1))
+        session.execute(Tag.__table__.insert().values(tag_id=50, name="stale-tag"))
+        session.commit()
+        taxonomy_cache.load(session)
+        # Записи видалено в іншому воркері: кеш ще вважає їх наявними, перевіряє FK
+        session.execute(Category.__table__.delete().where(Category.id == 3))
+        session.execute(Tag.__table__.delete().where(Tag.tag_id == 50))
+        session.commit()
+        assert taxonomy_cache.get("categories", 3) is not None
+
+        article_in = ArticleCreate(title="Stale", content="Content", author_id=1, category_id=3, content_type_id=1)
+        with pytest.raises(HTTPException) as exc:
+            articles_crud.create_article(session, article_in)
+        assert (exc.value.status_code, exc.value.detail) == (400, "Категорія не знайдена")
+        assert taxonomy_cache.get("categories", 3) is None
+
+        session.execute(Tag.__table__.insert().values(tag_id=50, name="stale-tag"))
+        session.commit()
+        taxonomy_cache.load(session)
+        session.execute(Tag.__table__.delete().where(Tag.tag_id == 50))
+        session.commit()
+        with pytest.raises(HTTPException) as exc:
+            articles_crud.update_article(session, session.get(Article, 1), ArticleUpdate(tag_ids=[1, 50]))
+        assert (exc.value.status_code, exc.value.detail) == (400, "Один або кілька тегів не знайдено")
+    finally:
+        session.close()
+        event.remove(seeded_db.engine, "connect", enable_foreign_keys)
+        seeded_db.engine.dispose()
@@ -0,0 +1,31 @@
+import os, sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from app.articles.trending import TrendingTracker
+
+def test_top_n_overall_and_per_category():
+    tracker = TrendingTracker(half_life=3600, top_n=2, refresh_interval=60)
+    for _ in range(3):
+        tracker.record(1, category_id=10)
+    tracker.record(2, category_id=20)
+    for _ in range(2):
+        tracker.record(3, category_id=10)
+    assert tracker.top() == []
+    tracker.refresh()
+    assert [aid for aid, _ in tracker.top()] == [1, 3]
+    assert [aid for aid, _ in tracker.top(20)] == [2]
+    assert [aid for aid, _ in tracker.top(10, limit=1)] == [1]
+    tracker.forget(1)
+    tracker.refresh()
+    assert [aid for aid, _ in tracker.top(10)] == [3]
+
+def test_recent_views_outweigh_old_ones():
+    tracker = TrendingTracker(half_life=3600, top_n=5, refresh_interval=60)
+    for _ in range(3):
+        tracker.record(1)
+    # Перегляди статті 1 "старіють" на два періоди напіврозпаду
+    tracker._values[1] /= 4
+    tracker.record(2)
+    tracker.record(2)
+    tracker.refresh()
+    assert [aid for aid, _ in tracker.top()] == [2, 1]
@@ -0,0 +1,32 @@
+import os, sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from app.articles.views import InMemoryViewCountStore, ViewCountStore, ViewCounter
+
+def test_store_merges_views_per_article():
+    store = InMemoryViewCountStore()
+    store.add(1)
+    store.add(1)
+    assert store.add(2, 3) == 5
+    assert store.drain() == {1: 2, 2: 3}
+    assert store.pending() == 0
+    assert store.drain() == {}
+
+def test_record_wakes_flusher_when_buffer_is_full():
+    counter = ViewCounter(flush_interval=60, flush_size=3)
+    counter.record(1)
+    counter.record(1)
+    assert not counter._wakeup.is_set()
+    counter.record(2)
+    assert counter._wakeup.is_set()
+    assert counter.store.pending() == 3
+
+def test_incomplete_store_fails_on_creation():
+    class AddOnlyStore(ViewCountStore):
+        def add(self, article_id, n=1):
+            return n
+
+    with pytest.raises(TypeError):
+        AddOnlyStore()